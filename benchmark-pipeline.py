@@ -0,0 +1,578 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文档流水线基准测试脚本
+
+生成 N 个合成的资源文档（website/docs/r/*.html.markdown），依次运行:
+  1. generate-alibabacloudstack-modules.py --mode batch（全量生成和清单命中两轮）
+  2. generate-docs.py（首次生成、缓存命中、--batch 批量模式三轮）
+  3. generate-main-readme.py
+并记录每个阶段的耗时。terraform-docs 使用写入临时目录的桩程序，无需联网或安装。
+另外用病态文档（未闭合的括号和反引号、大段空白续行）测量 DocumentParser 的解析耗时，
+用于确认解析时间随文档长度线性增长；并测量 ModuleGenerator 按参数数量渲染模块文件的耗时，
+用于确认单个参数的渲染成本为常数。
+
+用法:
+  python3 benchmark-pipeline.py
+  python3 benchmark-pipeline.py --sizes 10 100 --output build/benchmark.json
+  python3 benchmark-pipeline.py --sizes 10 --parser-sizes 1000 2000 4000 8000 16000
+  python3 benchmark-pipeline.py --sizes --parser-sizes --render-sizes 10 100 1000 10000
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import importlib.util
+import platform
+import subprocess
+import tempfile
+
+
+class Colors:
+    """终端颜色类"""
+    HEADER = '\033[95m'
+    OKBLUE = '\033[94m'
+    OKCYAN = '\033[96m'
+    OKGREEN = '\033[92m'
+    WARNING = '\033[93m'
+    FAIL = '\033[91m'
+    ENDC = '\033[0m'
+    BOLD = '\033[1m'
+
+
+# 结果文件格式版本，结构变化时递增
+RESULT_VERSION = 2
+
+# 默认的规模（模块数）
+DEFAULT_SIZES = [10, 100, 1000, 5000]
+
+# 解析器基准的默认规模（病态文档中的列表项数）
+DEFAULT_PARSER_SIZES = [1000, 2000, 4000, 8000]
+
+# 渲染基准的默认规模（单个资源的参数数）
+DEFAULT_RENDER_SIZES = [10, 100, 1000, 10000]
+
+# 渲染基准中每个规模至少渲染的参数总数，保证小规模的计时足够稳定
+RENDER_MIN_ARGUMENTS = 100000
+
+# 每个服务下的资源数，用于把合成资源分组到 <service>/<service>_<resource>
+RESOURCES_PER_SERVICE = 25
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# terraform-docs 桩程序：支持 --version、json PATH 与 --config CONFIG [--output-file F] PATH，
+# 配置中开启 recursive 时为 PATH 下的每个子模块生成文档
+STUB_TERRAFORM_DOCS = '''#!{python}
+import glob
+import json
+import os
+import re
+import sys
+import time
+
+args = sys.argv[1:]
+if args[:1] == ['--version']:
+    print('terraform-docs version v0.16.0 benchmark-stub')
+    sys.exit(0)
+
+delay = float(os.environ.get('BENCH_STUB_DELAY', '0'))
+if delay:
+    time.sleep(delay)
+
+def read_module(path):
+    text = ''
+    for tf_file in sorted(glob.glob(os.path.join(path, '*.tf'))):
+        with open(tf_file, encoding='utf-8') as f:
+            text += f.read()
+    return (text, re.findall(r'^variable "([^"]+)"', text, re.M),
+            re.findall(r'^output "([^"]+)"', text, re.M),
+            re.findall(r'^(?:resource|data) "([^"]+)"', text, re.M))
+
+
+def write_readme(path, output_file):
+    text, inputs, outputs, _ = read_module(path)
+    if not text:
+        return
+    lines = ['<!-- BEGIN_TF_DOCS -->', '## ⚙️ Requirements', '', '## Requirements', '',
+             '| Name | Version |', '|------|---------|', '| terraform | >= 0.13 |', '',
+             '## 📥 Inputs', '', '## Inputs', '', '| Name | Description |', '|------|-------------|']
+    lines += ['| ' + name + ' | n/a |' for name in inputs]
+    lines += ['', '## 📤 Outputs', '', '## Outputs', '', '| Name | Description |', '|------|-------------|']
+    lines += ['| ' + name + ' | n/a |' for name in outputs]
+    lines += ['<!-- END_TF_DOCS -->', '']
+    with open(os.path.join(path, output_file), 'w', encoding='utf-8') as f:
+        f.write('\\n'.join(lines))
+
+
+path = args[-1]
+if args[:1] == ['json']:
+    _, inputs, outputs, resources = read_module(path)
+    print(json.dumps({{
+        'header': '', 'footer': '',
+        'inputs': [{{'name': name}} for name in inputs],
+        'outputs': [{{'name': name}} for name in outputs],
+        'resources': [{{'type': name}} for name in resources],
+        'providers': [{{'name': 'alibabacloudstack'}}],
+        'requirements': [{{'name': 'terraform', 'version': '>= 0.13'}}],
+        'modules': []
+    }}))
+    sys.exit(0)
+
+output_file = 'README.md'
+if '--output-file' in args:
+    output_file = args[args.index('--output-file') + 1]
+
+with open(args[args.index('--config') + 1], encoding='utf-8') as f:
+    recursive = re.search(r'^recursive:\\n\\s+enabled: true', f.read(), re.M)
+if recursive:
+    for name in sorted(os.listdir(path)):
+        if os.path.isdir(os.path.join(path, name)):
+            write_readme(os.path.join(path, name), output_file)
+else:
+    write_readme(path, output_file)
+'''
+
+ARGUMENT_TEMPLATES = [
+    ("name", "Required, ForceNew", "The name of the {resource}. It must be 2 to 128 characters in length."),
+    ("description", "Optional", "The description of the {resource}. Default to `managed by terraform`."),
+    ("vpc_id", "Required, ForceNew", "The ID of the VPC that the {resource} belongs to."),
+    ("instance_count", "Optional", "The number of instances. Default is `1`."),
+    ("enabled", "Optional", "Whether to enable the {resource}. Default to true."),
+    ("security_group_ids", "Optional", "A list of security group IDs."),
+    ("tags", "Optional", "A mapping of tags to assign to the {resource}."),
+    ("port", "Optional", "The port number of the {resource}. Valid values: 1 to 65535."),
+    ("zone_id", "Optional, ForceNew", "The zone where the {resource} is located.\n  If not set, a random zone is used."),
+    ("period", "Optional", "The duration that you will buy the {resource}, in month. Default to `1`."),
+]
+
+ATTRIBUTE_TEMPLATES = [
+    ("id", "The ID of the {resource}."),
+    ("status", "The status of the {resource}."),
+    ("create_time", "The time when the {resource} was created."),
+    ("connection_string", "The connection string of the\n  {resource}."),
+]
+
+
+def synthetic_doc(service, resource, rng):
+    """生成一份与 DocumentParser 期望格式一致的资源文档"""
+    full_name = f"alibabacloudstack_{service}_{resource}"
+    arguments = ARGUMENT_TEMPLATES[:2] + rng.sample(ARGUMENT_TEMPLATES[2:], rng.randint(2, len(ARGUMENT_TEMPLATES) - 2))
+    attributes = ATTRIBUTE_TEMPLATES[:1] + rng.sample(ATTRIBUTE_TEMPLATES[1:], rng.randint(1, len(ATTRIBUTE_TEMPLATES) - 1))
+
+    lines = [
+        "---",
+        f'subcategory: "{service.upper()}"',
+        'layout: "alibabacloudstack"',
+        f'page_title: "Alibabacloudstack: {full_name}"',
+        "description: |-",
+        f"  Provides a {service} {resource} resource.",
+        "---",
+        "",
+        f"# {full_name}",
+        "",
+        f"Provides a {service} {resource} resource.",
+        "",
+        "## Example Usage",
+        "",
+        "```hcl",
+        f'resource "{full_name}" "default" {{',
+        f'  name = "tf-testacc-{resource}"',
+        "}",
+        "```",
+        "",
+        "## Argument Reference",
+        "",
+        "The following arguments are supported:",
+        "",
+    ]
+    lines += [f"* `{name}` - ({flags}) {text.format(resource=resource)}" for name, flags, text in arguments]
+    lines += [
+        "",
+        "## Attributes Reference",
+        "",
+        "The following attributes are exported:",
+        "",
+    ]
+    lines += [f"* `{name}` - {text.format(resource=resource)}" for name, text in attributes]
+    lines += [
+        "",
+        "## Import",
+        "",
+        f"The {resource} can be imported using the id, e.g.",
+        "",
+        "```bash",
+        f"$ terraform import {full_name}.example abc123456",
+        "```",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def pathological_doc(items):
+    """生成一份病态资源文档
+
+    参数列表先是一个带大段空白续行的参数，随后是大量括号未闭合的参数，属性列表中混有未闭合的反引号。
+    回溯型的正则在这类输入上会对每个列表项扫描到小节末尾，耗时退化为平方级
+    """
+    lines = [
+        "---",
+        'subcategory: "PATHOLOGICAL"',
+        'page_title: "Alibabacloudstack: alibabacloudstack_pathological_resource"',
+        "description: |-",
+        "  Provides a pathological resource.",
+        "---",
+        "",
+        "# alibabacloudstack_pathological_resource",
+        "",
+        "## Argument Reference",
+        "",
+        "* `name` - (Required) The name of the resource.",
+    ]
+    lines += ["    "] * items
+    lines += [f"* `arg_{index}` - (Optional The value {index} is never closed" for index in range(items)]
+    lines += ["", "## Attributes Reference", "", "* `id` - The ID of the resource."]
+    lines += [f"* `attr_{index} - Missing the closing backtick" for index in range(items)]
+    return "\n".join(lines) + "\n"
+
+
+def synthetic_resource_data(arguments):
+    """生成带 arguments 个参数的解析结果，参数类型和必需性轮流变化"""
+    types = ["string", "number", "bool", "list(string)", "map(string)", "any"]
+    return {
+        "resource_info": {"resource_name": "alibabacloudstack_bench_resource"},
+        "arguments": [{
+            "name": f"arg_{index}",
+            "description": f"The value {index} of the resource.",
+            "required": index % 2 == 0,
+            "type": types[index % len(types)],
+            "default": None if index % 3 else f'"default-{index}"'
+        } for index in range(arguments)],
+        "attributes": [{"name": f"attr_{index}", "description": f"The attribute {index}."}
+                       for index in range(max(1, arguments // 4))],
+        "examples": []
+    }
+
+
+def load_modules_script():
+    """加载 generate-alibabacloudstack-modules.py（文件名含连字符，不能直接 import）"""
+    path = os.path.join(REPO_DIR, "generate-alibabacloudstack-modules.py")
+    spec = importlib.util.spec_from_file_location("generate_alibabacloudstack_modules", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class PipelineBenchmark:
+    """流水线基准测试"""
+
+    def __init__(self, sizes, output_file, work_dir=None, keep=False, seed=0, stub_delay=0.0,
+                 jobs=None, engine="terraform-docs", parser_sizes=None, render_sizes=None):
+        self.sizes = sizes
+        self.output_file = output_file
+        self.work_dir = work_dir
+        self.keep = keep
+        self.seed = seed
+        self.stub_delay = stub_delay
+        self.jobs = jobs
+        self.engine = engine
+        self.parser_sizes = parser_sizes or []
+        self.render_sizes = render_sizes or []
+        self.results = []
+        self.parser_results = []
+        self.render_results = []
+
+    def print_colored(self, message, color=Colors.ENDC):
+        """打印彩色消息"""
+        print(f"{color}{message}{Colors.ENDC}")
+
+    def print_emoji(self, emoji, message, color=Colors.ENDC):
+        """打印带表情符号的消息"""
+        print(f"{color}{emoji} {message}{Colors.ENDC}")
+
+    def build_corpus(self, run_dir, size):
+        """在 run_dir/website/docs/r 下生成 size 个合成资源文档"""
+        docs_dir = os.path.join(run_dir, "website", "docs", "r")
+        os.makedirs(docs_dir, exist_ok=True)
+        rng = random.Random(self.seed)
+
+        for index in range(size):
+            service = f"svc{index // RESOURCES_PER_SERVICE:03d}"
+            resource = f"res{index:05d}"
+            doc_path = os.path.join(docs_dir, f"{service}_{resource}.html.markdown")
+            with open(doc_path, "w", encoding="utf-8") as f:
+                f.write(synthetic_doc(service, resource, rng))
+        return docs_dir
+
+    def install_stub(self, bin_dir):
+        """写入 terraform-docs 桩程序"""
+        os.makedirs(bin_dir, exist_ok=True)
+        stub_path = os.path.join(bin_dir, "terraform-docs")
+        with open(stub_path, "w", encoding="utf-8") as f:
+            f.write(STUB_TERRAFORM_DOCS.format(python=sys.executable))
+        os.chmod(stub_path, 0o755)
+        return stub_path
+
+    def stages(self):
+        """(阶段名, 命令) 列表，命令在每个规模的运行目录中执行"""
+        docs_command = [sys.executable, os.path.join(REPO_DIR, "generate-docs.py"),
+                        "--config", os.path.join(REPO_DIR, "config", "english-docs.yml"),
+                        "--modules-dir", "modules/alibabacloudstack", "--engine", self.engine]
+        modules_command = [sys.executable, os.path.join(REPO_DIR, "generate-alibabacloudstack-modules.py"),
+                           "--mode", "batch", "--input-dir", "website/docs/r", "--force"]
+        if self.jobs:
+            docs_command += ["--jobs", str(self.jobs)]
+            modules_command += ["--jobs", str(self.jobs)]
+
+        stages = [
+            ("generate-modules", modules_command),
+            # 清单命中：文档没有变化，不重新生成
+            ("generate-modules-cached", [arg for arg in modules_command if arg != "--force"]),
+            ("generate-docs", docs_command + ["--report", "json", "reports/generate-docs.json"]),
+            ("generate-docs-cached", docs_command + ["--report", "json", "reports/generate-docs-cached.json"]),
+            ("generate-docs-batch", docs_command + ["--no-cache", "--batch",
+                                                    "--report", "json", "reports/generate-docs-batch.json"]),
+            ("generate-main-readme", [sys.executable, os.path.join(REPO_DIR, "generate-main-readme.py"),
+                                      "--modules-dir", "modules/alibabacloudstack", "--output", "README.md"]),
+        ]
+        # --batch 只适用于 terraform-docs 引擎
+        if self.engine != "terraform-docs":
+            stages = [stage for stage in stages if stage[0] != "generate-docs-batch"]
+        return stages
+
+    def run_stage(self, name, command, run_dir, env):
+        """运行一个阶段，输出写入 logs/<stage>.log，返回耗时记录"""
+        log_path = os.path.join(run_dir, "logs", f"{name}.log")
+        started = time.perf_counter()
+        with open(log_path, "w", encoding="utf-8") as log:
+            result = subprocess.run(command, cwd=run_dir, env=env, stdout=log, stderr=subprocess.STDOUT)
+        seconds = time.perf_counter() - started
+
+        record = {"seconds": round(seconds, 4), "returncode": result.returncode}
+
+        # generate-docs 自带的耗时报告（阶段合计与单模块延迟）一并收录
+        report_path = os.path.join(run_dir, "reports", f"{name}.json")
+        if os.path.isfile(report_path):
+            with open(report_path, "r", encoding="utf-8") as f:
+                report = json.load(f)
+            record["phases"] = report.get("phases")
+            record["latency"] = report.get("latency")
+        return record
+
+    def run_size(self, base_dir, size):
+        """在独立目录中按一个规模运行整条流水线"""
+        run_dir = os.path.join(base_dir, f"modules-{size}")
+        if os.path.exists(run_dir):
+            shutil.rmtree(run_dir)
+        os.makedirs(os.path.join(run_dir, "logs"))
+        os.makedirs(os.path.join(run_dir, "reports"))
+
+        started = time.perf_counter()
+        self.build_corpus(run_dir, size)
+        corpus_seconds = time.perf_counter() - started
+
+        env = dict(os.environ)
+        env["PATH"] = os.path.join(base_dir, "bin") + os.pathsep + env.get("PATH", "")
+        env["BENCH_STUB_DELAY"] = str(self.stub_delay)
+
+        result = {"modules": size, "corpus_seconds": round(corpus_seconds, 4), "stages": {}}
+        for name, command in self.stages():
+            record = self.run_stage(name, command, run_dir, env)
+            result["stages"][name] = record
+
+            color = Colors.OKGREEN if record["returncode"] == 0 else Colors.FAIL
+            self.print_emoji("⏱️", f"{size:>5} 个模块 | {name:<22} {record['seconds']:>9.3f}s "
+                             f"(退出码 {record['returncode']})", color)
+        return result
+
+    def run_parser_benchmark(self, base_dir):
+        """用病态文档测量 DocumentParser 的解析耗时"""
+        import logging
+
+        document_parser = load_modules_script().DocumentParser
+        docs_dir = os.path.join(base_dir, "pathological")
+        os.makedirs(docs_dir, exist_ok=True)
+
+        # 解析日志与基准无关
+        logging.disable(logging.CRITICAL)
+        try:
+            for items in self.parser_sizes:
+                doc_path = os.path.join(docs_dir, f"pathological_{items}.html.markdown")
+                with open(doc_path, "w", encoding="utf-8") as f:
+                    f.write(pathological_doc(items))
+
+                started = time.perf_counter()
+                parsed = document_parser().parse_resource_doc(doc_path)
+                seconds = time.perf_counter() - started
+
+                self.parser_results.append({
+                    "items": items,
+                    "bytes": os.path.getsize(doc_path),
+                    "seconds": round(seconds, 4),
+                    "us_per_item": round(seconds / items * 1e6, 2),
+                    "arguments": len(parsed["arguments"]),
+                    "attributes": len(parsed["attributes"])
+                })
+                self.print_emoji("⏱️", f"{items:>6} 个列表项 | parse-pathological     {seconds:>9.3f}s "
+                                 f"({seconds / items * 1e6:.2f}µs/项)", Colors.OKGREEN)
+        finally:
+            logging.disable(logging.NOTSET)
+
+    def run_render_benchmark(self):
+        """测量 ModuleGenerator 渲染模块和示例文件（不写盘）的耗时"""
+        from pathlib import Path
+
+        generator = load_modules_script().ModuleGenerator()
+        for arguments in self.render_sizes:
+            resource_data = synthetic_resource_data(arguments)
+            repeat = max(1, RENDER_MIN_ARGUMENTS // arguments)
+
+            started = time.perf_counter()
+            for _ in range(repeat):
+                files = generator.render_module_files(Path("module"), Path("example"), "bench", "resource",
+                                                      resource_data)
+            seconds = (time.perf_counter() - started) / repeat
+
+            self.render_results.append({
+                "arguments": arguments,
+                "repeat": repeat,
+                "seconds": round(seconds, 6),
+                "us_per_argument": round(seconds / arguments * 1e6, 3),
+                "bytes": sum(len(content) for content in files.values())
+            })
+            self.print_emoji("⏱️", f"{arguments:>6} 个参数   | render-module          {seconds:>9.4f}s "
+                             f"({seconds / arguments * 1e6:.2f}µs/参数)", Colors.OKGREEN)
+
+    def git_revision(self):
+        """当前代码的提交号，便于对比不同版本的结果"""
+        try:
+            result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+                                    capture_output=True, text=True)
+            if result.returncode == 0:
+                return result.stdout.strip()
+        except OSError:
+            pass
+        return None
+
+    def write_results(self):
+        """写出 JSON 结果"""
+        data = {
+            "version": RESULT_VERSION,
+            "revision": self.git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "engine": self.engine,
+            "jobs": self.jobs,
+            "stub_delay": self.stub_delay,
+            "seed": self.seed,
+            "results": self.results,
+            "parser": self.parser_results,
+            "render": self.render_results
+        }
+
+        output_dir = os.path.dirname(self.output_file)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with open(self.output_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        self.print_emoji("📄", f"基准测试结果已写入 {self.output_file}", Colors.OKGREEN)
+
+    def run(self):
+        """主执行函数"""
+        base_dir = self.work_dir or tempfile.mkdtemp(prefix="terraform-documentor-bench-")
+        os.makedirs(base_dir, exist_ok=True)
+        self.install_stub(os.path.join(base_dir, "bin"))
+
+        self.print_emoji("🚀", f"开始基准测试，规模: {', '.join(str(size) for size in self.sizes)}", Colors.HEADER)
+        self.print_emoji("📂", f"工作目录: {base_dir}", Colors.OKCYAN)
+
+        failed = False
+        try:
+            for size in self.sizes:
+                result = self.run_size(base_dir, size)
+                self.results.append(result)
+                failed = failed or any(stage["returncode"] != 0 for stage in result["stages"].values())
+            if self.parser_sizes:
+                self.run_parser_benchmark(base_dir)
+            if self.render_sizes:
+                self.run_render_benchmark()
+        finally:
+            if self.results or self.parser_results or self.render_results:
+                self.write_results()
+            if not self.keep and not self.work_dir:
+                shutil.rmtree(base_dir, ignore_errors=True)
+
+        if failed:
+            self.print_emoji("⚠️", "部分阶段执行失败，请查看工作目录中的 logs（使用 --keep 保留）", Colors.WARNING)
+            return False
+        self.print_emoji("🎉", "基准测试完成！", Colors.OKGREEN)
+        return True
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(
+        description="文档流水线基准测试（合成资源文档 + terraform-docs 桩程序）",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+示例:
+  python3 benchmark-pipeline.py                               # 10/100/1000/5000 个模块
+  python3 benchmark-pipeline.py --sizes 10 100                # 指定规模
+  python3 benchmark-pipeline.py --output build/bench.json     # 指定结果文件
+  python3 benchmark-pipeline.py --stub-delay 0.05             # 模拟 terraform-docs 每次调用耗时
+        """
+    )
+
+    parser.add_argument('--sizes', nargs='*', type=int, default=DEFAULT_SIZES,
+                        help=f'要测试的模块数 (默认: {" ".join(str(size) for size in DEFAULT_SIZES)})')
+    parser.add_argument('--output', default='benchmark-results.json',
+                        help='结果文件路径 (默认: benchmark-results.json)')
+    parser.add_argument('--work-dir',
+                        help='运行目录 (默认: 临时目录，运行结束后删除)')
+    parser.add_argument('--keep', action='store_true',
+                        help='保留临时运行目录，便于查看生成结果和日志')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='合成文档的随机种子 (默认: 0)')
+    parser.add_argument('--stub-delay', type=float, default=0.0,
+                        help='terraform-docs 桩程序每次调用的额外耗时（秒，默认: 0）')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='传给 generate-docs.py 和 generate-alibabacloudstack-modules.py 的并行数 (默认: 由各脚本决定)')
+    parser.add_argument('--engine', choices=['terraform-docs', 'native'], default='terraform-docs',
+                        help='generate-docs.py 使用的文档生成引擎 (默认: terraform-docs 桩程序)')
+
+    parser.add_argument('--parser-sizes', nargs='*', type=int, default=DEFAULT_PARSER_SIZES,
+                        help=f'病态文档解析基准的列表项数，不带参数时跳过 '
+                             f'(默认: {" ".join(str(size) for size in DEFAULT_PARSER_SIZES)})')
+
+    parser.add_argument('--render-sizes', nargs='*', type=int, default=DEFAULT_RENDER_SIZES,
+                        help=f'模块文件渲染基准的参数数，不带参数时跳过 '
+                             f'(默认: {" ".join(str(size) for size in DEFAULT_RENDER_SIZES)})')
+
+    args = parser.parse_args()
+
+    if any(size < 1 for size in args.sizes + args.parser_sizes + args.render_sizes):
+        parser.error('--sizes、--parser-sizes 和 --render-sizes 必须大于等于 1')
+
+    benchmark = PipelineBenchmark(
+        sizes=args.sizes,
+        output_file=args.output,
+        work_dir=args.work_dir,
+        keep=args.keep,
+        seed=args.seed,
+        stub_delay=args.stub_delay,
+        jobs=args.jobs,
+        engine=args.engine,
+        parser_sizes=args.parser_sizes,
+        render_sizes=args.render_sizes
+    )
+
+    sys.exit(0 if benchmark.run() else 1)
+
+
+if __name__ == "__main__":
+    main()
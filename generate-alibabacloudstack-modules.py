@@ -5,25 +5,287 @@ Terraform模块自动生成工具
 
 用法:
   python generate-alibabacloudstack-modules.py --mode batch --input-dir website/docs/r/
+  python generate-alibabacloudstack-modules.py --mode batch --input-dir website/docs/r/ --jobs 8
   python generate-alibabacloudstack-modules.py --mode single --resource ecs_instance
 """
 
 import os
 import re
 import sys
+import json
+import mmap
+import fnmatch
+import difflib
+import hashlib
 import argparse
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from string import Formatter
 from typing import Dict, List, Tuple, Optional, Any
 
 # 配置日志
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-class DocumentParser:
-    """文档解析器"""
+# 生成器版本：模板或解析规则的变化会改变生成结果时递增，清单中版本不同的模块会被重新生成
+GENERATOR_VERSION = 1
+
+# 批量生成清单（位于模块输出目录下），记录每个文档的内容哈希和生成的文件
+MANIFEST_FILE = '.generated.json'
+MANIFEST_VERSION = 1
+
+# 解析器版本：解析结果的结构或规则变化时递增，旧版本的解析缓存随之失效，清单中版本不同的模块会被重新生成
+PARSER_VERSION = 3
+
+# 解析缓存目录（位于 --cache-dir 下）和默认容量
+PARSE_CACHE_DIR = 'parsed-docs'
+PARSE_CACHE_MAX_MB = 64
+
+# 预扫描 front matter 时，不小于该大小的文档使用 mmap 查找结束标记，避免读入正文
+PRESCAN_MMAP_BYTES = 256 * 1024
+# front matter 的最大长度，超过时视为没有 front matter
+PRESCAN_MAX_BYTES = 64 * 1024
+# front matter 开始标记，允许前面有 UTF-8 BOM 和空行
+FRONT_MATTER_START_RE = re.compile(rb'(?:\xef\xbb\xbf)?[ \t\r\n]*---')
+
+# 列表项格式：参数为 `name` - (flags) description，属性为 `name` - description
+ARGUMENT_ITEM_RE = re.compile(r'`([^`]+)` - \(([^)]+)\) (.+)', re.DOTALL)
+ATTRIBUTE_ITEM_RE = re.compile(r'`([^`]+)` - (.+)', re.DOTALL)
+
+
+class DocItem:
+    """文档中的一个列表项（以 * ` 开头的行及其续行）"""
+
+    def __init__(self, line: int, first_line: str):
+        self.line = line
+        self.lines = [first_line.lstrip()[2:]]
+
+    @property
+    def text(self) -> str:
+        """去掉列表符号后的完整文本"""
+        return '\n'.join(self.lines)
+
+
+class DocSection:
+    """文档中的一个标题小节，children 为下级标题小节"""
+
+    def __init__(self, level: int, title: str, line: int):
+        self.level = level
+        self.title = title
+        self.line = line
+        self.items: List[DocItem] = []
+        self.children: List['DocSection'] = []
+
+    def all_items(self) -> List[DocItem]:
+        """本小节及所有下级小节中的列表项（按文档顺序）"""
+        items = list(self.items)
+        for child in self.children:
+            items.extend(child.all_items())
+        return items
+
+
+class DocTokens:
+    """分词结果：front matter、标题小节树和代码块"""
 
     def __init__(self):
+        self.front_matter: Dict[str, str] = {}
+        self.sections: List[DocSection] = []
+        # 按文档顺序排列的所有小节（包括下级小节）
+        self.all_sections: List[DocSection] = []
+        # (起始行, 语言, 代码)
+        self.code_blocks: List[Tuple[int, str, str]] = []
+
+    def find_section(self, title: str) -> Optional[DocSection]:
+        """返回第一个标题为 title 的二级及以下小节"""
+        for section in self.all_sections:
+            if section.level >= 2 and section.title == title:
+                return section
+        return None
+
+
+class DocTokenizer:
+    """资源文档的单遍分词器
+
+    按行扫描一次文档，拆分出 front matter、标题小节树和列表项，整体耗时与文档长度成线性关系。
+    代码块中的行不会被识别为标题或列表项；列表项的续行一直延续到下一个列表项或下一个二级标题
+    """
+
+    @staticmethod
+    def _heading(line: str) -> Optional[Tuple[int, str]]:
+        """识别 Markdown 标题行，返回 (级别, 标题)"""
+        if not line.startswith('#'):
+            return None
+        level = len(line) - len(line.lstrip('#'))
+        if len(line) > level and line[level] != ' ':
+            return None
+        return level, line[level:].strip()
+
+    @staticmethod
+    def front_matter_start(lines: List[str]) -> Optional[int]:
+        """返回 front matter 开始标记 --- 所在的行，允许开头的 BOM 和空行；没有 front matter 时返回 None"""
+        for index, line in enumerate(lines):
+            stripped = line.lstrip('\ufeff').strip()
+            if stripped:
+                return index if stripped == '---' else None
+        return None
+
+    @classmethod
+    def parse_front_matter(cls, lines: List[str]) -> Tuple[Dict[str, str], int]:
+        """解析文档开头两行 --- 之间的 key: value，返回 (front matter, 正文起始行)"""
+        front_matter: Dict[str, str] = {}
+        start = cls.front_matter_start(lines)
+        if start is None:
+            return front_matter, 0
+
+        index = start + 1
+        key = None
+        while index < len(lines) and lines[index].strip() != '---':
+            line = lines[index]
+            if line[:1] not in (' ', '\t') and ':' in line:
+                key, value = line.split(':', 1)
+                key = key.strip()
+                value = value.strip()
+                # 多行块（| 或 >）的内容由后面的缩进行组成
+                front_matter[key] = '' if value[:1] in ('|', '>') else value
+            elif key is not None and line.strip():
+                block = front_matter[key]
+                front_matter[key] = f"{block}\n{line.strip()}" if block else line.strip()
+            index += 1
+        return front_matter, index + 1
+
+    def tokenize(self, content: str) -> DocTokens:
+        tokens = DocTokens()
+        lines = content.split('\n')
+        tokens.front_matter, index = self.parse_front_matter(lines)
+
+        stack: List[DocSection] = []
+        item = None
+        fence = None
+        fence_start = 0
+        fence_lines: List[str] = []
+
+        for line_number in range(index, len(lines)):
+            line = lines[line_number]
+
+            if fence is not None:
+                if line.startswith('```'):
+                    tokens.code_blocks.append((fence_start, fence, '\n'.join(fence_lines)))
+                    fence = None
+                else:
+                    fence_lines.append(line)
+                if item is not None:
+                    item.lines.append(line)
+                continue
+
+            if line.startswith('```'):
+                fence = line[3:].strip()
+                fence_start = line_number
+                fence_lines = []
+                if item is not None:
+                    item.lines.append(line)
+                continue
+
+            heading = self._heading(line)
+            if heading is not None:
+                level, title = heading
+                section = DocSection(level, title, line_number)
+                while stack and stack[-1].level >= level:
+                    stack.pop()
+                (stack[-1].children if stack else tokens.sections).append(section)
+                tokens.all_sections.append(section)
+                stack.append(section)
+                # 二级及以上标题结束当前列表项，下级标题作为列表项的续行
+                if level <= 2:
+                    item = None
+                elif item is not None:
+                    item.lines.append(line)
+                continue
+
+            if line.lstrip().startswith('* `'):
+                item = DocItem(line_number, line)
+                if stack:
+                    stack[-1].items.append(item)
+            elif item is not None:
+                item.lines.append(line)
+
+        return tokens
+
+
+class ParseCache:
+    """DocumentParser 解析结果的磁盘缓存
+
+    每个文档的解析结果保存为一个 JSON 文件，文件名为文档内容和 PARSER_VERSION 的 sha256，
+    命中时更新文件的修改时间；总大小超过上限时按修改时间从旧到新淘汰
+    """
+
+    def __init__(self, directory: str, max_bytes: int = PARSE_CACHE_MAX_MB * 1024 * 1024, read_only: bool = False):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        # 只读时不写入、不淘汰，也不更新命中条目的修改时间（用于 --dry-run）
+        self.read_only = read_only
+
+    @staticmethod
+    def key(content: bytes) -> str:
+        return hashlib.sha256(f"{PARSER_VERSION}\0".encode() + content).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """读取解析结果，不存在或损坏时返回 None"""
+        path = self.directory / f"{key}.json"
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not self.read_only:
+                os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return data
+
+    def put(self, key: str, data: Dict[str, Any]):
+        """原子写入解析结果，写入失败只记录警告"""
+        if self.read_only:
+            return
+        path = self.directory / f"{key}.json"
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"写入解析缓存失败: {e}")
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def evict(self) -> int:
+        """总大小超过上限时淘汰最久未使用的条目，返回淘汰数量"""
+        if self.read_only:
+            return 0
+        try:
+            entries = [(entry.stat().st_mtime, entry.stat().st_size, entry)
+                       for entry in self.directory.glob('*.json')]
+        except OSError:
+            return 0
+
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+        return evicted
+
+
+class DocumentParser:
+    """文档解析器，cache 不为 None 时复用内容相同的文档的解析结果"""
+
+    def __init__(self, cache: Optional[ParseCache] = None):
+        self.cache = cache
         self.variable_types = {
             'string': 'string',
             'number': 'number',
@@ -37,20 +299,41 @@ class DocumentParser:
         """解析资源文档"""
         logger.info(f"解析文档: {file_path}")
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+
+        # 内容和解析器版本都相同的文档直接使用缓存的解析结果
+        key = None
+        if self.cache is not None:
+            key = ParseCache.key(raw)
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.debug(f"使用解析缓存: {file_path}")
+                return cached
+
+        result = self._parse_content(raw.decode('utf-8'))
+        if key is not None:
+            self.cache.put(key, result)
+        return result
+
+    def _parse_content(self, content: str) -> Dict[str, Any]:
+        """解析文档内容"""
+        # 单遍分词，后续提取都基于分词结果
+        tokens = DocTokenizer().tokenize(content)
 
         # 提取资源基本信息
-        resource_info = self._extract_resource_info(content)
+        resource_info = self.extract_resource_info(tokens.front_matter)
+        if 'resource_name' not in resource_info:
+            raise ValueError("文档 front matter 中缺少有效的 page_title，无法确定资源名称")
 
         # 提取参数信息
-        arguments = self._extract_arguments(content)
+        arguments = self._extract_arguments(tokens)
 
         # 提取输出属性
-        attributes = self._extract_attributes(content)
+        attributes = self._extract_attributes(tokens)
 
         # 提取示例代码
-        examples = self._extract_examples(content)
+        examples = self._extract_examples(tokens)
 
         return {
             'resource_info': resource_info,
@@ -59,46 +342,44 @@ class DocumentParser:
             'examples': examples
         }
 
-    def _extract_resource_info(self, content: str) -> Dict[str, str]:
-        """提取资源基本信息"""
+    @staticmethod
+    def extract_resource_info(front_matter: Dict[str, str]) -> Dict[str, str]:
+        """从 front matter 提取资源基本信息（预扫描也使用）"""
         info = {}
 
-        # 提取资源名称
-        title_match = re.search(r'page_title:\s*"[^:]*:\s*([^"]+)"', content)
-        if title_match:
-            info['resource_name'] = title_match.group(1).strip()
+        # 提取资源名称（page_title 中第一个冒号之后的部分）
+        page_title = front_matter.get('page_title', '').strip('"')
+        if ':' in page_title and page_title.split(':', 1)[1].strip():
+            info['resource_name'] = page_title.split(':', 1)[1].strip()
 
         # 提取subcategory
-        subcategory_match = re.search(r'subcategory:\s*"([^"]+)"', content)
-        if subcategory_match:
-            info['subcategory'] = subcategory_match.group(1).strip()
+        subcategory = front_matter.get('subcategory', '').strip('"').strip()
+        if subcategory:
+            info['subcategory'] = subcategory
 
-        # 提取description
-        desc_match = re.search(r'description:\s*\|-?\s*\n\s*(.+)', content)
-        if desc_match:
-            info['description'] = desc_match.group(1).strip()
+        # 提取description（第一行，行内写法去掉引号）
+        description = front_matter.get('description', '').split('\n', 1)[0].strip('"').strip()
+        if description:
+            info['description'] = description
 
         return info
 
-    def _extract_arguments(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_arguments(self, tokens: DocTokens) -> List[Dict[str, Any]]:
         """提取参数信息"""
         arguments = []
 
         # 查找Argument Reference部分
-        arg_section_match = re.search(r'## Argument Reference\s*\n(.*?)(?=\n## |$)', content, re.DOTALL)
-        if not arg_section_match:
+        section = tokens.find_section('Argument Reference')
+        if section is None:
             logger.warning("未找到Argument Reference部分")
             return arguments
 
-        arg_content = arg_section_match.group(1)
-
         # 解析每个参数
-        param_pattern = r'\* `([^`]+)` - \(([^)]+)\) (.+?)(?=\n\s*\* `|$)'
-        param_matches = re.findall(param_pattern, arg_content, re.DOTALL)
-
-        for param_name, param_flags, param_desc in param_matches:
-            param_info = self._parse_parameter(param_name, param_flags, param_desc)
-            arguments.append(param_info)
+        for item in section.all_items():
+            match = ARGUMENT_ITEM_RE.match(item.text)
+            if match:
+                param_name, param_flags, param_desc = match.groups()
+                arguments.append(self._parse_parameter(param_name, param_flags, param_desc))
 
         return arguments
 
@@ -179,58 +460,199 @@ class DocumentParser:
 
         return None
 
-    def _extract_attributes(self, content: str) -> List[Dict[str, str]]:
+    def _extract_attributes(self, tokens: DocTokens) -> List[Dict[str, str]]:
         """提取输出属性"""
         attributes = []
 
         # 查找Attributes Reference部分
-        attr_section_match = re.search(r'## Attributes Reference\s*\n(.*?)(?=\n## |$)', content, re.DOTALL)
-        if not attr_section_match:
+        section = tokens.find_section('Attributes Reference')
+        if section is None:
             return attributes
 
-        attr_content = attr_section_match.group(1)
-
         # 解析每个属性
-        attr_pattern = r'\* `([^`]+)` - (.+?)(?=\n\s*\* `|$)'
-        attr_matches = re.findall(attr_pattern, attr_content, re.DOTALL)
-
-        for attr_name, attr_desc in attr_matches:
-            attributes.append({
-                'name': attr_name,
-                'description': attr_desc.strip().replace('\n', ' ')
-            })
+        for item in section.all_items():
+            match = ATTRIBUTE_ITEM_RE.match(item.text)
+            if match:
+                attr_name, attr_desc = match.groups()
+                attributes.append({
+                    'name': attr_name,
+                    'description': attr_desc.strip().replace('\n', ' ')
+                })
 
         return attributes
 
-    def _extract_examples(self, content: str) -> List[str]:
-        """提取示例代码"""
+    def _extract_examples(self, tokens: DocTokens) -> List[str]:
+        """提取示例代码：每个 Example Usage 标题之后的第一个 hcl 代码块"""
         examples = []
+        blocks = [block for block in tokens.code_blocks if block[1] == 'hcl']
+        block_index = 0
+
+        for section in tokens.all_sections:
+            if section.level < 2 or not section.title.startswith('Example Usage'):
+                continue
+            while block_index < len(blocks) and blocks[block_index][0] < section.line:
+                block_index += 1
+            if block_index == len(blocks):
+                break
+            examples.append(blocks[block_index][2].strip())
+            block_index += 1
 
-        # 查找Example Usage部分的代码块
-        example_pattern = r'## Example Usage.*?\n```hcl\n(.*?)\n```'
-        example_matches = re.findall(example_pattern, content, re.DOTALL)
+        return examples
 
-        for example in example_matches:
-            examples.append(example.strip())
 
-        return examples
+class HclTemplate:
+    """预编译的文本模板
+
+    模板字符串（str.format 语法，只支持简单字段）在构造时拆分为 (文本, 字段) 片段，
+    渲染时只把片段追加到列表缓冲区，最后统一 join，避免字符串反复拼接
+    """
+
+    def __init__(self, template: str):
+        self.parts: List[Tuple[str, Optional[str]]] = [
+            (literal, field) for literal, field, _, _ in Formatter().parse(template)]
+
+    def render_into(self, buffer: List[str], **values: str):
+        """把渲染结果追加到 buffer"""
+        for literal, field in self.parts:
+            if literal:
+                buffer.append(literal)
+            if field is not None:
+                buffer.append(values[field])
+
+    def render(self, **values: str) -> str:
+        buffer: List[str] = []
+        self.render_into(buffer, **values)
+        return ''.join(buffer)
+
+
+VARIABLE_TEMPLATE = HclTemplate(
+    'variable "{name}" {{\n'
+    '  type        = {type}\n'
+    '  description = "{description}"\n'
+    '{default}'
+    '}}\n\n')
+VARIABLE_DEFAULT_TEMPLATE = HclTemplate('  default     = {value}\n')
+OUTPUT_TEMPLATE = HclTemplate(
+    'output "{name}" {{\n'
+    '  description = "{description}"\n'
+    '  value       = {value}\n'
+    '}}\n\n')
+RESOURCE_ARGUMENT_TEMPLATE = HclTemplate(
+    '  # {description}\n'
+    '  {name} = var.{name}\n\n')
+RESOURCE_DYNAMIC_TEMPLATE = HclTemplate(
+    '  # {description}\n'
+    '  dynamic "{name}" {{\n'
+    '    for_each = var.{name}\n'
+    '    content {{\n'
+    '      # 根据实际需要配置嵌套属性\n'
+    '    }}\n'
+    '  }}\n\n')
+MODULE_ARGUMENT_TEMPLATE = HclTemplate('  {name} = var.{name}\n')
+TFVARS_TEMPLATE = HclTemplate('# {description}\n{name} = {value}\n\n')
+TFVARS_COMMENTED_TEMPLATE = HclTemplate('# {description}\n# {name} = {value}\n\n')
+EXAMPLE_MAIN_HEADER_TEMPLATE = HclTemplate(
+    '# Example usage of {module} module\n'
+    '\n'
+    'module "{module}" {{\n'
+    '  source = "{source}"\n'
+    '  \n')
+
+VERSIONS_TF = '''terraform {
+  required_version = ">= 0.13"
+  
+  required_providers {
+    alibabacloudstack = {
+      source  = "aliyun/alibabacloudstack"
+      version = ">= 3.16.0"
+    }
+  }
+}
+'''
+
+PROVIDER_TF = '''provider "alibabacloudstack" {
+  access_key = var.access_key
+  secret_key = var.secret_key
+  region =  "cn-hk-env00-d01"
+  proxy = "http://100.1.1.1:5001"
+  insecure = true
+  resource_group_set_name= var.resource_group_name
+  domain = "server.asapi.cn-xxxxx-envXX-d01.intra.envXX.shuguang.com/asapi/v3"
+  protocol = "HTTP"
+}
+'''
+
+EXAMPLE_PROVIDER_VARIABLES = '''# Provider configuration variables
+variable "access_key" {
+  type        = string
+  description = "The access key for AlibabaCloudStack"
+  sensitive   = true
+}
+
+variable "secret_key" {
+  type        = string
+  description = "The secret key for AlibabaCloudStack"
+  sensitive   = true
+}
+
+variable "resource_group_name" {
+  type        = string
+  description = "The resource group name"
+}
+
+# Resource-specific variables
+'''
+
+# required 参数在 tfvars 中的占位值，按类型匹配
+TFVARS_REQUIRED_VALUES = {'string': '""', 'number': '0', 'bool': 'false'}
+
+
+def file_status(path: Path, content: bytes) -> str:
+    """文件相对 content 的状态：new（不存在）、modified（内容不同）或 unchanged"""
+    try:
+        with open(path, 'rb') as f:
+            existing = f.read()
+    except FileNotFoundError:
+        return 'new'
+    return 'unchanged' if existing == content else 'modified'
+
+
+def write_file_atomic(path: Path, content: bytes):
+    """先写入同目录的临时文件再原子替换，避免留下写了一半的文件"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
 
 class ModuleGenerator:
-    """模块生成器"""
+    """模块生成器
+
+    文件先渲染到内存中的 {路径: 内容}，只写入内容有变化的文件，未变化的文件保持原有的修改时间。
+    dry_run 时不写磁盘，只报告会新增和修改的文件，show_diff 时同时输出统一 diff
+    """
 
-    def __init__(self, output_dir: str = "modules/alibabacloudstack", example_dir: str = "example_alibabacloudstack"):
+    def __init__(self, output_dir: str = "modules/alibabacloudstack", example_dir: str = "example_alibabacloudstack",
+                 dry_run: bool = False, show_diff: bool = False):
         self.output_dir = Path(output_dir)
         self.example_dir = Path(example_dir)
+        self.dry_run = dry_run
+        self.show_diff = show_diff
 
-    def generate_module(self, resource_data: Dict[str, Any], force: bool = False) -> bool:
-        """生成terraform模块"""
+    def generate_module(self, resource_data: Dict[str, Any], force: bool = False) -> Optional[List[str]]:
+        """生成terraform模块，成功时返回写入的文件路径列表，失败或跳过时返回 None"""
         resource_name = resource_data['resource_info']['resource_name']
 
         # 解析资源名称
-        name_parts = self._parse_resource_name(resource_name)
+        name_parts = self.parse_resource_name(resource_name)
         if not name_parts:
             logger.error(f"无法解析资源名称: {resource_name}")
-            return False
+            return None
 
         service, resource = name_parts
 
@@ -240,31 +662,57 @@ class ModuleGenerator:
 
         if module_path.exists() and not force:
             logger.warning(f"模块已存在: {module_path}")
-            return False
-
-        # 创建目录
-        module_path.mkdir(parents=True, exist_ok=True)
-        example_path.mkdir(parents=True, exist_ok=True)
-        (example_path / "env_vars").mkdir(exist_ok=True)
-
-        # 生成模块文件
-        self._generate_main_tf(module_path, resource_data)
-        self._generate_variables_tf(module_path, resource_data)
-        self._generate_outputs_tf(module_path, resource_data)
-        self._generate_versions_tf(module_path)
-
-        # 生成示例文件
-        self._generate_example_main_tf(example_path, service, resource, resource_data)
-        self._generate_example_variables_tf(example_path, resource_data)
-        self._generate_example_outputs_tf(example_path, resource_data)
-        self._generate_example_versions_tf(example_path)
-        self._generate_tfvars(example_path, resource_data)
-        self._generate_provider_tf(example_path)
-
-        logger.info(f"成功生成模块: {module_path}")
-        return True
-
-    def _parse_resource_name(self, resource_name: str) -> Optional[Tuple[str, str]]:
+            return None
+
+        # 生成模块和示例文件，只写入有变化的文件
+        files = self.render_module_files(module_path, example_path, service, resource, resource_data)
+        changes = self.write_files(files)
+
+        if self.dry_run:
+            if changes:
+                new_count = sum(status == 'new' for _, status in changes)
+                logger.info(f"[预览] 模块 {module_path}: 新增 {new_count} 个文件, 修改 {len(changes) - new_count} 个文件"
+                            + ''.join(f"\n  {'+' if status == 'new' else '~'} {file_path}"
+                                      for file_path, status in changes))
+            else:
+                logger.info(f"[预览] 模块未变化: {module_path}")
+        elif changes:
+            logger.info(f"成功生成模块: {module_path} (写入 {len(changes)}/{len(files)} 个文件)")
+        else:
+            logger.info(f"模块未变化: {module_path}")
+        return [file_path.as_posix() for file_path in files]
+
+    def write_files(self, files: Dict[Path, str]) -> List[Tuple[Path, str]]:
+        """写入内容有变化的文件，返回 [(路径, new/modified)]；dry_run 时只比较不写入"""
+        changes = []
+        for file_path, content in files.items():
+            data = content.encode('utf-8')
+            status = file_status(file_path, data)
+            if status == 'unchanged':
+                continue
+            changes.append((file_path, status))
+
+            if self.dry_run:
+                if self.show_diff:
+                    logger.info(self.unified_diff(file_path, content))
+            else:
+                write_file_atomic(file_path, data)
+        return changes
+
+    @staticmethod
+    def unified_diff(file_path: Path, content: str) -> str:
+        """已有文件与新内容的统一 diff，新文件与空文件比较"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                existing = f.read().splitlines(keepends=True)
+        except FileNotFoundError:
+            existing = []
+        diff = difflib.unified_diff(existing, content.splitlines(keepends=True),
+                                    fromfile=f"a/{file_path.as_posix()}", tofile=f"b/{file_path.as_posix()}")
+        return f"统一 diff: {file_path}\n" + ''.join(diff).rstrip('\n')
+
+    @staticmethod
+    def parse_resource_name(resource_name: str) -> Optional[Tuple[str, str]]:
         """解析资源名称，返回(service, resource)"""
         # 移除alibabacloudstack前缀
         if resource_name.startswith('alibabacloudstack_'):
@@ -279,253 +727,377 @@ class ModuleGenerator:
         else:
             return 'misc', name
 
-    def _generate_main_tf(self, path: Path, resource_data: Dict[str, Any]):
-        """生成main.tf"""
+    @staticmethod
+    def _tfvars_value(arg: Dict[str, Any]) -> Tuple[HclTemplate, str]:
+        """tfvars 中参数的模板和占位值：required 参数按类型赋值，其余参数注释为 null"""
+        if not arg['required']:
+            return TFVARS_COMMENTED_TEMPLATE, 'null'
+        if arg['type'] in TFVARS_REQUIRED_VALUES:
+            return TFVARS_TEMPLATE, TFVARS_REQUIRED_VALUES[arg['type']]
+        if 'list' in arg['type']:
+            return TFVARS_TEMPLATE, '[]'
+        if 'map' in arg['type'] or arg['type'] == 'any':
+            return TFVARS_TEMPLATE, '{}'
+        return TFVARS_COMMENTED_TEMPLATE, '""'
+
+    def render_module_files(self, module_path: Path, example_path: Path, service: str, resource: str,
+                            resource_data: Dict[str, Any]) -> Dict[Path, str]:
+        """渲染模块和示例的全部文件，返回 {文件路径: 内容}
+
+        参数列表只遍历一次，同时填充 variable 块、resource 参数、示例 module 参数和 tfvars 的缓冲区；
+        variable 块和 output 块在模块与示例之间共用，耗时与参数和属性数量成线性关系
+        """
         resource_name = resource_data['resource_info']['resource_name']
-
-        # 生成resource名称，如 "ecs_instance"
         if resource_name.startswith('alibabacloudstack_'):
             resource_local_name = resource_name[18:]  # 移除前缀
         else:
             resource_local_name = resource_name
 
-        # 生成resource配置
-        resource_config = f'resource "{resource_name}" "{resource_local_name}" {{\n'
+        variables: List[str] = []
+        resource_arguments: List[str] = [f'resource "{resource_name}" "{resource_local_name}" {{\n']
+        module_arguments: List[str] = []
+        tfvars: List[str] = [f'# Variables for {resource_name}\n\n']
 
-        # 添加参数配置
         for arg in resource_data['arguments']:
-            param_name = arg['name']
+            name = arg['name']
+            description = arg['description']
 
-            if arg['type'] == 'any' or 'object' in arg['type']:
-                # 对于复杂对象，使用dynamic块
-                resource_config += f'  # {arg["description"]}\n'
-                resource_config += f'  dynamic "{param_name}" {{\n'
-                resource_config += f'    for_each = var.{param_name}\n'
-                resource_config += f'    content {{\n'
-                resource_config += f'      # 根据实际需要配置嵌套属性\n'
-                resource_config += f'    }}\n'
-                resource_config += f'  }}\n\n'
+            # 只有非必需参数且有默认值时才设置default
+            if arg['required']:
+                default = ''
             else:
-                # 普通参数
-                resource_config += f'  # {arg["description"]}\n'
-                resource_config += f'  {param_name} = var.{param_name}\n\n'
+                default = VARIABLE_DEFAULT_TEMPLATE.render(
+                    value=str(arg['default']) if arg['default'] is not None else 'null')
+            VARIABLE_TEMPLATE.render_into(variables, name=name, type=arg['type'], description=description,
+                                          default=default)
 
-        resource_config += '}\n'
-
-        with open(path / 'main.tf', 'w', encoding='utf-8') as f:
-            f.write(resource_config)
-
-    def _generate_variables_tf(self, path: Path, resource_data: Dict[str, Any]):
-        """生成variables.tf"""
-        variables_content = '# Variables for the module\n\n'
+            # 对于复杂对象，使用dynamic块
+            if arg['type'] == 'any' or 'object' in arg['type']:
+                RESOURCE_DYNAMIC_TEMPLATE.render_into(resource_arguments, name=name, description=description)
+            else:
+                RESOURCE_ARGUMENT_TEMPLATE.render_into(resource_arguments, name=name, description=description)
 
-        for arg in resource_data['arguments']:
-            variables_content += f'variable "{arg["name"]}" {{\n'
-            variables_content += f'  type        = {arg["type"]}\n'
-            variables_content += f'  description = "{arg["description"]}"\n'
+            MODULE_ARGUMENT_TEMPLATE.render_into(module_arguments, name=name)
 
-            # 只有非必需参数且有默认值时才设置default
-            if not arg['required'] and arg['default'] is not None:
-                variables_content += f'  default     = {arg["default"]}\n'
-            elif not arg['required']:
-                variables_content += f'  default     = null\n'
+            template, value = self._tfvars_value(arg)
+            template.render_into(tfvars, name=name, description=description, value=value)
 
-            variables_content += '}\n\n'
+        resource_arguments.append('}\n')
+        variables_body = ''.join(variables)
 
-        with open(path / 'variables.tf', 'w', encoding='utf-8') as f:
-            f.write(variables_content)
+        # 默认输出ID，其余属性输出跳过 id 避免重复
+        attributes = [('id', f'The ID of the {resource_local_name}')]
+        attributes += [(attr['name'], attr['description'])
+                       for attr in resource_data['attributes'] if attr['name'] != 'id']
+        module_outputs: List[str] = ['# Outputs for the module\n\n']
+        example_outputs: List[str] = [f'# Outputs from the {resource_local_name} module\n\n']
+        for name, description in attributes:
+            OUTPUT_TEMPLATE.render_into(module_outputs, name=name, description=description,
+                                        value=f'{resource_name}.{resource_local_name}.{name}')
+            OUTPUT_TEMPLATE.render_into(example_outputs, name=name, description=description,
+                                        value=f'module.{resource_local_name}.{name}')
 
-    def _generate_outputs_tf(self, path: Path, resource_data: Dict[str, Any]):
-        """生成outputs.tf"""
-        resource_name = resource_data['resource_info']['resource_name']
+        example_main = [EXAMPLE_MAIN_HEADER_TEMPLATE.render(
+            module=f'{service}_{resource}', source=f'../../../modules/alibabacloudstack/{service}/{service}_{resource}')]
+        example_main += module_arguments
+        example_main.append('}\n')
 
-        if resource_name.startswith('alibabacloudstack_'):
-            resource_local_name = resource_name[18:]
-        else:
-            resource_local_name = resource_name
+        return {
+            module_path / 'main.tf': ''.join(resource_arguments),
+            module_path / 'variables.tf': '# Variables for the module\n\n' + variables_body,
+            module_path / 'outputs.tf': ''.join(module_outputs),
+            module_path / 'versions.tf': VERSIONS_TF,
+            example_path / 'main.tf': ''.join(example_main),
+            example_path / 'variables.tf': '# Variables for the example\n\n' + EXAMPLE_PROVIDER_VARIABLES + variables_body,
+            example_path / 'outputs.tf': ''.join(example_outputs),
+            example_path / 'versions.tf': VERSIONS_TF,
+            example_path / 'env_vars' / f'{resource_local_name}.tfvars': ''.join(tfvars),
+            example_path / 'provider.tf': PROVIDER_TF,
+        }
 
-        outputs_content = '# Outputs for the module\n\n'
 
-        # 默认输出ID
-        outputs_content += f'output "id" {{\n'
-        outputs_content += f'  description = "The ID of the {resource_local_name}"\n'
-        outputs_content += f'  value       = {resource_name}.{resource_local_name}.id\n'
-        outputs_content += '}\n\n'
+class GenerationManifest:
+    """批量生成清单
 
-        # 添加其他属性输出
-        for attr in resource_data['attributes']:
-            if attr['name'] != 'id':  # 避免重复
-                outputs_content += f'output "{attr["name"]}" {{\n'
-                outputs_content += f'  description = "{attr["description"]}"\n'
-                outputs_content += f'  value       = {resource_name}.{resource_local_name}.{attr["name"]}\n'
-                outputs_content += '}\n\n'
+    以文档文件名为键，记录文档内容的 sha256、生成时的 GENERATOR_VERSION、PARSER_VERSION 和生成的文件。
+    文档内容、生成器和解析器版本都没有变化、且生成的文件都还在时，模块无需重新生成
+    """
 
-        with open(path / 'outputs.tf', 'w', encoding='utf-8') as f:
-            f.write(outputs_content)
+    def __init__(self, path: Path):
+        self.path = path
+        self.docs: Dict[str, Dict[str, Any]] = {}
 
-    def _generate_versions_tf(self, path: Path):
-        """生成versions.tf"""
-        versions_content = '''terraform {
-  required_version = ">= 0.13"
-  
-  required_providers {
-    alibabacloudstack = {
-      source  = "aliyun/alibabacloudstack"
-      version = ">= 3.16.0"
-    }
-  }
-}
-'''
-        with open(path / 'versions.tf', 'w', encoding='utf-8') as f:
-            f.write(versions_content)
-
-    def _generate_provider_tf(self, path: Path):
-        """生成provider.tf"""
-        provider_content = '''provider "alibabacloudstack" {
-  access_key = var.access_key
-  secret_key = var.secret_key
-  region =  "cn-hk-env00-d01"
-  proxy = "http://100.1.1.1:5001"
-  insecure = true
-  resource_group_set_name= var.resource_group_name
-  domain = "server.asapi.cn-xxxxx-envXX-d01.intra.envXX.shuguang.com/asapi/v3"
-  protocol = "HTTP"
-}
-'''
-        with open(path / 'provider.tf', 'w', encoding='utf-8') as f:
-            f.write(provider_content)
+    def load(self):
+        """读取清单，文件不存在、损坏或格式版本不同时视为空清单"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == MANIFEST_VERSION:
+            self.docs = data.get('docs', {})
+
+    def save(self):
+        """原子写入清单"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'docs': self.docs}, f, ensure_ascii=False, indent=2,
+                      sort_keys=True)
+            f.write('\n')
+        os.replace(tmp_path, self.path)
+
+    def is_unchanged(self, doc_name: str, digest: str) -> bool:
+        entry = self.docs.get(doc_name)
+        return (entry is not None and entry.get('hash') == digest
+                and entry.get('generator_version') == GENERATOR_VERSION
+                and entry.get('parser_version') == PARSER_VERSION
+                and all(os.path.isfile(file_path) for file_path in entry.get('files', [])))
+
+    def record(self, doc_name: str, digest: str, files: List[str]):
+        self.docs[doc_name] = {'hash': digest, 'generator_version': GENERATOR_VERSION,
+                               'parser_version': PARSER_VERSION, 'files': files}
+
+    def orphaned(self, doc_names: List[str]) -> List[str]:
+        """文档已不存在但生成的文件还在的条目；文件也已删除的条目直接移除"""
+        existing = set(doc_names)
+        orphaned = []
+        for doc_name in sorted(set(self.docs) - existing):
+            if any(os.path.exists(file_path) for file_path in self.docs[doc_name].get('files', [])):
+                orphaned.append(doc_name)
+            else:
+                del self.docs[doc_name]
+        return orphaned
 
     @staticmethod
-    def _generate_example_main_tf(path: Path, service: str, resource: str, resource_data: Dict[str, Any]):
-        """生成示例的main.tf"""
-        module_path = f"../../../modules/alibabacloudstack/{service}/{service}_{resource}"
-
-        main_content = f'''# Example usage of {service}_{resource} module
-
-module "{service}_{resource}" {{
-  source = "{module_path}"
-  
-'''
-
-        # 添加所有变量引用
-        for arg in resource_data['arguments']:
-            main_content += f'  {arg["name"]} = var.{arg["name"]}\n'
-
-        main_content += '}\n'
-
-        with open(path / 'main.tf', 'w', encoding='utf-8') as f:
-            f.write(main_content)
-
-    def _generate_example_variables_tf(self, path: Path, resource_data: Dict[str, Any]):
-        """生成示例的variables.tf"""
-        variables_content = '# Variables for the example\n\n'
-
-        # 添加固定的三个通用参数
-        variables_content += '''# Provider configuration variables
-variable "access_key" {
-  type        = string
-  description = "The access key for AlibabaCloudStack"
-  sensitive   = true
-}
-
-variable "secret_key" {
-  type        = string
-  description = "The secret key for AlibabaCloudStack"
-  sensitive   = true
-}
-
-variable "resource_group_name" {
-  type        = string
-  description = "The resource group name"
-}
-
-# Resource-specific variables
-'''
-
-        # 添加资源特定的参数
-        for arg in resource_data['arguments']:
-            variables_content += f'variable "{arg["name"]}" {{\n'
-            variables_content += f'  type        = {arg["type"]}\n'
-            variables_content += f'  description = "{arg["description"]}"\n'
-
-            # 只有非必需参数且有默认值时才设置default
-            if not arg['required'] and arg['default'] is not None:
-                variables_content += f'  default     = {arg["default"]}\n'
-            elif not arg['required']:
-                variables_content += f'  default     = null\n'
-
-            variables_content += '}\n\n'
+    def module_dir(entry: Dict[str, Any]) -> str:
+        """条目中第一个文件（模块 main.tf）所在的目录"""
+        files = entry.get('files', [])
+        return os.path.dirname(files[0]) if files else ''
+
+
+def read_front_matter(file_path: str) -> Dict[str, str]:
+    """只读取文档的 front matter，不读入正文
+
+    小文件逐行读取到结束标记为止；大文件用 mmap 在开头 PRESCAN_MAX_BYTES 内查找结束标记，
+    只解码 front matter 部分
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= PRESCAN_MMAP_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start = FRONT_MATTER_START_RE.match(mm, 0, PRESCAN_MAX_BYTES)
+                if start is None:
+                    return {}
+                end = mm.find(b'\n---', start.end(), PRESCAN_MAX_BYTES)
+                if end < 0:
+                    return {}
+                head = mm[:end + 4].decode('utf-8')
+            lines = head.split('\n')
+        else:
+            lines = []
+            read = 0
+            start = None
+            for raw_line in f:
+                line = raw_line.decode('utf-8').rstrip('\r\n')
+                lines.append(line)
+                read += len(raw_line)
+                if read > PRESCAN_MAX_BYTES:
+                    break
+                stripped = line.lstrip('\ufeff').strip()
+                if start is None:
+                    # 跳过开头的 BOM 和空行，第一个非空行不是 --- 时没有 front matter
+                    if not stripped:
+                        continue
+                    if stripped != '---':
+                        break
+                    start = len(lines) - 1
+                elif stripped == '---':
+                    break
+
+    return DocTokenizer.parse_front_matter(lines)[0]
+
+
+class DocIndex:
+    """资源文档的预扫描索引：只读取 front matter，按服务、subcategory 和资源名筛选文档"""
 
-        with open(path / 'variables.tf', 'w', encoding='utf-8') as f:
-            f.write(variables_content)
+    def __init__(self):
+        # 文档路径 -> {'resource', 'service', 'subcategory'}
+        self.entries: Dict[str, Dict[str, str]] = {}
 
-    @staticmethod
-    def _generate_example_outputs_tf(path: Path, resource_data: Dict[str, Any]):
-        """生成示例的outputs.tf"""
-        resource_name = resource_data['resource_info']['resource_name']
+    def scan(self, doc_files: List[str]):
+        for doc_file in doc_files:
+            try:
+                info = DocumentParser.extract_resource_info(read_front_matter(doc_file))
+            except (OSError, UnicodeDecodeError, ValueError) as e:
+                logger.warning(f"预扫描文档 {doc_file} 失败: {e}")
+                info = {}
+
+            # 没有 page_title 时退回到文件名
+            resource_name = info.get('resource_name') or os.path.basename(doc_file).split('.', 1)[0]
+            service, _ = ModuleGenerator.parse_resource_name(resource_name)
+            if resource_name.startswith('alibabacloudstack_'):
+                resource_name = resource_name[18:]
+            self.entries[doc_file] = {
+                'resource': resource_name,
+                'service': service,
+                'subcategory': info.get('subcategory', '')
+            }
+
+    def select(self, services: Optional[List[str]] = None, subcategories: Optional[List[str]] = None,
+               resource_pattern: Optional[str] = None) -> List[str]:
+        """按条件筛选文档（条件之间为且，同一条件的多个值之间为或），保持原有顺序
+
+        services 与资源名前缀（如 adb）比较；subcategories 不区分大小写；
+        resource_pattern 为 glob，与去掉 alibabacloudstack_ 前缀的资源名比较
+        """
+        subcategories = {subcategory.lower() for subcategory in subcategories or []}
+        selected = []
+        for doc_file, entry in self.entries.items():
+            if services and entry['service'] not in services:
+                continue
+            if subcategories and entry['subcategory'].lower() not in subcategories:
+                continue
+            if resource_pattern and not fnmatch.fnmatchcase(entry['resource'], resource_pattern):
+                continue
+            selected.append(doc_file)
+        return selected
+
+
+def file_digest(file_path: str) -> str:
+    """文件内容的 sha256"""
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class _BufferedLogHandler(logging.Handler):
+    """在工作进程中缓存日志，由主进程按文件顺序统一输出"""
 
-        if resource_name.startswith('alibabacloudstack_'):
-            resource_local_name = resource_name[18:]
-        else:
-            resource_local_name = resource_name
+    def __init__(self):
+        super().__init__()
+        self.records = []
 
-        outputs_content = f'''# Outputs from the {resource_local_name} module
+    def emit(self, record):
+        self.records.append((record.levelno, record.getMessage()))
 
-output "id" {{
-  description = "The ID of the {resource_local_name}"
-  value       = module.{resource_local_name}.id
-}}
 
-'''
+# 工作进程内复用的解析器、生成器和日志缓存
+_worker_parser = None
+_worker_generator = None
+_worker_log = None
 
-        # 添加其他输出
-        for attr in resource_data['attributes']:
-            if attr['name'] != 'id':
-                outputs_content += f'output "{attr["name"]}" {{\n'
-                outputs_content += f'  description = "{attr["description"]}"\n'
-                outputs_content += f'  value       = module.{resource_local_name}.{attr["name"]}\n'
-                outputs_content += '}\n\n'
 
-        with open(path / 'outputs.tf', 'w', encoding='utf-8') as f:
-            f.write(outputs_content)
+def _init_worker(generator: ModuleGenerator, level: int, parse_cache: Optional[ParseCache]):
+    """工作进程初始化：日志只写入缓存，不直接输出"""
+    global _worker_parser, _worker_generator, _worker_log
 
-    def _generate_example_versions_tf(self, path: Path):
-        """生成示例的versions.tf"""
-        self._generate_versions_tf(path)
+    _worker_parser = DocumentParser(parse_cache)
+    _worker_generator = generator
+    _worker_log = _BufferedLogHandler()
+    logger.handlers = [_worker_log]
+    logger.propagate = False
+    logger.setLevel(level)
 
-    @staticmethod
-    def _generate_tfvars(path: Path, resource_data: Dict[str, Any]):
-        """生成tfvars文件"""
-        resource_name = resource_data['resource_info']['resource_name']
 
-        if resource_name.startswith('alibabacloudstack_'):
-            filename = resource_name[18:] + '.tfvars'
-        else:
-            filename = resource_name + '.tfvars'
+def _process_doc_worker(doc_file: str, force: bool) -> Tuple[Optional[List[str]], List[Tuple[int, str]]]:
+    """在工作进程中解析并生成单个模块，返回 (生成的文件, 缓存的日志)"""
+    _worker_log.records = []
+    files = process_doc(_worker_parser, _worker_generator, doc_file, force)
+    return files, _worker_log.records
 
-        tfvars_content = f'# Variables for {resource_name}\n\n'
 
-        for arg in resource_data['arguments']:
-            tfvars_content += f'# {arg["description"]}\n'
+def process_doc(parser_instance: DocumentParser, generator: ModuleGenerator, doc_file: str,
+                force: bool) -> Optional[List[str]]:
+    """解析单个文档并生成模块，返回生成的文件；失败时记录错误并返回 None"""
+    try:
+        resource_data = parser_instance.parse_resource_doc(doc_file)
+        return generator.generate_module(resource_data, force)
+    except Exception as e:
+        logger.error(f"处理文件 {doc_file} 失败: {e}")
+        return None
 
-            if arg['required']:
-                if arg['type'] == 'string':
-                    tfvars_content += f'{arg["name"]} = ""\n\n'
-                elif arg['type'] == 'number':
-                    tfvars_content += f'{arg["name"]} = 0\n\n'
-                elif arg['type'] == 'bool':
-                    tfvars_content += f'{arg["name"]} = false\n\n'
-                elif 'list' in arg['type']:
-                    tfvars_content += f'{arg["name"]} = []\n\n'
-                elif 'map' in arg['type'] or arg['type'] == 'any':
-                    tfvars_content += f'{arg["name"]} = {{}}\n\n'
-                else:
-                    tfvars_content += f'# {arg["name"]} = ""\n\n'
-            else:
-                tfvars_content += f'# {arg["name"]} = null\n\n'
 
-        with open(path / 'env_vars' / filename, 'w', encoding='utf-8') as f:
-            f.write(tfvars_content)
+def run_batch(jobs_list: List[Tuple[str, bool]], generator: ModuleGenerator, jobs: int,
+              parse_cache: Optional[ParseCache] = None) -> List[Optional[List[str]]]:
+    """批量生成模块，jobs_list 为 (文档, 是否覆盖) 列表，按相同顺序返回每个文档生成的文件
+
+    jobs 大于 1 时在进程池中并行解析和生成（解析是 CPU 密集的正则处理），
+    各文件的日志在工作进程中缓存，主进程按文件顺序输出，保证日志稳定可比对
+    """
+    workers = min(jobs, len(jobs_list))
+    if workers <= 1:
+        parser_instance = DocumentParser(parse_cache)
+        return [process_doc(parser_instance, generator, doc_file, force) for doc_file, force in jobs_list]
+
+    logger.info(f"并行处理 {len(jobs_list)} 个文档 (jobs={workers})")
+    # 按块分发任务，减少进程间通信的次数
+    chunksize = max(1, len(jobs_list) // (workers * 4))
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(generator, logger.getEffectiveLevel(), parse_cache)) as executor:
+        for files, records in executor.map(_process_doc_worker, *zip(*jobs_list), chunksize=chunksize):
+            for level, message in records:
+                logger.log(level, message)
+            results.append(files)
+
+    return results
+
+
+def run_incremental_batch(doc_files: List[str], generator: ModuleGenerator, force: bool,
+                          jobs: int, parse_cache: Optional[ParseCache] = None,
+                          all_doc_files: Optional[List[str]] = None) -> int:
+    """按清单增量批量生成，返回成功数量（未变化的模块也计为成功）
+
+    只重新生成文档内容或生成器版本有变化的模块；清单中已有的模块可直接覆盖，
+    清单外已存在的模块仍需要 --force。结束后报告新增、更新、未变化和孤立的模块，
+    预览模式下不更新清单。all_doc_files 为筛选前的全部文档，用于判断孤立模块
+    """
+    manifest = GenerationManifest(generator.output_dir / MANIFEST_FILE)
+    manifest.load()
+
+    jobs_list = []
+    statuses = []
+    digests = {}
+    unchanged = 0
+    for doc_file in doc_files:
+        doc_name = os.path.basename(doc_file)
+        try:
+            digests[doc_name] = file_digest(doc_file)
+        except OSError as e:
+            logger.error(f"处理文件 {doc_file} 失败: {e}")
+            continue
+
+        if not force and manifest.is_unchanged(doc_name, digests[doc_name]):
+            unchanged += 1
+            logger.debug(f"文档未变化，跳过: {doc_file}")
+            continue
+
+        tracked = doc_name in manifest.docs
+        jobs_list.append((doc_file, force or tracked))
+        statuses.append('updated' if tracked else 'new')
+
+    counts = {'new': 0, 'updated': 0}
+    if jobs_list:
+        for (doc_file, _), status, files in zip(jobs_list, statuses,
+                                                run_batch(jobs_list, generator, jobs, parse_cache)):
+            if files is not None:
+                doc_name = os.path.basename(doc_file)
+                manifest.record(doc_name, digests[doc_name], files)
+                counts[status] += 1
+
+    orphaned = manifest.orphaned([os.path.basename(doc_file) for doc_file in all_doc_files or doc_files])
+    for doc_name in orphaned:
+        logger.warning(f"孤立模块: {GenerationManifest.module_dir(manifest.docs[doc_name])} "
+                       f"(文档 {doc_name} 已不存在)")
+
+    if not generator.dry_run:
+        manifest.save()
+    if parse_cache is not None:
+        evicted = parse_cache.evict()
+        if evicted:
+            logger.info(f"解析缓存超过 {parse_cache.max_bytes // (1024 * 1024)} MB，已淘汰 {evicted} 个条目")
+    logger.info(f"新增 {counts['new']} 个, 更新 {counts['updated']} 个, 未变化 {unchanged} 个, "
+                f"孤立 {len(orphaned)} 个 (清单: {manifest.path})")
+    return counts['new'] + counts['updated'] + unchanged
 
 
 def main():
@@ -535,7 +1107,11 @@ def main():
     parser.add_argument('--input-dir', default='website/docs/r/',
                        help='输入文档目录')
     parser.add_argument('--resource',
-                       help='单个资源名称(single模式必需)')
+                       help='单个资源名称(single模式必需)；batch模式下为资源名的 glob 筛选，如 "ecs_*"')
+    parser.add_argument('--service', action='append',
+                       help='batch模式下只处理指定服务的资源（资源名前缀，如 adb），可重复指定')
+    parser.add_argument('--subcategory', action='append',
+                       help='batch模式下只处理 front matter 中 subcategory 匹配的资源（不区分大小写），可重复指定')
     parser.add_argument('--output-dir', default='modules/alibabacloudstack',
                        help='模块输出目录')
     parser.add_argument('--example-dir', default='example_alibabacloudstack',
@@ -544,8 +1120,33 @@ def main():
                        help='强制覆盖已存在的模块')
     parser.add_argument('--verbose', action='store_true',
                        help='详细输出')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                       help='batch模式下并行处理的文档数 (默认: CPU 核数，1 表示串行)')
+    parser.add_argument('--cache-dir', default='.cache',
+                       help=f'解析缓存目录，缓存文件位于其中的 {PARSE_CACHE_DIR}/ (默认: .cache)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='不读取也不写入解析缓存')
+    parser.add_argument('--cache-max-mb', type=int, default=PARSE_CACHE_MAX_MB,
+                       help=f'解析缓存的容量上限，超出时淘汰最久未使用的条目 (默认: {PARSE_CACHE_MAX_MB} MB)')
+
+    parser.add_argument('--dry-run', action='store_true',
+                       help='预览模式：只报告会新增和修改的文件，不写入磁盘')
+    parser.add_argument('--diff', action='store_true',
+                       help='预览模式下输出每个变化文件的统一 diff（隐含 --dry-run）')
 
     args = parser.parse_args()
+    args.dry_run = args.dry_run or args.diff
+
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs 必须大于等于 1')
+    if args.cache_max_mb < 1:
+        parser.error('--cache-max-mb 必须大于等于 1')
+
+    parse_cache = None
+    if not args.no_cache:
+        parse_cache = ParseCache(os.path.join(args.cache_dir, PARSE_CACHE_DIR), args.cache_max_mb * 1024 * 1024,
+                                 read_only=args.dry_run)
+    generator = ModuleGenerator(args.output_dir, args.example_dir, args.dry_run, args.diff)
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -554,9 +1155,6 @@ def main():
         logger.error("single模式需要指定--resource参数")
         sys.exit(1)
 
-    parser_instance = DocumentParser()
-    generator = ModuleGenerator(args.output_dir, args.example_dir)
-
     if args.mode == 'batch':
         # 批量处理
         input_path = Path(args.input_dir)
@@ -564,19 +1162,23 @@ def main():
             logger.error(f"输入目录不存在: {input_path}")
             sys.exit(1)
 
-        success_count = 0
-        total_count = 0
+        # 按文件名排序，保证处理和日志顺序稳定
+        all_doc_files = sorted(str(doc_file) for doc_file in input_path.glob('*.html.markdown'))
+        doc_files = all_doc_files
 
-        for doc_file in input_path.glob('*.html.markdown'):
-            total_count += 1
-            try:
-                resource_data = parser_instance.parse_resource_doc(str(doc_file))
-                if generator.generate_module(resource_data, args.force):
-                    success_count += 1
-            except Exception as e:
-                logger.error(f"处理文件 {doc_file} 失败: {e}")
+        # 有筛选条件时先预扫描 front matter，在完整解析前选出要处理的文档
+        if args.service or args.subcategory or args.resource:
+            index = DocIndex()
+            index.scan(all_doc_files)
+            doc_files = index.select(args.service, args.subcategory, args.resource)
+            logger.info(f"预扫描 {len(all_doc_files)} 个文档，筛选出 {len(doc_files)} 个")
+
+        total_count = len(doc_files)
+        success_count = run_incremental_batch(doc_files, generator, args.force,
+                                              args.jobs or os.cpu_count() or 1, parse_cache, all_doc_files)
 
-        logger.info(f"批量处理完成: {success_count}/{total_count} 个模块生成成功")
+        preview = "（预览，未写入磁盘）" if args.dry_run else ""
+        logger.info(f"批量处理完成{preview}: {success_count}/{total_count} 个模块生成成功")
 
     else:
         # 单个处理
@@ -585,6 +1187,8 @@ def main():
             logger.error(f"文档文件不存在: {doc_file}")
             sys.exit(1)
 
+        parser_instance = DocumentParser(parse_cache)
+
         try:
             resource_data = parser_instance.parse_resource_doc(str(doc_file))
             if generator.generate_module(resource_data, args.force):
@@ -16,6 +16,19 @@ import glob
 from pathlib import Path
 import re
 import shutil
+import json
+import hashlib
+import threading
+import time
+import select
+import struct
+import ctypes
+import ctypes.util
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import terraform_hcl
+import git_changes
 
 
 class Colors:
@@ -30,27 +43,911 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# 单个模块的生成结果
+RESULT_SUCCESS = "success"
+RESULT_CACHED = "cached"
+RESULT_FAILED = "failed"
+
+CACHE_VERSION = 1
+
+# native 渲染器版本：渲染规则变化时递增，使 native 引擎的缓存失效
+NATIVE_RENDERER_VERSION = "2"
+
+# README 同步方式
+SYNC_COPY = "copy"
+SYNC_HARDLINK = "hardlink"
+SYNC_SYMLINK = "symlink"
+
+# 同步阶段的线程数上限，复制小文件主要受磁盘 IO 限制
+SYNC_WORKERS = 4
+
+# 监听模式：连续保存在该时间内合并为一次重新生成（秒）
+WATCH_DEBOUNCE = 0.3
+# 监听模式：一直有事件时最多等待该时间后开始生成（秒）
+WATCH_MAX_DELAY = 1.0
+# 轮询监听的扫描间隔（秒）
+WATCH_POLL_INTERVAL = 0.5
+
+# 文档生成引擎
+ENGINE_TERRAFORM_DOCS = "terraform-docs"
+ENGINE_NATIVE = "native"
+
+# 批量模式：服务目录下至少有这么多模块时才合并为一次 terraform-docs 调用
+BATCH_MIN_MODULES = 2
+# 批量模式下每个模块允许的 terraform-docs 运行时间（秒）
+BATCH_TIMEOUT_PER_MODULE = 60
+
+# 耗时报告：阶段名称、格式与默认列出的最慢模块数
+PHASE_RENDER = "render"
+PHASE_POSTPROCESS = "postprocess"
+PHASE_SYNC = "sync"
+REPORT_FORMATS = ["json"]
+REPORT_VERSION = 1
+REPORT_SLOWEST = 10
+
+
+def percentile(values, pct):
+    """按最近秩法计算百分位数，values 为空时返回 0"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def _parse_yaml_scalar(value):
+    """解析单个 YAML 标量（含简单的行内列表）"""
+    value = value.strip()
+    if value in ('', '~', 'null'):
+        return None
+    if value in ('true', 'false'):
+        return value == 'true'
+    if value.startswith('"') and value.endswith('"') and len(value) >= 2:
+        return json.loads(value)
+    if value.startswith("'") and value.endswith("'") and len(value) >= 2:
+        return value[1:-1].replace("''", "'")
+    if value.startswith('[') and value.endswith(']'):
+        inner = value[1:-1].strip()
+        return [_parse_yaml_scalar(item) for item in inner.split(',')] if inner else []
+    if value == '{}':
+        return {}
+    if re.fullmatch(r'-?\d+', value):
+        return int(value)
+    return value
+
+
+def _strip_yaml_comment(value):
+    """去掉行尾注释（引号内的 # 保留）"""
+    quote = None
+    for index, char in enumerate(value):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '#' and (index == 0 or value[index - 1] in ' \t'):
+            return value[:index]
+    return value
+
+
+def _yaml_indent(line):
+    return len(line) - len(line.lstrip(' '))
+
+
+def _next_yaml_line(lines, index):
+    """返回下一个非空、非注释行的下标"""
+    while index < len(lines) and (not lines[index].strip() or lines[index].strip().startswith('#')):
+        index += 1
+    return index
+
+
+def _parse_yaml_block_scalar(lines, index, parent_indent, style):
+    """解析 | / |- / |+ / > 块文本，返回 (文本, 下一行下标)"""
+    block = []
+    block_indent = None
+    while index < len(lines):
+        line = lines[index]
+        if line.strip():
+            if _yaml_indent(line) <= parent_indent:
+                break
+            if block_indent is None:
+                block_indent = _yaml_indent(line)
+            block.append(line[block_indent:])
+        else:
+            block.append('')
+        index += 1
+
+    trailing = 0
+    while block and block[-1] == '':
+        block.pop()
+        trailing += 1
+
+    separator = ' ' if style.startswith('>') else '\n'
+    text = separator.join(block)
+    if style.endswith('-'):
+        return text, index
+    if style.endswith('+'):
+        return text + '\n' * (trailing + 1), index
+    return text + '\n', index
+
+
+def _parse_yaml_node(lines, index, indent):
+    """解析从 index 开始、缩进为 indent 的映射或列表，返回 (值, 下一行下标)"""
+    index = _next_yaml_line(lines, index)
+    if index < len(lines) and lines[index].strip().startswith('- '):
+        items = []
+        while True:
+            index = _next_yaml_line(lines, index)
+            if index >= len(lines) or _yaml_indent(lines[index]) != indent \
+                    or not lines[index].strip().startswith('- '):
+                return items, index
+            items.append(_parse_yaml_scalar(_strip_yaml_comment(lines[index].strip()[2:])))
+            index += 1
+
+    mapping = {}
+    while True:
+        index = _next_yaml_line(lines, index)
+        if index >= len(lines) or _yaml_indent(lines[index]) < indent:
+            return mapping, index
+
+        line = lines[index]
+        key, separator, rest = line.strip().partition(':')
+        if not separator:
+            raise ValueError(f"无法解析的配置行 {index + 1}: {line.strip()}")
+        key = _parse_yaml_scalar(key)
+        rest = _strip_yaml_comment(rest).strip()
+        index += 1
+
+        if rest.startswith(('|', '>')):
+            mapping[key], index = _parse_yaml_block_scalar(lines, index, _yaml_indent(line), rest)
+        elif rest:
+            mapping[key] = _parse_yaml_scalar(rest)
+        else:
+            child = _next_yaml_line(lines, index)
+            child_indent = _yaml_indent(lines[child]) if child < len(lines) else 0
+            is_list = child < len(lines) and lines[child].strip().startswith('- ')
+            if child < len(lines) and (child_indent > _yaml_indent(line)
+                                       or (is_list and child_indent == _yaml_indent(line))):
+                mapping[key], index = _parse_yaml_node(lines, child, child_indent)
+            else:
+                mapping[key] = None
+
+
+def load_simple_yaml(text):
+    """解析 terraform-docs 配置文件使用的 YAML 子集
+
+    支持嵌套映射、`- item` 列表、`[a, b]` 行内列表、引号字符串、布尔值、整数，
+    以及 `|` / `|-` / `|+` 块文本，足以读取 config/*.yml，无需安装 PyYAML
+    """
+    value, _ = _parse_yaml_node(text.replace('\t', '  ').split('\n'), 0, 0)
+    return value
+
+
+class NativeDocsRenderer:
+    """内置文档渲染器
+
+    按 terraform-docs 配置文件（formatter: markdown table）在进程内渲染
+    Requirements / Providers / Modules / Resources / Inputs / Outputs 表格，
+    不依赖 terraform-docs 可执行文件
+    """
+
+    DEFAULT_SETTINGS = {
+        'anchor': True,
+        'default': True,
+        'escape': True,
+        'hide-empty': False,
+        'html': True,
+        'indent': 2,
+        'lockfile': True,
+        'read-comments': True,
+        'required': True,
+        'type': True
+    }
+
+    DEFAULT_OUTPUT_TEMPLATE = "<!-- BEGIN_TF_DOCS -->\n{{ .Content }}\n<!-- END_TF_DOCS -->"
+
+    # 未配置 content 时各段落的默认顺序
+    DEFAULT_SECTIONS = ['header', 'requirements', 'providers', 'modules',
+                        'resources', 'inputs', 'outputs', 'footer']
+
+    SECTION_TITLES = {
+        'requirements': ('Requirements', 'No requirements.'),
+        'providers': ('Providers', 'No providers.'),
+        'modules': ('Modules', 'No modules.'),
+        'resources': ('Resources', 'No resources.'),
+        'inputs': ('Inputs', 'No inputs.'),
+        'outputs': ('Outputs', 'No outputs.')
+    }
+
+    TEMPLATE_RE = re.compile(r'\{\{\s*(.*?)\s*\}\}', re.DOTALL)
+    BEGIN_MARKER = "<!-- BEGIN_TF_DOCS -->"
+    END_MARKER = "<!-- END_TF_DOCS -->"
+
+    def __init__(self, config_file):
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = load_simple_yaml(f.read()) or {}
+
+        formatter = config.get('formatter') or 'markdown table'
+        if formatter not in ('markdown table', 'markdown tbl', 'md table', 'md tbl'):
+            raise ValueError(f"native 引擎只支持 markdown table 格式，当前为: {formatter}")
+
+        self.settings = dict(self.DEFAULT_SETTINGS)
+        self.settings.update(config.get('settings') or {})
+
+        sort = config.get('sort') or {}
+        self.sort_enabled = sort.get('enabled', True)
+        self.sort_by = sort.get('by') or 'name'
+
+        sections = config.get('sections') or {}
+        self.hidden_sections = set(sections.get('hide') or [])
+        self.shown_sections = set(sections.get('show') or [])
+
+        output = config.get('output') or {}
+        self.output_file = output.get('file') or 'README.md'
+        self.output_mode = output.get('mode') or 'inject'
+        self.output_template = output.get('template') or self.DEFAULT_OUTPUT_TEMPLATE
+
+        self.content_template = config.get('content') or ''
+        self.header_from = config.get('header-from', 'main.tf') or ''
+        self.footer_from = config.get('footer-from') or ''
+
+    def is_section_visible(self, section):
+        """按 sections.show / sections.hide 判断段落是否输出"""
+        if self.shown_sections and section not in self.shown_sections:
+            return False
+        return section not in self.hidden_sections
+
+    def scan_options(self):
+        """影响 HCL 扫描结果的配置项，相同选项的配置可以共用一次扫描"""
+        return self.header_from, self.footer_from, bool(self.settings.get('read-comments', True))
+
+    def scan_module(self, module_path, sources=None):
+        """按当前配置扫描模块"""
+        header_from, footer_from, read_comments = self.scan_options()
+        return terraform_hcl.scan_module(module_path, header_from, footer_from, read_comments, sources)
+
+    def write_module_docs(self, module_path, data=None):
+        """渲染并写入模块文档，返回文档路径
+
+        data 为已扫描好的模块数据，多份配置共用同一次扫描时由调用方传入
+        """
+        readme_path = os.path.join(module_path, self.output_file)
+        existing = None
+        if self.output_mode == 'inject' and os.path.exists(readme_path):
+            with open(readme_path, 'r', encoding='utf-8') as f:
+                existing = f.read()
+
+        content = self.render_output(self.render_content(module_path, data), existing)
+        with open(readme_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return readme_path
+
+    def render_output(self, content, existing=None):
+        """套用 output.template，inject 模式下替换已有文档中的标记区间"""
+        text = re.sub(r'\{\{\s*\.Content\s*\}\}', lambda _: content, self.output_template)
+        if not text.endswith('\n'):
+            text += '\n'
+
+        if existing is None:
+            return text
+
+        begin = existing.find(self.BEGIN_MARKER)
+        end = existing.find(self.END_MARKER, begin)
+        if begin == -1 or end == -1:
+            return existing.rstrip('\n') + '\n\n' + text if existing.strip() else text
+        end += len(self.END_MARKER)
+        return existing[:begin] + text.rstrip('\n') + existing[end:]
+
+    def render_content(self, module_path, data=None):
+        """解析模块并按 content 模板渲染文档主体"""
+        if data is None:
+            data = self.scan_module(module_path)
+        lock = terraform_hcl.read_lock_file(module_path) if self.settings.get('lockfile') else {}
+
+        sections = {
+            'header': data['header'],
+            'footer': data['footer'],
+            'requirements': self.render_requirements(data),
+            'providers': self.render_providers(data, lock),
+            'modules': self.render_modules(data),
+            'resources': self.render_resources(data, lock),
+            'inputs': self.render_inputs(data),
+            'outputs': self.render_outputs(data)
+        }
+        for name in sections:
+            if not self.is_section_visible(name):
+                sections[name] = ''
+
+        if not self.content_template:
+            return "\n\n".join(sections[name] for name in self.DEFAULT_SECTIONS if sections[name])
+
+        # {{- 和 -}} 会去掉相邻的空白
+        template = re.sub(r'\s*\{\{-', '{{', self.content_template)
+        template = re.sub(r'-\}\}\s*', '}}', template)
+        return self.TEMPLATE_RE.sub(
+            lambda match: self.evaluate_template(match.group(1), sections, module_path), template)
+
+    def evaluate_template(self, expression, sections, module_path):
+        """执行 `{{ .Section | func args | ... }}` 形式的管道表达式"""
+        stages = [stage.strip() for stage in self._split_pipeline(expression)]
+        head = stages[0]
+
+        if head.startswith('.'):
+            name = head[1:].lower()
+            if name not in sections:
+                raise ValueError(f"不支持的模板变量: {head}")
+            value = sections[name]
+        else:
+            value = self._call_template_function(head, None, module_path)
+
+        for stage in stages[1:]:
+            value = self._call_template_function(stage, value, module_path)
+        return value
+
+    @staticmethod
+    def _split_pipeline(expression):
+        """按不在引号内的 | 拆分管道"""
+        stages, current, quote = [], '', None
+        for char in expression:
+            if quote:
+                if char == quote and not current.endswith('\\'):
+                    quote = None
+            elif char in '"`':
+                quote = char
+            elif char == '|':
+                stages.append(current)
+                current = ''
+                continue
+            current += char
+        stages.append(current)
+        return stages
+
+    def _call_template_function(self, stage, piped, module_path):
+        """调用模板函数，管道传入的值作为最后一个参数"""
+        tokens = re.findall(r'"(?:\\.|[^"\\])*"|`[^`]*`|\S+', stage)
+        name, args = tokens[0], []
+        for token in tokens[1:]:
+            if token.startswith('"'):
+                args.append(json.loads(token))
+            elif token.startswith('`'):
+                args.append(token[1:-1])
+            else:
+                args.append(token)
+        if piped is not None:
+            args.append(piped)
+
+        if name == 'lower' and len(args) == 1:
+            return args[0].lower()
+        if name == 'upper' and len(args) == 1:
+            return args[0].upper()
+        if name in ('trim', 'trimSpace') and len(args) == 1:
+            return args[0].strip()
+        if name == 'replace' and len(args) == 3:
+            return args[2].replace(args[0], args[1])
+        if name == 'regexReplaceAll' and len(args) == 3:
+            replacement = re.sub(r'\$\{?(\w+)\}?', r'\\g<\1>', args[1].replace('\\', '\\\\'))
+            return re.sub(args[0], replacement, args[2])
+        if name == 'include' and len(args) == 1:
+            with open(os.path.join(module_path, args[0]), 'r', encoding='utf-8') as f:
+                return f.read().rstrip('\n')
+        raise ValueError(f"不支持的模板函数: {stage}")
+
+    def _heading(self, title):
+        return "#" * int(self.settings.get('indent') or 2) + " " + title
+
+    def _section(self, section, header, rows):
+        """拼装带标题的表格段落，没有内容时按 hide-empty 处理"""
+        title, empty_text = self.SECTION_TITLES[section]
+        if not rows:
+            if self.settings.get('hide-empty'):
+                return ''
+            return f"{self._heading(title)}\n\n{empty_text}"
+
+        separator = "|" + "|".join(
+            ":" + "-" * len(column) + ":" if column == 'Required' else "-" * (len(column) + 2)
+            for column in header) + "|"
+        lines = ["| " + " | ".join(header) + " |", separator]
+        lines.extend("| " + " | ".join(row) + " |" for row in rows)
+        return f"{self._heading(title)}\n\n" + "\n".join(lines)
+
+    def _escape(self, text):
+        """转义表格单元格中的 Markdown 特殊字符（反引号内不转义 _）"""
+        text = str(text).replace('|', '\\|')
+        if not self.settings.get('escape'):
+            return text
+        parts = text.split('`')
+        for index in range(0, len(parts), 2):
+            parts[index] = re.sub(r'(?<!\\)([_*])', r'\\\1', parts[index])
+        return '`'.join(parts)
+
+    def _name_cell(self, prefix, name):
+        """名称单元格：按 anchor / html 设置生成锚点和链接"""
+        if not self.settings.get('anchor'):
+            return self._escape(name)
+        anchor = f"{prefix}_{name}"
+        link = f"[{self._escape(name)}](#{self._escape(anchor)})"
+        if self.settings.get('html'):
+            return f'<a name="{anchor}"></a> {link}'
+        return link
+
+    def _description_cell(self, text):
+        text = (text or '').strip()
+        separator = '<br>' if self.settings.get('html') else ' '
+        return separator.join(self._escape(line.strip()) for line in text.split('\n'))
+
+    def _code_cell(self, text):
+        """代码单元格：单行用反引号，多行在 html 模式下用 <pre>"""
+        lines = str(text).split('\n')
+        if len(lines) > 1 and self.settings.get('html'):
+            return "<pre>" + "<br>".join(line.replace('|', '\\|') for line in lines) + "</pre>"
+        return "`" + " ".join(line.strip() for line in lines).replace('|', '\\|') + "`"
+
+    def _sorted(self, items, key):
+        return sorted(items, key=key) if self.sort_enabled else list(items)
+
+    def render_requirements(self, data):
+        requirements = list(data['requirements'])
+        core = [r for r in requirements if r['name'] == 'terraform']
+        others = self._sorted([r for r in requirements if r['name'] != 'terraform'], lambda r: r['name'])
+        rows = [[self._name_cell('requirement', r['name']), self._escape(r['version'] or 'n/a')]
+                for r in core + others]
+        return self._section('requirements', ['Name', 'Version'], rows)
+
+    def render_providers(self, data, lock):
+        rows = []
+        for provider in self._sorted(data['providers'], lambda p: (p['name'], p['alias'] or '')):
+            name = provider['name'] + (f".{provider['alias']}" if provider['alias'] else '')
+            # 与 terraform-docs 一致：只显示锁文件中的版本，版本约束属于 Requirements
+            version = lock.get(provider['name']) or 'n/a'
+            rows.append([self._name_cell('provider', name), self._escape(version)])
+        return self._section('providers', ['Name', 'Version'], rows)
+
+    def render_modules(self, data):
+        rows = [[self._name_cell('module', module['name']), self._escape(module['source'] or ''),
+                 self._escape(module['version'] or 'n/a')]
+                for module in self._sorted(data['modules'], lambda m: m['name'])]
+        return self._section('modules', ['Name', 'Source', 'Version'], rows)
+
+    def render_resources(self, data, lock):
+        rows = []
+        resources = self._sorted(data['resources'],
+                                 lambda r: (f"{r['provider']}_{r['type']}", r['name']))
+        for resource in resources:
+            full_type = f"{resource['provider']}_{resource['type']}"
+            kind = 'resources' if resource['mode'] == 'managed' else 'data-sources'
+            version = lock.get(resource['provider']) or resource['version']
+            url = (f"https://registry.terraform.io/providers/{resource['source']}/"
+                   f"{version}/docs/{kind}/{resource['type']}")
+            prefix = 'data.' if resource['mode'] == 'data' else ''
+            label = self._escape(f"{prefix}{full_type}.{resource['name']}")
+            rows.append([f"[{label}]({url})", 'resource' if resource['mode'] == 'managed' else 'data source'])
+        return self._section('resources', ['Name', 'Type'], rows)
+
+    def render_inputs(self, data):
+        if self.sort_by == 'required':
+            key = lambda v: (not v['required'], v['name'])
+        elif self.sort_by == 'type':
+            key = lambda v: (v['type'], v['name'])
+        else:
+            key = lambda v: v['name']
+
+        header = ['Name', 'Description']
+        if self.settings.get('type'):
+            header.append('Type')
+        if self.settings.get('default'):
+            header.append('Default')
+        if self.settings.get('required'):
+            header.append('Required')
+
+        rows = []
+        for variable in self._sorted(data['inputs'], key):
+            row = [self._name_cell('input', variable['name']), self._description_cell(variable['description'])]
+            if self.settings.get('type'):
+                row.append(self._code_cell(variable['type']))
+            if self.settings.get('default'):
+                if variable['required']:
+                    row.append('n/a')
+                else:
+                    value = variable['default']
+                    indent = 2 if isinstance(value, (dict, list)) and value else None
+                    row.append(self._code_cell(json.dumps(value, indent=indent, ensure_ascii=False)))
+            if self.settings.get('required'):
+                row.append('yes' if variable['required'] else 'no')
+            rows.append(row)
+        return self._section('inputs', header, rows)
+
+    def render_outputs(self, data):
+        rows = [[self._name_cell('output', output['name']), self._description_cell(output['description'])]
+                for output in self._sorted(data['outputs'], lambda o: o['name'])]
+        return self._section('outputs', ['Name', 'Description'], rows)
+
+
+class ModuleCatalog:
+    """模块目录索引
+
+    用 os.scandir 各遍历一次模块目录和示例目录，记录所有包含 .tf 文件的模块目录
+    （任意深度，如 modules/alibabacloudstack/<service>/<service>_<resource>）、
+    残留的 .terraform-docs.yml 本地配置，以及与模块对应的示例目录。
+    清理、生成和同步各阶段都使用这份索引，不再重复遍历目录树。
+    """
+
+    LOCAL_CONFIG = ".terraform-docs.yml"
+    SKIP_DIRS = {'env_vars', '__pycache__'}
+
+    def __init__(self, modules_dir, example_dir=None):
+        self.modules_dir = os.path.normpath(modules_dir)
+        self.example_dir = os.path.normpath(example_dir) if example_dir else None
+        self.modules = {}
+        self.local_configs = []
+        self.examples = {}
+        self.examples_indexed = False
+        self.modules_root = self._modules_root(modules_dir)
+
+    @staticmethod
+    def _modules_root(modules_dir):
+        """返回与示例目录对应的模块根目录（modules/alibabacloudstack）"""
+        normalized = os.path.normpath(modules_dir)
+        marker = os.path.join('modules', 'alibabacloudstack')
+        if marker in normalized:
+            return normalized[:normalized.index(marker) + len(marker)]
+        if 'alibabacloudstack' in normalized:
+            return normalized
+        return os.path.join(normalized, 'alibabacloudstack')
+
+    def build(self, include_examples=False):
+        """遍历目录树建立索引"""
+        self.modules = {}
+        self.local_configs = []
+        self.examples = {}
+
+        for directory, tf_files, has_local_config in self._walk(self.modules_dir):
+            if tf_files:
+                self.modules[directory] = tf_files
+            if has_local_config:
+                self.local_configs.append(os.path.join(directory, self.LOCAL_CONFIG))
+
+        self.examples_indexed = include_examples
+        if include_examples and self.example_dir:
+            for directory, tf_files, _ in self._walk(self.example_dir):
+                if tf_files:
+                    self.examples[os.path.relpath(directory, self.example_dir)] = directory
+        return self
+
+    def _walk(self, top):
+        """按目录名排序深度优先遍历，产出 (目录, .tf 文件名列表, 是否有本地配置)"""
+        stack = [top]
+        while stack:
+            directory = stack.pop()
+            tf_files = []
+            subdirs = []
+            has_local_config = False
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith('.') and entry.name not in self.SKIP_DIRS:
+                                subdirs.append(entry.path)
+                        elif entry.name.endswith('.tf'):
+                            tf_files.append(entry.name)
+                        elif entry.name == self.LOCAL_CONFIG:
+                            has_local_config = True
+            except OSError:
+                continue
+
+            yield directory, sorted(tf_files), has_local_config
+            stack.extend(sorted(subdirs, reverse=True))
+
+    def contains(self, directory):
+        """目录是否位于索引的模块目录树内"""
+        directory = os.path.normpath(directory)
+        return directory == self.modules_dir or directory.startswith(self.modules_dir + os.sep)
+
+    def refresh_directory(self, directory):
+        """重新读取单个目录的 .tf 文件（监听模式下增量更新索引）"""
+        directory = os.path.normpath(directory)
+        try:
+            tf_files = sorted(name for name in os.listdir(directory) if name.endswith('.tf'))
+        except OSError:
+            tf_files = []
+
+        if self.contains(directory):
+            if tf_files:
+                self.modules[directory] = tf_files
+            else:
+                self.modules.pop(directory, None)
+        elif self.example_dir and (directory == self.example_dir
+                                   or directory.startswith(self.example_dir + os.sep)):
+            rel_path = os.path.relpath(directory, self.example_dir)
+            if tf_files:
+                self.examples[rel_path] = directory
+            else:
+                self.examples.pop(rel_path, None)
+        return tf_files
+
+    def module_dirs(self):
+        """所有模块目录（按路径排序）"""
+        return sorted(self.modules)
+
+    def tf_files(self, module_path):
+        """模块目录下的 .tf 文件名，未被索引的目录返回 None"""
+        return self.modules.get(os.path.normpath(module_path))
+
+    def relative_path(self, module_path):
+        """模块相对于模块根目录的路径，如 adb/adb_account"""
+        return os.path.relpath(os.path.normpath(module_path), self.modules_root)
+
+    def example_for(self, module_path):
+        """与模块对应的示例目录，不存在时返回 None"""
+        return self.examples.get(self.relative_path(module_path))
+
+    def module_for_example(self, rel_path):
+        """与示例目录对应的模块目录路径（不保证存在）"""
+        return os.path.join(self.modules_root, rel_path)
+
+
+def _walk_watch_dirs(root):
+    """遍历需要监听的目录（跳过隐藏目录）"""
+    for directory, dirs, _ in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.') and d != '__pycache__')
+        yield directory
+
+
+class InotifyWatcher:
+    """基于 Linux inotify 的 .tf 文件变更监听器（通过 ctypes 调用 libc）"""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT_HEADER = struct.Struct('iIII')
+
+    name = "inotify"
+
+    def __init__(self, roots):
+        if not sys.platform.startswith('linux'):
+            raise OSError("inotify 仅在 Linux 上可用")
+
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self.libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 调用失败")
+
+        self.roots = roots
+        self.watches = {}
+        for root in roots:
+            self._add_tree(root)
+
+    def _add_tree(self, root):
+        """为目录树中的每个目录添加监听，返回其中已有的 .tf 文件"""
+        tf_files = set()
+        for directory in _walk_watch_dirs(root):
+            # 目录可能在遍历过程中被删除（编辑器临时目录、git checkout、rm -rf），直接跳过
+            try:
+                names = os.listdir(directory)
+            except OSError:
+                continue
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), self.WATCH_MASK)
+            if wd >= 0:
+                self.watches[wd] = directory
+            tf_files.update(os.path.join(directory, name) for name in names if name.endswith('.tf'))
+        return tf_files
+
+    def _remove_tree(self, root):
+        """移除目录树（被移出的目录）的监听，对应的 wd 在收到 IN_IGNORED 后清理"""
+        prefix = root + os.sep
+        for wd, directory in list(self.watches.items()):
+            if directory == root or directory.startswith(prefix):
+                self.libc.inotify_rm_watch(self.fd, wd)
+
+    def poll(self, timeout):
+        """等待最多 timeout 秒，返回发生变化的 .tf 文件路径集合"""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        overflow = False
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'replace')
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                # 事件队列溢出，部分事件已丢失，稍后重新扫描整个目录树
+                overflow = True
+                continue
+            if mask & self.IN_IGNORED:
+                # 目录已删除或监听已移除，wd 不再有效
+                self.watches.pop(wd, None)
+                continue
+
+            directory = self.watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, name)
+
+            if mask & self.IN_ISDIR:
+                # 新建或移入的目录（如新生成的模块）需要补充监听
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO) and not name.startswith('.'):
+                    changed.update(self._add_tree(path))
+                elif mask & self.IN_MOVED_FROM:
+                    self._remove_tree(path)
+            elif name.endswith('.tf'):
+                changed.add(path)
+
+        if overflow:
+            # 重新添加监听（已有目录的 wd 不变），并把所有 .tf 文件视为可能变化，
+            # 未变化的模块会命中缓存
+            for root in self.roots:
+                changed.update(self._add_tree(root))
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """通过定期比较 .tf 文件 stat 快照检测变更，inotify 不可用时使用"""
+
+    name = "polling"
+
+    def __init__(self, roots, interval=WATCH_POLL_INTERVAL):
+        self.roots = roots
+        self.interval = interval
+        self.snapshot = self._take_snapshot()
+
+    def _take_snapshot(self):
+        snapshot = {}
+        for root in self.roots:
+            for directory in _walk_watch_dirs(root):
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.name.endswith('.tf') and entry.is_file():
+                                stat = entry.stat()
+                                snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    continue
+        return snapshot
+
+    def poll(self, timeout):
+        """等待最多 timeout 秒，返回发生变化（新增、修改、删除）的 .tf 文件路径集合"""
+        time.sleep(min(timeout, self.interval))
+        snapshot = self._take_snapshot()
+        changed = {path for path in snapshot.keys() | self.snapshot.keys()
+                   if snapshot.get(path) != self.snapshot.get(path)}
+        self.snapshot = snapshot
+        return changed
+
+    def close(self):
+        pass
+
+
+def create_watcher(roots):
+    """优先使用 inotify，不可用时退回轮询"""
+    try:
+        return InotifyWatcher(roots)
+    except (OSError, AttributeError):
+        return PollingWatcher(roots)
+
+
+class DocTarget:
+    """一份文档配置：配置文件、输出文件名以及 native 引擎的渲染器"""
+
+    def __init__(self, config_file, output_file=None):
+        self.config_file = config_file
+        self.output_file = output_file
+        self.readme_name = output_file or 'README.md'
+        self.renderer = None
+        self.config_hash = ''
+
+    @classmethod
+    def parse(cls, spec):
+        """解析命令行中 `CONFIG[=OUTPUT]` 形式的配置参数"""
+        config_file, separator, output_file = spec.partition('=')
+        return cls(config_file, output_file if separator and output_file else None)
+
+    @property
+    def key(self):
+        """在缓存中区分不同配置/输出文件组合的键"""
+        if self.output_file:
+            return f"{self.config_file}={self.output_file}"
+        return self.config_file
+
+    def load(self, engine):
+        """读取配置文件：native 引擎创建渲染器，terraform-docs 引擎只解析输出文件名"""
+        with open(self.config_file, 'rb') as f:
+            self.config_hash = hashlib.sha256(f.read()).hexdigest()
+
+        if engine == ENGINE_NATIVE:
+            self.renderer = NativeDocsRenderer(self.config_file)
+            if self.output_file:
+                self.renderer.output_file = self.output_file
+            self.readme_name = self.renderer.output_file
+        elif not self.output_file:
+            try:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    config = load_simple_yaml(f.read()) or {}
+                self.readme_name = (config.get('output') or {}).get('file') or 'README.md'
+            except ValueError:
+                self.readme_name = 'README.md'
+
+
 class TerraformDocsGenerator:
     """Terraform 文档生成器"""
 
     def __init__(self, modules_dir="modules", config_file=".terraform-docs.yml",
-                 example_dir="example_alibabacloudstack", sync_example_readmes=False):
+                 example_dir="example_alibabacloudstack", sync_example_readmes=False, jobs=None,
+                 cache_file=".terraform-docs-cache.json", use_cache=True, engine=ENGINE_TERRAFORM_DOCS,
+                 sync_mode=SYNC_COPY, watch=False, watch_examples=False, report=None,
+                 report_slowest=REPORT_SLOWEST, changed_since=None, batch=False):
         self.modules_dir = modules_dir
-        self.config_file = config_file
+        config_files = [config_file] if isinstance(config_file, str) else list(config_file)
+        self.targets = [DocTarget.parse(spec) for spec in config_files]
         self.example_dir = example_dir
         self.sync_example_readmes = sync_example_readmes
+        self.jobs = jobs or os.cpu_count() or 1
+        self.engine = engine
+        # terraform-docs --version 的输出，启动时读取一次，作为缓存键的一部分
+        self.terraform_docs_version = ''
+        self.cache_file = cache_file
+        self.use_cache = use_cache
+        self.cache_entries = {}
+        self._cache_lock = threading.Lock()
         self.total_modules = 0
         self.successful_modules = 0
+        self.cached_modules = 0
         self.failed_modules = 0
         self.synced_readmes = 0
+        self.sync_mode = sync_mode
+        self.watch_mode = watch
+        self.watch_examples = watch_examples
+        self.sync_stats = {'copied': 0, 'linked': 0, 'skipped': 0, 'failed': 0}
+        self._sync_lock = threading.Lock()
+        self.catalog = None
+        self.report = report
+        self.report_slowest = report_slowest
+        self.timings = {}
+        self._timings_lock = threading.Lock()
+        self.started_at = time.monotonic()
+        self.changed_since = changed_since
+        self.changed_modules = None
+        self.batch = batch
+        self.batch_results = {}
 
     def print_colored(self, message, color=Colors.ENDC):
         """打印彩色消息"""
         print(f"{color}{message}{Colors.ENDC}")
 
-    def print_emoji(self, emoji, message, color=Colors.ENDC):
-        """打印带表情符号的消息"""
-        print(f"{color}{emoji} {message}{Colors.ENDC}")
+    def print_emoji(self, emoji, message, color=Colors.ENDC, log=None):
+        """打印带表情符号的消息
+
+        指定 log 列表时只把消息追加到列表中，由调用方稍后按顺序输出
+        """
+        self.print_line(f"{color}{emoji} {message}{Colors.ENDC}", log)
+
+    def print_line(self, line, log=None):
+        """打印一行普通文本，或追加到 log 列表"""
+        if log is None:
+            print(line)
+        else:
+            log.append(line)
 
     def check_terraform_docs_installed(self):
         """检查 terraform-docs 是否已安装"""
@@ -58,6 +955,7 @@ class TerraformDocsGenerator:
             result = subprocess.run(['terraform-docs', '--version'],
                                   capture_output=True, text=True)
             if result.returncode == 0:
+                self.terraform_docs_version = result.stdout.strip()
                 return True
         except FileNotFoundError:
             pass
@@ -67,13 +965,307 @@ class TerraformDocsGenerator:
 
     def check_config_file_exists(self):
         """检查全局配置文件是否存在"""
-        if not os.path.isfile(self.config_file):
-            self.print_emoji("❌", f"全局配置文件 {self.config_file} 不存在", Colors.FAIL)
+        for target in self.targets:
+            if not os.path.isfile(target.config_file):
+                self.print_emoji("❌", f"全局配置文件 {target.config_file} 不存在", Colors.FAIL)
+                return False
+        return True
+
+    def config_files_label(self):
+        """用于输出的配置文件列表"""
+        return ", ".join(f"{target.config_file} -> {target.readme_name}" if len(self.targets) > 1
+                         else target.config_file for target in self.targets)
+
+    def prepare_engine(self):
+        """检查文档生成引擎是否可用，并加载每份配置"""
+        if self.engine == ENGINE_TERRAFORM_DOCS and not self.check_terraform_docs_installed():
+            return False
+
+        for target in self.targets:
+            try:
+                target.load(self.engine)
+            except (OSError, ValueError) as e:
+                self.print_emoji("❌", f"无法加载配置文件 {target.config_file}: {str(e)}", Colors.FAIL)
+                return False
+
+        readme_names = [target.readme_name for target in self.targets]
+        if len(set(readme_names)) != len(readme_names):
+            self.print_emoji("❌", "多个配置输出到同一个文件，请使用 CONFIG=OUTPUT 为每个配置指定输出文件名",
+                             Colors.FAIL)
             return False
         return True
 
+    def render_module(self, module_path, target, sources=None, scanned=None):
+        """用当前引擎按一份配置为目录生成文档，成功返回 None，失败返回错误信息
+
+        sources / scanned 用于在多份配置之间共享已读取的 .tf 文件和扫描结果
+        """
+        if self.engine == ENGINE_NATIVE:
+            options = target.renderer.scan_options()
+            if scanned is None:
+                scanned = {}
+            if options not in scanned:
+                scanned[options] = target.renderer.scan_module(module_path, sources)
+            target.renderer.write_module_docs(module_path, scanned[options])
+            self.record_target(module_path, target, exit_code=0)
+            return None
+
+        command = ['terraform-docs', '--config', target.config_file]
+        if target.output_file:
+            command += ['--output-file', target.output_file]
+        result = subprocess.run(command + [module_path], capture_output=True, text=True, timeout=60)
+        self.record_target(module_path, target, exit_code=result.returncode)
+
+        if result.returncode == 0:
+            return None
+        return result.stderr.strip()
+
+    def write_batch_config(self, target, batch_dir, index):
+        """基于配置文件生成开启 recursive 的临时配置，子模块为服务目录下的各个模块目录"""
+        with open(target.config_file, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+
+        # 去掉原有的 recursive 段，其余内容保持不变
+        content = []
+        in_recursive = False
+        for line in lines:
+            if re.match(r'recursive\s*:', line):
+                in_recursive = True
+                continue
+            if in_recursive and (not line.strip() or line[0] in ' \t#'):
+                continue
+            in_recursive = False
+            content.append(line)
+
+        content += ['', 'recursive:', '  enabled: true', '  path: .', '  include-main: false', '']
+        config_path = os.path.join(batch_dir, f"{index}-{os.path.basename(target.config_file)}")
+        with open(config_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(content))
+        return config_path
+
+    def batch_groups(self, module_dirs):
+        """按服务目录分组，返回 {服务目录: [模块目录]}
+
+        只有服务目录本身不是模块、且其下所有模块都在本次处理范围内时才合并，
+        避免 recursive 模式改写范围外的模块
+        """
+        selected = set(module_dirs)
+        children = {}
+        for module_dir in self.catalog.module_dirs():
+            children.setdefault(os.path.dirname(module_dir), []).append(module_dir)
+
+        return {parent: modules for parent, modules in children.items()
+                if len(modules) >= BATCH_MIN_MODULES and self.catalog.tf_files(parent) is None
+                and selected.issuperset(modules)}
+
+    def needs_render(self, module_path, target):
+        """模块的这份配置是否需要重新生成（缓存未命中）"""
+        if not self.use_cache:
+            return True
+        try:
+            _, tf_hash = self.read_module_sources(module_path)
+        except (OSError, UnicodeDecodeError):
+            return True
+        readme_path = os.path.join(module_path, target.readme_name)
+        input_hash = self.module_input_hash(module_path, tf_hash, target)
+        return not self.is_cache_hit(module_path, target, input_hash, readme_path)
+
+    @staticmethod
+    def readme_stat(readme_path):
+        """README 的 (mtime_ns, size)，不存在时返回 None"""
+        try:
+            stat = os.stat(readme_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def run_service_batches(self, module_dirs):
+        """批量模式：每个服务目录每份配置只调用一次 terraform-docs
+
+        成功写出 README 的模块记录到 batch_results，逐个模块处理时直接使用；
+        批量调用失败或未写出 README 的模块退回逐个模块调用。
+        服务目录中需要重新生成的模块少于 BATCH_MIN_MODULES 时不合并调用
+        """
+        groups = self.batch_groups(module_dirs)
+        if not groups:
+            return
+
+        batch_dir = tempfile.mkdtemp(prefix="terraform-docs-batch-")
+        try:
+            batches = []
+            for index, target in enumerate(self.targets):
+                config_path = self.write_batch_config(target, batch_dir, index)
+                for parent, modules in sorted(groups.items()):
+                    stale = [module_dir for module_dir in modules if self.needs_render(module_dir, target)]
+                    if len(stale) >= BATCH_MIN_MODULES:
+                        batches.append((target, config_path, parent, modules, stale))
+
+            if not batches:
+                return
+            self.print_emoji("📦", f"批量模式: {len(batches)} 次 terraform-docs 调用覆盖 "
+                             f"{sum(len(batch[4]) for batch in batches)} 个模块", Colors.OKCYAN)
+
+            workers = max(1, min(self.jobs, len(batches)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for log in executor.map(self._run_service_batch_logged, batches):
+                    for line in log:
+                        print(line)
+        finally:
+            shutil.rmtree(batch_dir, ignore_errors=True)
+
+    def _run_service_batch_logged(self, batch):
+        """运行一次服务目录批量调用并返回日志行"""
+        log = []
+        self.run_service_batch(*batch, log=log)
+        return log
+
+    def run_service_batch(self, target, config_path, parent, modules, stale, log=None):
+        """对一个服务目录运行 recursive 模式的 terraform-docs，并对结果去除重复标题
+
+        recursive 模式会改写服务目录下的所有模块，不需要重新生成（stale 之外）的模块
+        在调用后恢复原有的 README 内容和修改时间
+        """
+        readme_paths = {module_dir: os.path.join(module_dir, target.readme_name) for module_dir in stale}
+        before = {module_dir: self.readme_stat(readme_path) for module_dir, readme_path in readme_paths.items()}
+        preserved = {}
+        for module_dir in modules:
+            if module_dir not in readme_paths:
+                readme_path = os.path.join(module_dir, target.readme_name)
+                preserved[readme_path] = self.read_readme_snapshot(readme_path)
+
+        command = ['terraform-docs', '--config', config_path]
+        if target.output_file:
+            command += ['--output-file', target.output_file]
+
+        started_ns = time.time_ns()
+        started = time.perf_counter()
+        try:
+            result = subprocess.run(command + [parent], capture_output=True, text=True,
+                                    timeout=BATCH_TIMEOUT_PER_MODULE * len(modules))
+            error = None if result.returncode == 0 else (result.stderr.strip() or f"退出码 {result.returncode}")
+        except (OSError, subprocess.TimeoutExpired) as e:
+            error = str(e)
+        share = (time.perf_counter() - started) / len(stale)
+
+        for readme_path, snapshot in preserved.items():
+            self.restore_readme_snapshot(readme_path, snapshot)
+
+        fallback = []
+        for module_dir, readme_path in readme_paths.items():
+            self.record_phase(module_dir, PHASE_RENDER, share)
+            with self._timings_lock:
+                self.module_timing(module_dir)['seconds'] += share
+            stat = self.readme_stat(readme_path)
+            written = stat is not None and (stat != before[module_dir] or stat[0] >= started_ns)
+            if error is not None or not written:
+                fallback.append(module_dir)
+                continue
+
+            # recursive 模式也会改写缓存命中的模块，统一做一次后处理
+            started = time.perf_counter()
+            self.remove_duplicate_headers(readme_path)
+            self.record_phase(module_dir, PHASE_POSTPROCESS, time.perf_counter() - started)
+            self.batch_results[(os.path.normpath(module_dir), target.key)] = True
+
+        label = parent if len(self.targets) == 1 else f"{parent} ({target.readme_name})"
+        if error is not None:
+            self.print_emoji("⚠️", f"{label} 批量生成失败，回退为逐个模块生成", Colors.WARNING, log=log)
+            self.print_line(f"错误信息: {error}", log)
+        elif fallback:
+            self.print_emoji("⚠️", f"{label} 中 {len(fallback)} 个模块未生成文档，回退为逐个模块生成",
+                             Colors.WARNING, log=log)
+        else:
+            self.print_emoji("📦", f"{label} 批量生成 {len(stale)} 个模块", Colors.OKBLUE, log=log)
+
+    @staticmethod
+    def read_readme_snapshot(readme_path):
+        """读取 README 的内容和 (atime_ns, mtime_ns)，不存在时返回 None"""
+        try:
+            with open(readme_path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                return f.read(), (stat.st_atime_ns, stat.st_mtime_ns)
+        except OSError:
+            return None
+
+    @staticmethod
+    def restore_readme_snapshot(readme_path, snapshot):
+        """把 README 恢复为快照（原来不存在时删除）"""
+        try:
+            if snapshot is None:
+                if os.path.exists(readme_path):
+                    os.remove(readme_path)
+                return
+            data, times = snapshot
+            try:
+                with open(readme_path, 'rb') as f:
+                    unchanged = f.read() == data
+            except FileNotFoundError:
+                unchanged = False
+            if not unchanged:
+                tmp_path = f"{readme_path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, readme_path)
+            os.utime(readme_path, ns=times)
+        except OSError:
+            pass
+
+    def build_catalog(self, include_examples=None):
+        """遍历一次模块目录（同步时包括示例目录），建立各阶段共用的索引"""
+        if include_examples is None:
+            include_examples = self.sync_example_readmes or self.changed_since is not None
+        self.catalog = ModuleCatalog(self.modules_dir, self.example_dir)
+        self.catalog.build(include_examples=include_examples)
+        return self.catalog
+
+    def resolve_changed_modules(self):
+        """按 --changed-since 计算需要处理的模块目录集合，未指定时返回 None（处理全部）
+
+        模块目录或对应示例目录下有文件变化的模块会被选中；配置文件变化会影响
+        所有模块，此时退回全量处理。git 出错时抛出 GitChangesError
+        """
+        if self.changed_since is None or self.changed_modules is not None:
+            return self.changed_modules
+
+        paths = git_changes.changed_files(self.changed_since)
+
+        config_files = {os.path.relpath(target.config_file) for target in self.targets}
+        if config_files.intersection(paths):
+            self.print_emoji("🔀", f"自 {self.changed_since} 以来配置文件有变化，处理全部模块", Colors.OKCYAN)
+            self.changed_since = None
+            return None
+
+        if self.catalog is None or not self.catalog.examples_indexed:
+            self.build_catalog(include_examples=True)
+
+        modules = {os.path.relpath(module_dir): module_dir for module_dir in self.catalog.module_dirs()}
+        examples = {os.path.relpath(example_path): rel_path
+                    for rel_path, example_path in self.catalog.examples.items()}
+
+        selected = set()
+        for path in paths:
+            directory = git_changes.owning_directory(path, modules)
+            if directory:
+                selected.add(modules[directory])
+                continue
+
+            directory = git_changes.owning_directory(path, examples)
+            if directory:
+                module_path = self.catalog.module_for_example(examples[directory])
+                if self.catalog.tf_files(module_path) is not None:
+                    selected.add(module_path)
+
+        self.changed_modules = selected
+        self.print_emoji("🔀", f"自 {self.changed_since} 以来 {len(paths)} 个文件变化，"
+                         f"涉及 {len(selected)} 个模块", Colors.OKCYAN)
+        return selected
+
     def has_terraform_files(self, directory):
         """检查目录是否包含 Terraform 文件"""
+        if self.catalog is not None and self.catalog.tf_files(directory) is not None:
+            return True
+        if self.catalog is not None and self.catalog.contains(directory):
+            return False
         tf_files = glob.glob(os.path.join(directory, "*.tf"))
         return len(tf_files) > 0
 
@@ -84,17 +1276,205 @@ class TerraformDocsGenerator:
         if not os.path.exists(self.modules_dir):
             return
 
-        config_files = glob.glob(os.path.join(self.modules_dir, "**", ".terraform-docs.yml"),
-                               recursive=True)
+        if self.catalog is None:
+            self.build_catalog()
 
-        for config_file in config_files:
+        for config_file in self.catalog.local_configs:
             try:
                 os.remove(config_file)
             except OSError:
                 pass
+        self.catalog.local_configs = []
 
         self.print_emoji("✅", "本地配置文件清理完成", Colors.OKGREEN)
 
+    def load_cache(self):
+        """读取增量缓存清单，--no-cache 时忽略已有记录"""
+        self.cache_entries = {}
+        if not self.use_cache or not os.path.isfile(self.cache_file):
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION:
+                self.cache_entries = data.get('modules', {})
+        except (OSError, ValueError) as e:
+            self.print_emoji("⚠️", f"缓存文件 {self.cache_file} 无法读取，将全部重新生成: {str(e)}", Colors.WARNING)
+
+    def save_cache(self):
+        """写回增量缓存清单，同时清理已不存在的模块"""
+        modules = {path: entries for path, entries in self.cache_entries.items()
+                   if os.path.isdir(path)}
+        data = {'version': CACHE_VERSION, 'modules': modules}
+
+        try:
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=1, sort_keys=True)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            self.print_emoji("⚠️", f"缓存文件 {self.cache_file} 写入失败: {str(e)}", Colors.WARNING)
+
+    @staticmethod
+    def hash_file(path):
+        """计算文件内容的 sha256，文件不存在时返回 None"""
+        try:
+            with open(path, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    def read_module_sources(self, module_path):
+        """一次性读取模块的所有 *.tf 文件，返回 ({文件名: 内容}, 内容哈希)"""
+        tf_files = self.catalog.tf_files(module_path) if self.catalog is not None else None
+        if tf_files is None:
+            tf_files = sorted(os.path.basename(path) for path in glob.glob(os.path.join(module_path, "*.tf")))
+
+        sources = {}
+        digest = hashlib.sha256()
+        for name in tf_files:
+            with open(os.path.join(module_path, name), 'rb') as f:
+                data = f.read()
+            digest.update(name.encode() + b'\0' + data + b'\0')
+            sources[name] = data.decode('utf-8')
+        return sources, digest.hexdigest()
+
+    def module_input_hash(self, module_path, tf_hash, target):
+        """计算模块在某份配置下的输入哈希：*.tf 文件、锁文件、配置文件和生成引擎（含版本）"""
+        engine = self.engine
+        if engine == ENGINE_NATIVE:
+            engine = f"{engine}-{NATIVE_RENDERER_VERSION}-scanner-{terraform_hcl.SCANNER_VERSION}"
+        else:
+            # 升级 terraform-docs 后所有模块都需要重新生成
+            engine = f"{engine}-{self.terraform_docs_version}"
+        # Providers 表格中的版本来自 .terraform.lock.hcl
+        lock_hash = self.hash_file(os.path.join(module_path, '.terraform.lock.hcl')) or ''
+        return hashlib.sha256(f"{engine}:{target.config_hash}:{tf_hash}:{lock_hash}".encode()).hexdigest()
+
+    def is_cache_hit(self, module_path, target, input_hash, readme_path):
+        """判断模块的输入和已生成的 README 是否都与缓存一致"""
+        with self._cache_lock:
+            entry = self.cache_entries.get(os.path.normpath(module_path), {}).get(target.key)
+        if not entry or entry.get('inputs') != input_hash or not entry.get('output'):
+            return False
+        # README 缺失时 hash_file 返回 None，不能算作命中
+        return entry['output'] == self.hash_file(readme_path)
+
+    def update_cache(self, module_path, target, input_hash, readme_path):
+        """记录模块本次生成的输入和输出哈希，未生成 README 时清除该记录"""
+        output_hash = self.hash_file(readme_path)
+        module_key = os.path.normpath(module_path)
+        with self._cache_lock:
+            if output_hash is None:
+                entries = self.cache_entries.get(module_key)
+                if entries is not None:
+                    entries.pop(target.key, None)
+                    if not entries:
+                        del self.cache_entries[module_key]
+                return
+            entries = self.cache_entries.setdefault(module_key, {})
+            entries[target.key] = {
+                'inputs': input_hash,
+                'output': output_hash
+            }
+
+    def module_timing(self, module_path):
+        """返回模块的耗时记录（调用方需持有 _timings_lock）"""
+        module_path = os.path.normpath(module_path)
+        entry = self.timings.get(module_path)
+        if entry is None:
+            entry = {
+                'module': module_path,
+                'status': None,
+                'seconds': 0.0,
+                'phases': {PHASE_RENDER: 0.0, PHASE_POSTPROCESS: 0.0, PHASE_SYNC: 0.0},
+                'targets': {}
+            }
+            self.timings[module_path] = entry
+        return entry
+
+    def record_phase(self, module_path, phase, seconds):
+        """累计模块某个阶段的耗时"""
+        with self._timings_lock:
+            self.module_timing(module_path)['phases'][phase] += seconds
+
+    def record_target(self, module_path, target, **values):
+        """记录模块某份配置的状态、退出码、README 大小等"""
+        with self._timings_lock:
+            targets = self.module_timing(module_path)['targets']
+            targets.setdefault(target.key, {}).update(values)
+
+    def record_module(self, module_path, result, seconds):
+        """记录模块的最终结果和生成总耗时"""
+        with self._timings_lock:
+            entry = self.module_timing(module_path)
+            entry['status'] = result
+            entry['seconds'] += seconds
+
+    def module_latencies(self):
+        """所有已生成模块的单模块耗时（秒）"""
+        return [entry['seconds'] for entry in self.timings.values() if entry['status'] is not None]
+
+    def write_report(self):
+        """按 --report 写出每个模块、每个阶段的耗时报告"""
+        if not self.report:
+            return
+
+        report_format, report_path = self.report
+        entries = sorted(self.timings.values(), key=lambda entry: entry['module'])
+        latencies = self.module_latencies()
+        slowest = sorted((entry for entry in entries if entry['status'] is not None),
+                         key=lambda entry: entry['seconds'], reverse=True)[:self.report_slowest]
+
+        def rounded(seconds):
+            return round(seconds, 4)
+
+        modules = []
+        for entry in entries:
+            modules.append({
+                'module': entry['module'],
+                'status': entry['status'],
+                'seconds': rounded(entry['seconds']),
+                'phases': {phase: rounded(seconds) for phase, seconds in entry['phases'].items()},
+                'targets': entry['targets']
+            })
+
+        data = {
+            'version': REPORT_VERSION,
+            'engine': self.engine,
+            'configs': [target.key for target in self.targets],
+            'jobs': self.jobs,
+            'wall_seconds': rounded(time.monotonic() - self.started_at),
+            'totals': {
+                'modules': self.total_modules,
+                'successful': self.successful_modules,
+                'cached': self.cached_modules,
+                'failed': self.failed_modules,
+                'synced_readmes': self.synced_readmes
+            },
+            'phases': {phase: rounded(sum(entry['phases'][phase] for entry in entries))
+                       for phase in (PHASE_RENDER, PHASE_POSTPROCESS, PHASE_SYNC)},
+            'latency': {
+                'p50': rounded(percentile(latencies, 50)),
+                'p95': rounded(percentile(latencies, 95)),
+                'max': rounded(max(latencies, default=0.0))
+            },
+            'slowest': [{'module': entry['module'], 'seconds': rounded(entry['seconds'])} for entry in slowest],
+            'modules': modules
+        }
+
+        try:
+            report_dir = os.path.dirname(report_path)
+            if report_dir:
+                os.makedirs(report_dir, exist_ok=True)
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.write('\n')
+            self.print_emoji("⏱️", f"耗时报告已写入 {report_path} ({report_format})", Colors.OKCYAN)
+        except OSError as e:
+            self.print_emoji("⚠️", f"无法写入耗时报告 {report_path}: {str(e)}", Colors.WARNING)
+
     def remove_duplicate_headers(self, readme_path):
         """移除文档中的重复标题"""
         try:
@@ -122,61 +1502,124 @@ class TerraformDocsGenerator:
             # 如果后处理失败，不影响主要功能
             pass
 
-    def generate_module_docs(self, module_path):
-        """为单个模块生成文档"""
+    def generate_module_docs(self, module_path, log=None):
+        """为单个模块生成文档，返回 RESULT_SUCCESS / RESULT_CACHED / RESULT_FAILED
+
+        并行执行时传入 log 列表收集输出，避免多个模块的日志交错
+        """
+        started = time.perf_counter()
+        result = self._generate_module_docs(module_path, log)
+        self.record_module(module_path, result, time.perf_counter() - started)
+        return result
+
+    def _generate_module_docs(self, module_path, log=None):
+        """generate_module_docs 的实际实现"""
         module_name = os.path.basename(module_path)
-        self.print_emoji("📂", f"处理模块: {module_name}", Colors.OKBLUE)
+        self.print_emoji("📂", f"处理模块: {module_name}", Colors.OKBLUE, log=log)
 
         # 检查是否有 Terraform 文件
         if not self.has_terraform_files(module_path):
-            self.print_emoji("⚠️", f"{module_path} 中没有找到 Terraform 文件，跳过", Colors.WARNING)
-            return True
+            self.print_emoji("⚠️", f"{module_path} 中没有找到 Terraform 文件，跳过", Colors.WARNING, log=log)
+            return RESULT_SUCCESS
+
+        # 模块的 .tf 文件只读取一次，所有配置共用
+        try:
+            sources, tf_hash = self.read_module_sources(module_path)
+        except (OSError, UnicodeDecodeError) as e:
+            self.print_emoji("❌", f"{module_name} 读取 Terraform 文件失败: {str(e)}", Colors.FAIL, log=log)
+            return RESULT_FAILED
+
+        scanned = {}
+        results = []
+        for target in self.targets:
+            results.append(self.generate_target_docs(module_path, target, sources, tf_hash, scanned, log))
+
+        if RESULT_FAILED in results:
+            return RESULT_FAILED
+        if all(result == RESULT_CACHED for result in results):
+            return RESULT_CACHED
+        return RESULT_SUCCESS
+
+    def generate_target_docs(self, module_path, target, sources, tf_hash, scanned, log=None):
+        """按一份配置为模块生成文档"""
+        module_name = os.path.basename(module_path)
+        label = module_name if len(self.targets) == 1 else f"{module_name} ({target.readme_name})"
+        readme_path = os.path.join(module_path, target.readme_name)
+
+        # 输入和输出都未变化时跳过 terraform-docs
+        input_hash = self.module_input_hash(module_path, tf_hash, target)
+        if self.is_cache_hit(module_path, target, input_hash, readme_path):
+            self.print_emoji("♻️", f"{label} 未发生变化，使用缓存", Colors.OKCYAN, log=log)
+            self.record_target(module_path, target, status=RESULT_CACHED,
+                               readme_bytes=os.path.getsize(readme_path) if os.path.exists(readme_path) else None)
+            return RESULT_CACHED
 
         # 生成文档
-        self.print_emoji("📝", f"为 {module_name} 生成文档...")
+        self.print_emoji("📝", f"为 {label} 生成文档...", log=log)
 
         try:
-            result = subprocess.run([
-                'terraform-docs',
-                '--config', self.config_file,
-                module_path
-            ], capture_output=True, text=True, timeout=60)
+            # 批量模式已生成并做过后处理的模块直接使用结果
+            batched = self.batch_results.pop((os.path.normpath(module_path), target.key), False)
+            if batched:
+                error = None
+                self.record_target(module_path, target, exit_code=0, batched=True)
+            else:
+                started = time.perf_counter()
+                try:
+                    error = self.render_module(module_path, target, sources, scanned)
+                finally:
+                    self.record_phase(module_path, PHASE_RENDER, time.perf_counter() - started)
 
-            if result.returncode == 0:
+            if error is None:
                 # 后处理：移除重复标题
-                readme_path = os.path.join(module_path, 'README.md')
-                if os.path.exists(readme_path):
+                if not batched and os.path.exists(readme_path):
+                    started = time.perf_counter()
                     self.remove_duplicate_headers(readme_path)
+                    self.record_phase(module_path, PHASE_POSTPROCESS, time.perf_counter() - started)
 
-                self.print_emoji("✅", f"{module_name} 文档生成成功", Colors.OKGREEN)
-                return True
+                self.update_cache(module_path, target, input_hash, readme_path)
+                self.record_target(module_path, target, status=RESULT_SUCCESS,
+                                   readme_bytes=os.path.getsize(readme_path) if os.path.exists(readme_path) else None)
+                self.print_emoji("✅", f"{label} 文档生成成功", Colors.OKGREEN, log=log)
+                return RESULT_SUCCESS
             else:
-                self.print_emoji("❌", f"{module_name} 文档生成失败", Colors.FAIL)
-                if result.stderr:
-                    print(f"错误信息: {result.stderr.strip()}")
-                return False
+                self.record_target(module_path, target, status=RESULT_FAILED)
+                self.print_emoji("❌", f"{label} 文档生成失败", Colors.FAIL, log=log)
+                if error:
+                    self.print_line(f"错误信息: {error}", log)
+                return RESULT_FAILED
 
         except subprocess.TimeoutExpired:
-            self.print_emoji("❌", f"{module_name} 文档生成超时", Colors.FAIL)
-            return False
+            self.record_target(module_path, target, status="timeout")
+            self.print_emoji("❌", f"{label} 文档生成超时", Colors.FAIL, log=log)
+            return RESULT_FAILED
         except Exception as e:
-            self.print_emoji("❌", f"{module_name} 文档生成异常: {str(e)}", Colors.FAIL)
-            return False
+            self.record_target(module_path, target, status="error")
+            self.print_emoji("❌", f"{label} 文档生成异常: {str(e)}", Colors.FAIL, log=log)
+            return RESULT_FAILED
+
+    def count_result(self, result):
+        """累计单个模块的生成结果"""
+        self.total_modules += 1
+        if result == RESULT_SUCCESS:
+            self.successful_modules += 1
+        elif result == RESULT_CACHED:
+            self.cached_modules += 1
+        else:
+            self.failed_modules += 1
 
     def process_root_directory(self):
         """处理根目录（如果有 Terraform 文件）"""
+        # --changed-since 只处理有变化的模块
+        if self.changed_modules is not None:
+            return
+
         if self.has_terraform_files("."):
             self.print_emoji("📂", "处理根目录", Colors.OKBLUE)
             self.total_modules += 1
 
             try:
-                result = subprocess.run([
-                    'terraform-docs',
-                    '--config', self.config_file,
-                    '.'
-                ], capture_output=True, text=True, timeout=60)
-
-                if result.returncode == 0:
+                if all(self.render_module('.', target) is None for target in self.targets):
                     self.print_emoji("✅", "根目录文档生成成功", Colors.OKGREEN)
                     self.successful_modules += 1
                 else:
@@ -187,31 +1630,117 @@ class TerraformDocsGenerator:
                 self.print_emoji("❌", f"根目录文档生成异常: {str(e)}", Colors.FAIL)
                 self.failed_modules += 1
 
-    def sync_readme_to_example(self, modules_path, example_path):
-        """将模块的README.md同步到example目录"""
-        modules_readme = os.path.join(modules_path, 'README.md')
-        example_readme = os.path.join(example_path, 'README.md')
-
-        # 检查源README.md是否存在
-        if not os.path.exists(modules_readme):
-            self.print_emoji("⚠️", f"源README.md不存在: {modules_readme}", Colors.WARNING)
-            self.print_emoji("💡", f"请先为模块生成README.md文档", Colors.WARNING)
+    def files_identical(self, source, target):
+        """先比较大小，再比较内容哈希，判断两个文件是否相同"""
+        try:
+            if os.path.getsize(source) != os.path.getsize(target):
+                return False
+        except OSError:
             return False
+        return self.hash_file(source) == self.hash_file(target)
 
+    def sync_file(self, source, target):
+        """按同步方式把 source 同步到 target，返回 copied / linked / skipped
+
+        已经相同的文件不会重写；链接方式下只有 target 已指向 source 才跳过。
+        无法创建链接时（跨文件系统、文件系统或权限不支持）回退为复制。
+        新文件先写到临时路径再原子替换，避免中途失败留下半个文件。
+        """
+        if self.sync_mode == SYNC_SYMLINK:
+            link = os.path.relpath(source, os.path.dirname(target))
+            if os.path.islink(target) and os.readlink(target) == link:
+                return 'skipped'
+        elif self.sync_mode == SYNC_HARDLINK:
+            if os.path.exists(target) and os.path.samefile(source, target):
+                return 'skipped'
+        elif not os.path.islink(target) and self.files_identical(source, target):
+            return 'skipped'
+
+        tmp_target = f"{target}.sync-tmp"
+        if os.path.lexists(tmp_target):
+            os.remove(tmp_target)
+        outcome = 'copied' if self.sync_mode == SYNC_COPY else 'linked'
+        try:
+            try:
+                if self.sync_mode == SYNC_SYMLINK:
+                    os.symlink(link, tmp_target)
+                elif self.sync_mode == SYNC_HARDLINK:
+                    os.link(source, tmp_target)
+                else:
+                    shutil.copy2(source, tmp_target)
+            except OSError:
+                if self.sync_mode == SYNC_COPY:
+                    raise
+                # 回退为复制，上次回退复制的内容相同时同样跳过
+                if not os.path.islink(target) and self.files_identical(source, target):
+                    return 'skipped'
+                shutil.copy2(source, tmp_target)
+                outcome = 'copied'
+            os.replace(tmp_target, target)
+        finally:
+            if os.path.lexists(tmp_target):
+                os.remove(tmp_target)
+        return outcome
+
+    def record_sync(self, outcome):
+        """累计同步结果"""
+        with self._sync_lock:
+            self.sync_stats[outcome] += 1
+
+    def sync_readme_to_example(self, modules_path, example_path, log=None):
+        """将模块生成的文档（每份配置一个文件）同步到example目录"""
+        started = time.perf_counter()
+        try:
+            return self._sync_readme_to_example(modules_path, example_path, log)
+        finally:
+            self.record_phase(modules_path, PHASE_SYNC, time.perf_counter() - started)
+
+    def _sync_readme_to_example(self, modules_path, example_path, log=None):
+        """sync_readme_to_example 的实际实现"""
         # 检查目标目录是否存在
         if not os.path.exists(example_path):
-            self.print_emoji("⚠️", f"目标示例目录不存在: {example_path}", Colors.WARNING)
+            self.print_emoji("⚠️", f"目标示例目录不存在: {example_path}", Colors.WARNING, log=log)
             return False
 
-        try:
-            # 执行同步操作
-            self.print_emoji("📋", f"正在同步: {modules_readme} -> {example_readme}", Colors.OKCYAN)
-            shutil.copy2(modules_readme, example_readme)
-            self.print_emoji("✅", f"同步成功: {os.path.basename(example_path)}", Colors.OKGREEN)
-            return True
-        except Exception as e:
-            self.print_emoji("❌", f"同步失败: {str(e)}", Colors.FAIL)
-            return False
+        success = True
+        for readme_name in dict.fromkeys(target.readme_name for target in self.targets):
+            modules_readme = os.path.join(modules_path, readme_name)
+            example_readme = os.path.join(example_path, readme_name)
+
+            # 检查源文档是否存在
+            if not os.path.exists(modules_readme):
+                self.print_emoji("⚠️", f"源{readme_name}不存在: {modules_readme}", Colors.WARNING, log=log)
+                self.print_emoji("💡", f"请先为模块生成{readme_name}文档", Colors.WARNING, log=log)
+                self.record_sync('failed')
+                success = False
+                continue
+
+            try:
+                # 执行同步操作
+                outcome = self.sync_file(modules_readme, example_readme)
+                self.record_sync(outcome)
+                if outcome == 'skipped':
+                    self.print_emoji("♻️", f"内容相同，跳过: {example_readme}", Colors.OKCYAN, log=log)
+                else:
+                    self.print_emoji("📋", f"已{'复制' if outcome == 'copied' else '链接'}: "
+                                     f"{modules_readme} -> {example_readme}", Colors.OKCYAN, log=log)
+            except Exception as e:
+                self.print_emoji("❌", f"同步失败: {str(e)}", Colors.FAIL, log=log)
+                self.record_sync('failed')
+                success = False
+
+        return success
+
+    def _sync_example_logged(self, pair):
+        """同步一对模块/示例目录并返回 (是否成功, 日志行)"""
+        rel_path, modules_path, example_path = pair
+        log = []
+        success = self.sync_readme_to_example(modules_path, example_path, log)
+        if success:
+            self.print_emoji("✅", f"已同步 {rel_path} 的README.md", Colors.OKGREEN, log=log)
+        else:
+            self.print_emoji("⚠️", f"同步 {rel_path} 的README.md失败", Colors.WARNING, log=log)
+        return success, log
 
     def sync_all_example_readmes(self):
         """同步所有模块的README.md到example目录"""
@@ -219,10 +1748,20 @@ class TerraformDocsGenerator:
             self.print_emoji("❌", f"示例目录 '{self.example_dir}' 不存在", Colors.FAIL)
             return False
 
-        self.print_emoji("🔄", f"开始同步README.md到 {self.example_dir}", Colors.OKCYAN)
+        self.print_emoji("🔄", f"开始同步README.md到 {self.example_dir} (方式: {self.sync_mode})", Colors.OKCYAN)
         self.print_emoji("📂", f"从模块目录: {self.modules_dir}", Colors.OKCYAN)
 
-        synced_count = 0
+        if self.catalog is None or not self.catalog.examples_indexed:
+            self.build_catalog(include_examples=True)
+
+        try:
+            changed = self.resolve_changed_modules()
+        except git_changes.GitChangesError as e:
+            self.print_emoji("❌", f"无法获取变更文件: {str(e)}", Colors.FAIL)
+            return False
+
+        # 先收集需要同步的 (相对路径, 模块目录, 示例目录)
+        pairs = []
         total_count = 0
 
         # 检查是否指定了具体的单个模块目录
@@ -232,57 +1771,50 @@ class TerraformDocsGenerator:
 
             # 计算相对路径 - 从modules/alibabacloudstack开始
             if 'modules/alibabacloudstack' in self.modules_dir:
-                # 提取alibabacloudstack之后的路径部分
-                rel_path = self.modules_dir.split('modules/alibabacloudstack/')[-1]
-                example_path = os.path.join(self.example_dir, rel_path)
+                rel_path = self.catalog.relative_path(self.modules_dir)
+                example_path = self.catalog.example_for(self.modules_dir)
 
-                if os.path.exists(example_path):
+                if example_path:
                     total_count = 1
-                    if self.sync_readme_to_example(self.modules_dir, example_path):
-                        synced_count = 1
-                        self.print_emoji("✅", f"已同步 {rel_path} 的README.md", Colors.OKGREEN)
-                    else:
-                        self.print_emoji("⚠️", f"同步 {rel_path} 的README.md失败", Colors.WARNING)
+                    pairs.append((rel_path, self.modules_dir, example_path))
                 else:
-                    self.print_emoji("⚠️", f"未找到��应的示例目录: {example_path}", Colors.WARNING)
+                    example_path = os.path.join(self.example_dir, rel_path)
+                    self.print_emoji("⚠️", f"未找到对应的示例目录: {example_path}", Colors.WARNING)
             else:
                 self.print_emoji("⚠️", f"指定的模块目录格式不正确，应该在 modules/alibabacloudstack/ 下", Colors.WARNING)
         else:
-            # 处理多个模块的情况（原有逻辑）
-            # 遍历example目录下的所有模块
-            for root, dirs, files in os.walk(self.example_dir):
-                # 跳过env_vars目录
-                if 'env_vars' in root:
-                    continue
+            # 处理多个模块的情况：遍历索引中的所有示例目录
+            total_count = len(self.catalog.examples)
+            for rel_path, example_path in sorted(self.catalog.examples.items()):
+                # 构建对应的modules路径
+                modules_path = self.catalog.module_for_example(rel_path)
+
+                if self.catalog.tf_files(modules_path) is not None or os.path.exists(modules_path):
+                    pairs.append((rel_path, modules_path, example_path))
+                else:
+                    self.print_emoji("⚠️", f"未找到对应的模块目录: {modules_path}", Colors.WARNING)
 
-                # 检查是否是模块目录（包含.tf文件）
-                tf_files = [f for f in files if f.endswith('.tf')]
-                if not tf_files:
-                    continue
+        # --changed-since：只同步有变化的模块
+        if changed is not None:
+            pairs = [pair for pair in pairs if os.path.normpath(pair[1]) in changed]
+            total_count = len(pairs)
 
-                total_count += 1
+        synced_count = 0
 
-                # 构���对应的modules路径
-                rel_path = os.path.relpath(root, self.example_dir)
-                # 根据modules_dir的配置来构建正确的路径
-                if 'alibabacloudstack' in self.modules_dir:
-                    # 如果modules_dir已经包含alibabacloudstack，直接使用
-                    modules_path = os.path.join(self.modules_dir, rel_path)
-                else:
-                    # 如果modules_dir是通用的modules目录，则添加alibabacloudstack
-                    modules_path = os.path.join(self.modules_dir, 'alibabacloudstack', rel_path)
-
-                if os.path.exists(modules_path):
-                    if self.sync_readme_to_example(modules_path, root):
-                        synced_count += 1
-                        self.print_emoji("✅", f"已同步 {rel_path} 的README.md", Colors.OKGREEN)
-                    else:
-                        self.print_emoji("⚠️", f"同步 {rel_path} 的README.md失败", Colors.WARNING)
-                else:
-                    self.print_emoji("⚠️", f"未找到对应的模块目录: {modules_path}", Colors.WARNING)
+        # 在小线程池中同步，结果按相对路径顺序输出
+        workers = max(1, min(SYNC_WORKERS, self.jobs, len(pairs)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for success, log in executor.map(self._sync_example_logged, pairs):
+                for line in log:
+                    print(line)
+                if success:
+                    synced_count += 1
 
         self.synced_readmes = synced_count
-        self.print_emoji("📊", f"README同步完成: {synced_count}/{total_count}", Colors.HEADER)
+        stats = self.sync_stats
+        self.print_emoji("📊", f"README同步完成: {synced_count}/{total_count} "
+                         f"(复制: {stats['copied']}, 链接: {stats['linked']}, "
+                         f"跳过: {stats['skipped']}, 失败: {stats['failed']})", Colors.HEADER)
         return True
 
     def scan_modules(self):
@@ -292,49 +1824,98 @@ class TerraformDocsGenerator:
             return False
 
         self.print_emoji("🔍", f"扫描模块目录: {self.modules_dir}", Colors.OKCYAN)
-        self.print_emoji("📋", f"使用全局配置文件: {self.config_file}", Colors.OKCYAN)
+        self.print_emoji("📋", f"使用全局配置文件: {self.config_files_label()}", Colors.OKCYAN)
+
+        if self.catalog is None:
+            self.build_catalog()
+
+        try:
+            changed = self.resolve_changed_modules()
+        except git_changes.GitChangesError as e:
+            self.print_emoji("❌", f"无法获取变更文件: {str(e)}", Colors.FAIL)
+            return False
 
         # 检查指定目录本身是否是一个模块
         if self.has_terraform_files(self.modules_dir):
             self.print_emoji("📂", f"检测到单个模块: {os.path.basename(self.modules_dir)}", Colors.OKBLUE)
-            self.total_modules += 1
-
-            if self.generate_module_docs(self.modules_dir):
-                self.successful_modules += 1
-            else:
-                self.failed_modules += 1
+            if changed is not None and os.path.normpath(self.modules_dir) not in changed:
+                self.print_emoji("♻️", f"{os.path.basename(self.modules_dir)} 没有变化，跳过", Colors.OKCYAN)
+                return True
+            self.load_cache()
+            self.count_result(self.generate_module_docs(self.modules_dir))
+            self.save_cache()
 
             return True
 
-        # 获取所有模块目录
-        module_dirs = [d for d in glob.glob(os.path.join(self.modules_dir, "*"))
-                      if os.path.isdir(d)]
+        # 获取所有模块目录（任意深度，如 <service>/<service>_<resource>）
+        module_dirs = self.catalog.module_dirs()
 
         if not module_dirs:
             self.print_emoji("⚠️", f"在 {self.modules_dir} 中未找到任何模块目录", Colors.WARNING)
             return True
 
-        # 处理每个模块
-        for module_dir in sorted(module_dirs):
-            self.total_modules += 1
+        # --changed-since：只处理有变化的模块
+        if changed is not None:
+            module_dirs = [module_dir for module_dir in module_dirs if module_dir in changed]
+            if not module_dirs:
+                self.print_emoji("♻️", "没有需要重新生成的模块", Colors.OKCYAN)
+                return True
+        if self.jobs > 1 and len(module_dirs) > 1:
+            self.print_emoji("⚡", f"并行处理 {len(module_dirs)} 个模块 (jobs={self.jobs})", Colors.OKCYAN)
 
-            if self.generate_module_docs(module_dir):
-                self.successful_modules += 1
-            else:
-                self.failed_modules += 1
+        self.load_cache()
+
+        # 批量模式：先按服务目录合并调用 terraform-docs
+        if self.batch:
+            self.run_service_batches(module_dirs)
 
+        # 处理每个模块，结果按模块路径排序输出
+        for result, log in self.run_module_jobs(module_dirs):
+            self.count_result(result)
+
+            for line in log:
+                print(line)
             print()  # 添加空行分隔
 
+        # 批量结果只在本次运行中有效（监听模式会复用生成器）
+        self.batch_results.clear()
+        self.save_cache()
         return True
 
+    def _generate_module_docs_logged(self, module_path):
+        """生成模块文档并返回 (生成结果, 日志行)"""
+        log = []
+        result = self.generate_module_docs(module_path, log)
+        return result, log
+
+    def run_module_jobs(self, module_dirs):
+        """使用线程池并行生成模块文档
+
+        terraform-docs 运行在子进程中，线程只负责等待，因此线程池即可占满多核。
+        结果按 module_dirs 的顺序逐个返回，保证日志输出稳定可比对。
+        """
+        workers = min(self.jobs, len(module_dirs))
+        if workers <= 1:
+            for module_dir in module_dirs:
+                yield self._generate_module_docs_logged(module_dir)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(self._generate_module_docs_logged, module_dirs)
+
     def print_statistics(self):
         """输出统��结果"""
         print("=" * 20)
         self.print_emoji("📊", "生成结果统计:", Colors.HEADER)
         print(f"   总模块数: {self.total_modules}")
         print(f"   成功: {self.successful_modules}")
+        print(f"   缓存: {self.cached_modules}")
         print(f"   失败: {self.failed_modules}")
-        print(f"   配置文件: {self.config_file}")
+        print(f"   配置文件: {self.config_files_label()}")
+        latencies = self.module_latencies()
+        if latencies:
+            print(f"   单模块耗时: p50 {percentile(latencies, 50):.3f}s / "
+                  f"p95 {percentile(latencies, 95):.3f}s / max {max(latencies):.3f}s")
         print("=" * 20)
 
         if self.failed_modules == 0:
@@ -344,9 +1925,89 @@ class TerraformDocsGenerator:
             self.print_emoji("⚠️", "部分模块文档生成失败，请检查错误信息", Colors.WARNING)
             return False
 
+    def watch(self):
+        """监听模式：.tf 文件变化时只重新生成并同步受影响的模块
+
+        启动时的检查（配置文件、生成引擎）只执行一次，之后每次重新生成都复用
+        """
+        roots = [self.modules_dir]
+        if self.watch_examples and os.path.isdir(self.example_dir):
+            roots.append(self.example_dir)
+
+        self.build_catalog(include_examples=True)
+        self.load_cache()
+        watcher = create_watcher(roots)
+        self.print_emoji("👀", f"开始监听 {', '.join(roots)} 中的 .tf 文件变化 "
+                         f"({watcher.name})，按 Ctrl+C 退出", Colors.HEADER)
+
+        try:
+            while True:
+                changed = watcher.poll(1.0)
+                if not changed:
+                    continue
+
+                # 合并编辑器连续保存产生的多个事件
+                started = time.monotonic()
+                quiet_until = started + WATCH_DEBOUNCE
+                while time.monotonic() < min(quiet_until, started + WATCH_MAX_DELAY):
+                    more = watcher.poll(max(0.0, min(quiet_until, started + WATCH_MAX_DELAY) - time.monotonic()))
+                    if more:
+                        changed |= more
+                        quiet_until = time.monotonic() + WATCH_DEBOUNCE
+
+                self.handle_changes(changed)
+        except KeyboardInterrupt:
+            self.print_emoji("👋", "停止监听", Colors.OKCYAN)
+        finally:
+            watcher.close()
+            self.save_cache()
+
+    def handle_changes(self, changed_files):
+        """根据变化的 .tf 文件重新生成并同步对应模块"""
+        modules = set()
+        examples = set()
+        for path in changed_files:
+            directory = os.path.dirname(os.path.normpath(path))
+            tf_files = self.catalog.refresh_directory(directory)
+            if self.catalog.contains(directory):
+                if tf_files:
+                    modules.add(directory)
+            elif tf_files:
+                examples.add(self.catalog.module_for_example(os.path.relpath(directory, self.example_dir)))
+
+        if not modules and not examples:
+            return
+
+        self.print_emoji("🔁", f"检测到 {len(changed_files)} 个文件变化，重新生成 {len(modules)} 个模块，"
+                         f"同步 {len(modules | examples)} 个示例", Colors.OKCYAN)
+
+        for result, log in self.run_module_jobs(sorted(modules)):
+            self.count_result(result)
+            for line in log:
+                print(line)
+        self.save_cache()
+
+        # 同步到示例目录（仅限已有对应示例目录的模块）
+        for module_path in sorted(modules | examples):
+            example_path = self.catalog.example_for(module_path)
+            if example_path:
+                rel_path = self.catalog.relative_path(module_path)
+                _, log = self._sync_example_logged((rel_path, module_path, example_path))
+                for line in log:
+                    print(line)
+        print()
+
     def run(self):
         """主执行函数"""
         try:
+            if self.watch_mode:
+                # 启动检查只执行一次，监听期间复用
+                if not self.check_config_file_exists() or not self.prepare_engine():
+                    sys.exit(1)
+                self.clean_local_configs()
+                self.watch()
+                sys.exit(0)
+
             if self.sync_example_readmes:
                 self.print_emoji("🚀", "开始生成文档并同步到示例目录...", Colors.HEADER)
 
@@ -354,14 +2015,14 @@ class TerraformDocsGenerator:
                 if self.modules_dir != "modules/alibabacloudstack":
                     self.print_emoji("📝", "第一步：生成模块文档...", Colors.OKCYAN)
 
-                    # 检查 terraform-docs 是否安装
-                    if not self.check_terraform_docs_installed():
-                        sys.exit(1)
-
                     # 检查配置文件是否存在
                     if not self.check_config_file_exists():
                         sys.exit(1)
 
+                    # 检查文档生成引擎（terraform-docs 是否安装 / native 配置是否可用）
+                    if not self.prepare_engine():
+                        sys.exit(1)
+
                     # 清理本地配置文件
                     self.clean_local_configs()
 
@@ -376,18 +2037,19 @@ class TerraformDocsGenerator:
                     self.print_emoji("🎉", f"文档生成和同步完成！共同步了 {self.synced_readmes} 个文件", Colors.OKGREEN)
                 else:
                     self.print_emoji("❌", "同步失败", Colors.FAIL)
+                self.write_report()
                 sys.exit(0 if success else 1)
             else:
                 self.print_emoji("🚀", "开始生成 Terraform 文档...", Colors.HEADER)
 
-                # 检查 terraform-docs 是否安装
-                if not self.check_terraform_docs_installed():
-                    sys.exit(1)
-
                 # 检查配置文件是否存在
                 if not self.check_config_file_exists():
                     sys.exit(1)
 
+                # 检查文档生成引擎（terraform-docs 是否安装 / native 配置是否可用）
+                if not self.prepare_engine():
+                    sys.exit(1)
+
                 # 清理本地配置文件
                 self.clean_local_configs()
 
@@ -400,6 +2062,7 @@ class TerraformDocsGenerator:
 
                 # 输出统计结果
                 success = self.print_statistics()
+                self.write_report()
 
                 sys.exit(0 if success else 1)
         except Exception as e:
@@ -418,14 +2081,27 @@ def main():
 示例:
   python3 generate-docs.py                              # 使用默认配置
   python3 generate-docs.py --config config/chinese-docs.yml  # 使用中文配置
+  python3 generate-docs.py --config config/english-docs.yml config/chinese-docs.yml=README.zh-CN.md
+                                                        # 一次生成中英文文档
   python3 generate-docs.py --modules-dir my-modules     # 指定模块目录
+  python3 generate-docs.py --jobs 8                     # 8 个模块并行生成
+  python3 generate-docs.py --no-cache                   # 忽略缓存，全部重新生成
+  python3 generate-docs.py --engine native              # 使用内置渲染器，无需 terraform-docs
+  python3 generate-docs.py --watch                      # 监听 .tf 变化并增量生成
+  python3 generate-docs.py --report json build/docs-report.json
+                                                        # 输出每个模块、每个阶段的耗时报告
+  python3 generate-docs.py --changed-since origin/main  # 只处理相对 origin/main 有变化的模块
+  python3 generate-docs.py --batch                      # 每个服务目录只调用一次 terraform-docs
         """
     )
 
     parser.add_argument(
         '--config',
-        default='.terraform-docs.yml',
-        help='指定配置文件路径 (默认: .terraform-docs.yml)'
+        nargs='+',
+        default=['.terraform-docs.yml'],
+        metavar='CONFIG[=OUTPUT]',
+        help='指定配置文件路径，可指定多个并用 =OUTPUT 设置各自的输出文件名，'
+             '所有配置在同一次扫描中生成 (默认: .terraform-docs.yml)'
     )
 
     parser.add_argument(
@@ -440,13 +2116,106 @@ def main():
         help='同步模块的 README.md 到example目录'
     )
 
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='并行处理的模块数 (默认: CPU 核数，1 表示串行)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='忽略增量缓存，强制为所有模块重新生成文档'
+    )
+
+    parser.add_argument(
+        '--cache-file',
+        default='.terraform-docs-cache.json',
+        help='增量缓存文件路径 (默认: .terraform-docs-cache.json)'
+    )
+
+    parser.add_argument(
+        '--engine',
+        choices=[ENGINE_TERRAFORM_DOCS, ENGINE_NATIVE],
+        default=ENGINE_TERRAFORM_DOCS,
+        help='文档生成引擎 (terraform-docs: 调用 terraform-docs, native: 内置渲染器，无需安装 terraform-docs)'
+    )
+
+    parser.add_argument(
+        '--sync-mode',
+        choices=[SYNC_COPY, SYNC_HARDLINK, SYNC_SYMLINK],
+        default=SYNC_COPY,
+        help='README 同步到示例目录的方式 (copy: 复制, hardlink: 硬链接, symlink: 符号链接, 默认: copy)'
+    )
+
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='持续监听模块目录，.tf 文件变化时只重新生成并同步受影响的模块'
+    )
+
+    parser.add_argument(
+        '--watch-examples',
+        action='store_true',
+        help='监听模式下同时监听示例目录，示例 .tf 变化时重新同步对应 README'
+    )
+
+    parser.add_argument(
+        '--report',
+        nargs=2,
+        metavar=('FORMAT', 'PATH'),
+        help='写出每个模块、每个阶段（terraform-docs、去重标题、同步）的耗时报告，'
+             f'FORMAT 目前支持: {", ".join(REPORT_FORMATS)}'
+    )
+
+    parser.add_argument(
+        '--report-slowest',
+        type=int,
+        default=REPORT_SLOWEST,
+        metavar='N',
+        help=f'耗时报告中列出的最慢模块数 (默认: {REPORT_SLOWEST})'
+    )
+
+    parser.add_argument(
+        '--changed-since',
+        metavar='REF',
+        help='只生成并同步自 git 引用 REF 以来有文件变化的模块（使用本地 git diff，不访问远程）'
+    )
+
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='批量模式：每个服务目录只调用一次 terraform-docs（recursive），失败时回退为逐个模块调用'
+    )
+
     args = parser.parse_args()
 
+    if args.batch and args.engine != ENGINE_TERRAFORM_DOCS:
+        parser.error('--batch 只适用于 --engine terraform-docs')
+
+    if args.report and args.report[0] not in REPORT_FORMATS:
+        parser.error(f'--report 格式必须是: {", ".join(REPORT_FORMATS)}')
+
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs 必须大于等于 1')
+
     # 创建生成器实例并运行
     generator = TerraformDocsGenerator(
         modules_dir=args.modules_dir,
         config_file=args.config,
-        sync_example_readmes=args.sync_example_readmes
+        sync_example_readmes=args.sync_example_readmes,
+        jobs=args.jobs,
+        cache_file=args.cache_file,
+        use_cache=not args.no_cache,
+        engine=args.engine,
+        sync_mode=args.sync_mode,
+        watch=args.watch,
+        watch_examples=args.watch_examples,
+        report=args.report,
+        report_slowest=args.report_slowest,
+        changed_since=args.changed_since,
+        batch=args.batch
     )
 
     generator.run()
@@ -3,15 +3,108 @@
 
 """
 主目录 README.md 生成脚本
-基于 terraform-docs 提取模块信息，生成项目主目录的 README.md
+基于内置 HCL 扫描器（或 terraform-docs）提取模块信息，生成项目主目录的 README.md
 支持中英文双语生成
 """
 
+import io
 import os
+import re
 import sys
+import glob
+import asyncio
+import hashlib
+import shutil
+import sqlite3
 import subprocess
 import json
+import tempfile
 from datetime import datetime
+from itertools import zip_longest
+
+import terraform_hcl
+import git_changes
+
+# 模块信息提取方式
+EXTRACTOR_NATIVE = "native"
+EXTRACTOR_TERRAFORM_DOCS = "terraform-docs"
+EXTRACTOR_CROSS_CHECK = "cross-check"
+
+# 单次 terraform-docs json 调用的超时时间（秒）
+TERRAFORM_DOCS_TIMEOUT = 30
+
+# 输出布局：single 为一个 README 表格，sharded 为每个服务一页加顶层汇总
+LAYOUT_SINGLE = "single"
+LAYOUT_SHARDED = "sharded"
+# 服务目录页的首行标记，只有带此标记的页面才会在服务消失时被删除
+CATALOG_PAGE_MARKER = "<!-- Generated by generate-main-readme.py. Do not edit. -->"
+
+# 机器可读目录的文件名
+CATALOG_JSON_FILE = "catalog.json"
+CATALOG_SQLITE_FILE = "catalog.sqlite"
+CATALOG_VERSION = 1
+
+CATALOG_SCHEMA = """
+CREATE TABLE modules (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    path TEXT NOT NULL,
+    description TEXT,
+    description_en TEXT,
+    terraform_version TEXT,
+    inputs_count INTEGER NOT NULL,
+    outputs_count INTEGER NOT NULL,
+    resources_count INTEGER NOT NULL
+);
+CREATE TABLE inputs (
+    module_id INTEGER NOT NULL REFERENCES modules(id),
+    name TEXT NOT NULL,
+    type TEXT,
+    required INTEGER NOT NULL,
+    description TEXT
+);
+CREATE TABLE outputs (
+    module_id INTEGER NOT NULL REFERENCES modules(id),
+    name TEXT NOT NULL,
+    description TEXT
+);
+CREATE TABLE providers (
+    module_id INTEGER NOT NULL REFERENCES modules(id),
+    name TEXT NOT NULL
+);
+CREATE TABLE resources (
+    module_id INTEGER NOT NULL REFERENCES modules(id),
+    type TEXT NOT NULL,
+    name TEXT,
+    mode TEXT
+);
+CREATE INDEX idx_inputs_name ON inputs(name, required);
+CREATE INDEX idx_inputs_type ON inputs(type);
+CREATE INDEX idx_inputs_module ON inputs(module_id);
+CREATE INDEX idx_outputs_name ON outputs(name);
+CREATE INDEX idx_outputs_module ON outputs(module_id);
+CREATE INDEX idx_providers_name ON providers(name);
+CREATE INDEX idx_resources_type ON resources(type);
+CREATE INDEX idx_resources_module ON resources(module_id);
+"""
+
+# 模块元数据缓存文件名与结构版本，结构变化时递增
+METADATA_CACHE_FILE = "module-metadata.sqlite"
+METADATA_CACHE_VERSION = 1
+
+# 模块表格的表头
+TABLE_HEADER_EN = ("| Module | Description | Inputs | Outputs | Resources | Status |\n"
+                   "|--------|-------------|---------|---------|-----------|--------|\n")
+TABLE_HEADER_CN = ("| 模块名称 | 描述 | 输入参数 | 输出参数 | 资源数量 | 状态 |\n"
+                   "|--------|------|----------|----------|----------|------|\n")
+NO_MODULES_EN = "No modules available."
+NO_MODULES_CN = "暂无可用模块。"
+
+# 已有 README 中的模块表格行：| [名称](链接) | 描述 | 输入 | 输出 | 资源 | 状态 |
+TABLE_ROW_RE = re.compile(r'^\| \[(?P<name>[^\]]+)\]\([^)]*\) \| (?P<description>.*) \| (?P<inputs>\d+) \| '
+                          r'(?P<outputs>\d+) \| (?P<resources>\d+) \| (?P<status>[^|]*) \|$', re.M)
+# README 中的更新日期
+UPDATED_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}\s*$')
 
 
 class Colors:
@@ -26,12 +119,137 @@ class Colors:
     BOLD = '\033[1m'
 
 
+class ModuleRecord:
+    """单个模块的元数据
+
+    使用 __slots__ 保持每条记录的内存占用固定，上万个模块时也不会膨胀。
+    inputs / outputs / resources 为 None 表示明细未知（例如从已有 README 表格复用的行）
+    """
+
+    __slots__ = ('name', 'path', 'description', 'description_en', 'version', 'providers',
+                 'inputs_count', 'outputs_count', 'resources_count', 'inputs', 'outputs', 'resources')
+
+    def __init__(self, name, path, description="", description_en="", version="", providers=None,
+                 inputs_count=0, outputs_count=0, resources_count=0, inputs=None, outputs=None, resources=None):
+        self.name = name
+        self.path = path
+        self.description = description
+        self.description_en = description_en
+        self.version = version
+        self.providers = providers if providers is not None else []
+        self.inputs_count = inputs_count
+        self.outputs_count = outputs_count
+        self.resources_count = resources_count
+        self.inputs = inputs
+        self.outputs = outputs
+        self.resources = resources
+
+    def table_rows(self, link_prefix):
+        """在一次调用中生成 (英文行, 中文行)"""
+        link = f"[{self.name}]({link_prefix}/{self.name}/)"
+        counts = f"{self.inputs_count} | {self.outputs_count} | {self.resources_count}"
+        return (f"| {link} | {self.description_en} | {counts} | ✅ Active |\n",
+                f"| {link} | {self.description} | {counts} | ✅ 可用 |\n")
+
+
+class ModuleMetadataCache:
+    """模块元数据缓存（sqlite）
+
+    以模块 .tf 文件内容哈希和提取方式（含扫描器 / terraform-docs 版本）为键，
+    保存与 `terraform-docs json` 同构的模块数据；同时按可执行文件路径、mtime 和大小
+    缓存 terraform-docs 的版本号，缓存命中时无需启动任何子进程
+    """
+
+    def __init__(self, path):
+        self.path = path
+        cache_dir = os.path.dirname(path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+
+        if self.connection.execute("PRAGMA user_version").fetchone()[0] != METADATA_CACHE_VERSION:
+            self.connection.executescript("""
+                DROP TABLE IF EXISTS module_metadata;
+                DROP TABLE IF EXISTS tool_versions;
+            """)
+        self.connection.executescript(f"""
+            CREATE TABLE IF NOT EXISTS module_metadata (
+                module_path TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                extractor TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS tool_versions (
+                binary_path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                version TEXT NOT NULL
+            );
+            PRAGMA user_version = {METADATA_CACHE_VERSION};
+        """)
+
+    def get(self, module_path, content_hash, extractor):
+        """返回缓存的模块数据，未命中时返回 None"""
+        row = self.connection.execute(
+            "SELECT data FROM module_metadata WHERE module_path = ? AND content_hash = ? AND extractor = ?",
+            (module_path, content_hash, extractor)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, module_path, content_hash, extractor, data):
+        """保存模块数据（同一模块只保留最新一条）"""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO module_metadata (module_path, content_hash, extractor, data) VALUES (?, ?, ?, ?)",
+            (module_path, content_hash, extractor, json.dumps(data, ensure_ascii=False)))
+
+    def evict_missing(self):
+        """删除已不存在的模块的记录，返回删除数量"""
+        missing = [(module_path,) for (module_path,) in self.connection.execute("SELECT module_path FROM module_metadata")
+                   if not os.path.isdir(module_path)]
+        self.connection.executemany("DELETE FROM module_metadata WHERE module_path = ?", missing)
+        return len(missing)
+
+    def tool_version(self, binary_path, stat):
+        """可执行文件未变化时返回缓存的版本号"""
+        row = self.connection.execute(
+            "SELECT version FROM tool_versions WHERE binary_path = ? AND mtime_ns = ? AND size = ?",
+            (binary_path, stat.st_mtime_ns, stat.st_size)).fetchone()
+        return row[0] if row else None
+
+    def set_tool_version(self, binary_path, stat, version):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO tool_versions (binary_path, mtime_ns, size, version) VALUES (?, ?, ?, ?)",
+            (binary_path, stat.st_mtime_ns, stat.st_size, version))
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
+
+
 class MainReadmeGenerator:
     """主目录 README.md 生成器"""
 
-    def __init__(self, modules_dir="example_alibabacloudstack", output_file="README.md"):
+    def __init__(self, modules_dir="example_alibabacloudstack", output_file="README.md",
+                 extractor=EXTRACTOR_NATIVE, changed_since=None, jobs=None, timeout=TERRAFORM_DOCS_TIMEOUT,
+                 cache_dir=".cache", use_cache=True, layout=LAYOUT_SINGLE, catalog_dir="docs/catalog",
+                 catalog_output=None, incremental=False):
         self.modules_dir = modules_dir
         self.output_file = output_file
+        self.extractor = extractor
+        self.changed_since = changed_since
+        self.jobs = jobs or os.cpu_count() or 1
+        self.timeout = timeout
+        # 并发预先获取的 terraform-docs json 结果，失败的模块值为 None
+        self.docs_results = {}
+        self.cache_dir = cache_dir
+        self.use_cache = use_cache
+        self.metadata_cache = None
+        self.module_hashes = {}
+        self.extractor_key = None
+        self._terraform_docs_version = None
+        self.layout = layout
+        self.catalog_dir = catalog_dir
+        self.catalog_output = catalog_output
+        self.incremental = incremental
         self.project_info = {
             "name": "Terraform Share Modules",
             "description": "这个项目提供了一套全面的 Terraform 模块文档生成系统。支持中英文文档生成以及集中化配置管理。",
@@ -48,14 +266,89 @@ class MainReadmeGenerator:
 
     def check_terraform_docs_installed(self):
         """检查 terraform-docs 是否已安装"""
+        return self.terraform_docs_version() is not None
+
+    def terraform_docs_version(self):
+        """返回 terraform-docs 的版本号，未安装时返回 None
+
+        版本号按可执行文件的路径、mtime 和大小缓存，文件未变化时不启动子进程
+        """
+        if self._terraform_docs_version is not None:
+            return self._terraform_docs_version
+
+        binary = shutil.which('terraform-docs')
+        if binary is None:
+            return None
+        binary = os.path.realpath(binary)
+        stat = os.stat(binary)
+
+        version = self.metadata_cache.tool_version(binary, stat) if self.metadata_cache else None
+        if version is None:
+            try:
+                result = subprocess.run([binary, '--version'], capture_output=True, text=True)
+            except OSError:
+                return None
+            if result.returncode != 0:
+                return None
+            version = result.stdout.strip()
+            if self.metadata_cache:
+                self.metadata_cache.set_tool_version(binary, stat, version)
+
+        self._terraform_docs_version = version
+        return version
+
+    def get_extractor_key(self):
+        """缓存键中的提取方式部分，包含扫描器版本和 terraform-docs 版本"""
+        if self.extractor_key is None:
+            parts = [self.extractor]
+            if self.extractor != EXTRACTOR_TERRAFORM_DOCS:
+                parts.append(f"scanner-{terraform_hcl.SCANNER_VERSION}")
+            if self.extractor != EXTRACTOR_NATIVE:
+                parts.append(self.terraform_docs_version() or "")
+            self.extractor_key = ":".join(parts)
+        return self.extractor_key
+
+    def module_hash(self, module_path):
+        """模块中所有 .tf 文件（文件名和内容）的哈希"""
+        if module_path not in self.module_hashes:
+            digest = hashlib.sha256()
+            for name in sorted(os.listdir(module_path)):
+                if name.endswith('.tf'):
+                    digest.update(name.encode('utf-8') + b'\0')
+                    with open(os.path.join(module_path, name), 'rb') as f:
+                        digest.update(f.read())
+                    digest.update(b'\0')
+            self.module_hashes[module_path] = digest.hexdigest()
+        return self.module_hashes[module_path]
+
+    def cached_module_data(self, module_path):
+        """返回缓存中的模块数据，未启用缓存或未命中时返回 None"""
+        if self.metadata_cache is None:
+            return None
+        return self.metadata_cache.get(os.path.normpath(module_path), self.module_hash(module_path),
+                                       self.get_extractor_key())
+
+    def open_cache(self):
+        """打开元数据缓存，失败时不使用缓存继续运行"""
+        if not self.use_cache:
+            return
+        cache_path = os.path.join(self.cache_dir, METADATA_CACHE_FILE)
         try:
-            result = subprocess.run(['terraform-docs', '--version'],
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                return True
-        except FileNotFoundError:
-            pass
-        return False
+            self.metadata_cache = ModuleMetadataCache(cache_path)
+        except (OSError, sqlite3.Error) as e:
+            self.print_emoji("⚠️", f"无法打开元数据缓存 {cache_path}，本次不使用缓存: {str(e)}", Colors.WARNING)
+            self.metadata_cache = None
+
+    def close_cache(self):
+        """清理已不存在的模块并写回缓存"""
+        if self.metadata_cache is None:
+            return
+        try:
+            self.metadata_cache.evict_missing()
+            self.metadata_cache.close()
+        except sqlite3.Error as e:
+            self.print_emoji("⚠️", f"无法写回元数据缓存: {str(e)}", Colors.WARNING)
+        self.metadata_cache = None
 
     def get_module_info(self, module_path):
         """提取单个模块的信息"""
@@ -66,29 +359,12 @@ class MainReadmeGenerator:
         if not os.path.exists(main_tf_path):
             return None
 
-        module_info = {
-            "name": module_name,
-            "path": module_path,
-            "description": "",
-            "description_en": "",
-            "version": "",
-            "providers": [],
-            "inputs_count": 0,
-            "outputs_count": 0,
-            "resources_count": 0
-        }
+        module_info = ModuleRecord(module_name, module_path, inputs=[], outputs=[], resources=[])
 
         try:
-            # 使用 terraform-docs 提取模块信息
-            result = subprocess.run([
-                'terraform-docs',
-                'json',
-                module_path
-            ], capture_output=True, text=True, timeout=30)
-
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
+            data = self.load_module_data(module_path)
 
+            if data is not None:
                 # 提取描述信息
                 if 'header' in data and data['header']:
                     # 从 header 中提取描述
@@ -96,25 +372,42 @@ class MainReadmeGenerator:
                     for line in header_lines:
                         line = line.strip()
                         if line and not line.startswith('#'):
-                            if not module_info['description']:
-                                module_info['description'] = line
+                            if not module_info.description:
+                                module_info.description = line
                             break
 
                 # 提取统计信息
-                module_info['inputs_count'] = len(data.get('inputs', []))
-                module_info['outputs_count'] = len(data.get('outputs', []))
-                module_info['resources_count'] = len(data.get('resources', []))
+                module_info.inputs_count = len(data.get('inputs', []))
+                module_info.outputs_count = len(data.get('outputs', []))
+                module_info.resources_count = len(data.get('resources', []))
 
                 # 提取 providers 信息
                 providers = data.get('providers', [])
                 for provider in providers:
-                    module_info['providers'].append(provider.get('name', ''))
+                    module_info.providers.append(provider.get('name', ''))
+
+                # 提取输入、输出和资源明细（用于机器可读目录）
+                module_info.inputs = [{
+                    "name": item.get('name', ''),
+                    "type": item.get('type') or "",
+                    "required": bool(item.get('required')),
+                    "description": item.get('description') or ""
+                } for item in data.get('inputs') or []]
+                module_info.outputs = [{
+                    "name": item.get('name', ''),
+                    "description": item.get('description') or ""
+                } for item in data.get('outputs') or []]
+                module_info.resources = [{
+                    "type": f"{item['provider']}_{item.get('type', '')}" if item.get('provider') else item.get('type', ''),
+                    "name": item.get('name') or "",
+                    "mode": item.get('mode') or "managed"
+                } for item in data.get('resources') or []]
 
                 # 提取版本要求
                 requirements = data.get('requirements', [])
                 for req in requirements:
                     if req.get('name') == 'terraform':
-                        module_info['version'] = req.get('version', '')
+                        module_info.version = req.get('version', '')
 
         except (subprocess.TimeoutExpired, json.JSONDecodeError, Exception) as e:
             self.print_emoji("⚠️", f"无法提取 {module_name} 的详细信息: {str(e)}", Colors.WARNING)
@@ -134,14 +427,14 @@ class MainReadmeGenerator:
                             description_lines.append(desc)
 
                 if description_lines:
-                    module_info['description'] = description_lines[0]
+                    module_info.description = description_lines[0]
 
         except Exception as e:
             pass
 
         # 设置默认描述
-        if not module_info['description']:
-            module_info['description'] = f"{module_name.upper()} 模块"
+        if not module_info.description:
+            module_info.description = f"{module_name.upper()} 模块"
 
         # 设置英文描述
         module_descriptions = {
@@ -151,10 +444,110 @@ class MainReadmeGenerator:
             'security-group': 'AWS Security Group rules and configurations',
             'vpc': 'AWS VPC networking with subnets and routing'
         }
-        module_info['description_en'] = module_descriptions.get(module_name, f"{module_name.upper()} module")
+        module_info.description_en = module_descriptions.get(module_name, f"{module_name.upper()} module")
 
         return module_info
 
+    def load_module_data(self, module_path):
+        """按提取方式返回与 `terraform-docs json` 同构的模块数据，优先使用元数据缓存"""
+        data = self.cached_module_data(module_path)
+        if data is not None:
+            return data
+
+        if self.extractor == EXTRACTOR_TERRAFORM_DOCS:
+            data = self.run_terraform_docs_json(module_path)
+        else:
+            data = terraform_hcl.scan_module(module_path)
+            if self.extractor == EXTRACTOR_CROSS_CHECK:
+                self.cross_check(module_path, data, self.run_terraform_docs_json(module_path))
+
+        if data is not None and self.metadata_cache is not None:
+            self.metadata_cache.put(os.path.normpath(module_path), self.module_hash(module_path),
+                                    self.get_extractor_key(), data)
+        return data
+
+    def run_terraform_docs_json(self, module_path):
+        """调用 terraform-docs json 提取模块信息，失败时返回 None
+
+        已经通过 prefetch_terraform_docs 并发获取过的模块直接返回结果
+        """
+        if module_path in self.docs_results:
+            return self.docs_results[module_path]
+
+        result = subprocess.run([
+            'terraform-docs',
+            'json',
+            module_path
+        ], capture_output=True, text=True, timeout=self.timeout)
+
+        if result.returncode != 0:
+            return None
+        return json.loads(result.stdout)
+
+    async def _run_terraform_docs_json_async(self, module_path, semaphore):
+        """在信号量限制下异步调用 terraform-docs json，超时或取消时结束子进程"""
+        async with semaphore:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    'terraform-docs', 'json', module_path,
+                    stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+            except OSError as e:
+                self.print_emoji("⚠️", f"无法为 {module_path} 启动 terraform-docs: {str(e)}", Colors.WARNING)
+                return None
+
+            try:
+                stdout, _ = await asyncio.wait_for(process.communicate(), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                self.print_emoji("⚠️", f"terraform-docs 处理 {module_path} 超时 ({self.timeout}s)", Colors.WARNING)
+                return None
+            finally:
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+
+        if process.returncode != 0:
+            return None
+        try:
+            return json.loads(stdout)
+        except ValueError:
+            self.print_emoji("⚠️", f"terraform-docs 对 {module_path} 的输出不是有效的 JSON", Colors.WARNING)
+            return None
+
+    async def _prefetch_terraform_docs_async(self, module_paths):
+        semaphore = asyncio.Semaphore(self.jobs)
+        results = await asyncio.gather(*(self._run_terraform_docs_json_async(module_path, semaphore)
+                                         for module_path in module_paths))
+        return dict(zip(module_paths, results))
+
+    def prefetch_terraform_docs(self, module_paths):
+        """并发获取多个模块的 terraform-docs json 结果（内置扫描器不需要）"""
+        if self.extractor == EXTRACTOR_NATIVE:
+            return
+        # 元数据缓存命中的模块不需要调用 terraform-docs
+        module_paths = [module_path for module_path in module_paths
+                        if module_path not in self.docs_results
+                        and os.path.exists(os.path.join(module_path, "main.tf"))
+                        and self.cached_module_data(module_path) is None]
+        if not module_paths:
+            return
+
+        self.print_emoji("⚡", f"并发提取 {len(module_paths)} 个模块的信息 "
+                         f"(jobs={self.jobs}, 超时 {self.timeout}s)", Colors.OKCYAN)
+        self.docs_results.update(asyncio.run(self._prefetch_terraform_docs_async(module_paths)))
+
+    def cross_check(self, module_path, native_data, docs_data):
+        """比较内置扫描器和 terraform-docs 的统计结果，不一致时给出警告"""
+        if docs_data is None:
+            self.print_emoji("⚠️", f"terraform-docs 无法处理 {module_path}，跳过对比", Colors.WARNING)
+            return
+
+        for key in ('inputs', 'outputs', 'resources', 'providers'):
+            native_count = len(native_data.get(key) or [])
+            docs_count = len(docs_data.get(key) or [])
+            if native_count != docs_count:
+                self.print_emoji("⚠️", f"{module_path} 的 {key} 数量不一致: "
+                                 f"内置扫描器 {native_count}, terraform-docs {docs_count}", Colors.WARNING)
+
     def get_all_modules_info(self):
         """获取所有模块的信息"""
         modules_info = []
@@ -163,15 +556,30 @@ class MainReadmeGenerator:
             self.print_emoji("❌", f"模块目录 {self.modules_dir} 不存在", Colors.FAIL)
             return modules_info
 
-        # 递归遍历模块目录
+        # 先递归发现所有模块，再统一（并发）提取模块信息
         self.print_emoji("🔍", f"开始扫描目录: {self.modules_dir}", Colors.OKCYAN)
-        modules_info = self._scan_directory_recursively(self.modules_dir)
+        modules = self._scan_directory_recursively(self.modules_dir)
 
-        return sorted(modules_info, key=lambda x: x['name'])
+        return self.collect_modules_info(modules)
+
+    def collect_modules_info(self, modules):
+        """提取 [(模块名称, 模块路径)] 的信息，返回按名称排序的列表"""
+        modules = sorted(modules)
+        self.prefetch_terraform_docs([module_path for _, module_path in modules])
 
-    def _scan_directory_recursively(self, directory, base_path=""):
-        """递归扫描目录寻找Terraform模块"""
         modules_info = []
+        for module_name, module_path in modules:
+            module_info = self.get_module_info(module_path)
+            if module_info:
+                # 更新模块名称为包含路径的名称
+                module_info.name = module_name
+                modules_info.append(module_info)
+
+        return sorted(modules_info, key=lambda x: x.name)
+
+    def _scan_directory_recursively(self, directory, base_path=""):
+        """递归扫描目录寻找Terraform模块，返回 [(模块名称, 模块路径)]"""
+        modules = []
 
         try:
             for item in os.listdir(directory):
@@ -191,24 +599,19 @@ class MainReadmeGenerator:
                             module_name = item
 
                         self.print_emoji("📂", f"发现模块: {module_name}", Colors.OKBLUE)
-                        module_info = self.get_module_info(item_path)
-                        if module_info:
-                            # 更新模块名称为包含路径的名称
-                            module_info['name'] = module_name
-                            module_info['relative_path'] = module_name
-                            modules_info.append(module_info)
+                        modules.append((module_name, item_path))
                     else:
                         # 如果不是模块，继续递归扫描子目录
                         new_base_path = f"{base_path}/{item}" if base_path else item
                         sub_modules = self._scan_directory_recursively(item_path, new_base_path)
-                        modules_info.extend(sub_modules)
+                        modules.extend(sub_modules)
 
         except PermissionError:
             self.print_emoji("⚠️", f"无权限访问目录: {directory}", Colors.WARNING)
         except Exception as e:
             self.print_emoji("⚠️", f"扫描目录时出错 {directory}: {str(e)}", Colors.WARNING)
 
-        return modules_info
+        return modules
 
     def _is_terraform_module(self, directory):
         """检查目录是否是一个Terraform模块"""
@@ -228,114 +631,529 @@ class MainReadmeGenerator:
 
         return False
 
-    def generate_module_table_cn(self, modules_info):
-        """生成中文模块表格"""
-        if not modules_info:
-            return "暂无可用模块。"
+    def table_files(self):
+        """包含模块表格的文件：单个 README，或分片布局下的各服务目录页"""
+        if self.layout == LAYOUT_SHARDED:
+            return sorted(glob.glob(os.path.join(self.catalog_dir, "*.md")))
+        return [self.output_file]
+
+    def read_existing_modules(self):
+        """从已有的 README 表格中读取模块信息，文件不存在或没有表格时返回 None"""
+        content = ""
+        for table_file in self.table_files():
+            try:
+                with open(table_file, 'r', encoding='utf-8') as f:
+                    content += f.read() + "\n"
+            except OSError:
+                continue
+
+        modules = {}
+        for match in TABLE_ROW_RE.finditer(content):
+            name = match.group('name')
+            module_info = modules.get(name)
+            if module_info is None:
+                module_info = modules[name] = ModuleRecord(
+                    name, os.path.join(self.modules_dir, name),
+                    inputs_count=int(match.group('inputs')),
+                    outputs_count=int(match.group('outputs')),
+                    resources_count=int(match.group('resources')))
+            # 中文表格的状态列为“可用”，英文表格为“Active”
+            if '可用' in match.group('status'):
+                module_info.description = match.group('description')
+            else:
+                module_info.description_en = match.group('description')
+
+        return modules or None
+
+    def changed_module_names(self, paths, existing):
+        """把变化的文件映射到模块名称（相对模块目录的路径），与递归扫描一样取最外层的模块目录"""
+        names = set()
+        for path in paths:
+            rel_path = os.path.relpath(path, self.modules_dir)
+            if rel_path.startswith(os.pardir):
+                continue
+
+            parts = rel_path.split(os.sep)[:-1]
+            for index in range(1, len(parts) + 1):
+                if parts[index - 1].startswith('.') or parts[index - 1] in ('__pycache__', 'env_vars'):
+                    break
+                name = '/'.join(parts[:index])
+                if name in existing or self._is_terraform_module(os.path.join(self.modules_dir, *parts[:index])):
+                    names.add(name)
+                    break
+        return names
+
+    def get_changed_modules_info(self):
+        """--changed-since：复用已有 README 表格，只重新提取有变化的模块
+
+        没有可复用的 README 时返回 None，由调用方退回全量扫描
+        """
+        existing = self.read_existing_modules()
+        if existing is None:
+            self.print_emoji("⚠️", f"{self.output_file} 中没有可复用的模块表格，扫描全部模块", Colors.WARNING)
+            return None
 
-        table = "| 模块名称 | 描述 | 输入参数 | 输出参数 | 资源数量 | 状态 |\n"
-        table += "|--------|------|----------|----------|----------|------|\n"
+        paths = git_changes.changed_files(self.changed_since)
+        names = self.changed_module_names(paths, existing)
+        self.print_emoji("🔀", f"自 {self.changed_since} 以来 {len(paths)} 个文件变化，"
+                         f"涉及 {len(names)} 个模块", Colors.OKCYAN)
 
-        for module in modules_info:
-            status = "✅ 可用"
-            table += f"| [{module['name']}]({self.modules_dir}/{module['name']}/) | {module['description']} | {module['inputs_count']} | {module['outputs_count']} | {module['resources_count']} | {status} |\n"
+        modules = [(name, os.path.join(self.modules_dir, *name.split('/'))) for name in sorted(names)]
+        updated = {module_info.name: module_info for module_info in self.collect_modules_info(
+            [(name, module_path) for name, module_path in modules if self._is_terraform_module(module_path)])}
+
+        for name, _ in modules:
+            if name in updated:
+                self.print_emoji("📂", f"更新模块: {name}", Colors.OKBLUE)
+                existing[name] = updated[name]
+            elif existing.pop(name, None):
+                self.print_emoji("🗑️", f"移除模块: {name}", Colors.OKBLUE)
+
+        return sorted(existing.values(), key=lambda x: x.name)
+
+    @staticmethod
+    def _lines_without_date(lines):
+        """逐行去掉更新日期，用于比较内容是否变化"""
+        for line in lines:
+            yield UPDATED_DATE_RE.sub('', line.rstrip('\n'))
+
+    def readme_unchanged(self, readme_content, path=None):
+        """除更新日期外，新内容是否与已有 README 相同"""
+        try:
+            with open(path or self.output_file, 'r', encoding='utf-8') as f:
+                existing = f.read()
+        except OSError:
+            return False
 
-        return table
+        return (list(self._lines_without_date(existing.splitlines()))
+                == list(self._lines_without_date(readme_content.splitlines())))
 
-    def generate_module_table_en(self, modules_info):
-        """生成英文模块表格"""
+    def files_unchanged(self, new_path, old_path):
+        """逐行流式比较两个文件（忽略更新日期），不把整个文件读入内存"""
+        try:
+            with open(new_path, 'r', encoding='utf-8') as new_file, \
+                    open(old_path, 'r', encoding='utf-8') as old_file:
+                sentinel = object()
+                return all(new_line == old_line for new_line, old_line in zip_longest(
+                    self._lines_without_date(new_file), self._lines_without_date(old_file), fillvalue=sentinel))
+        except OSError:
+            return False
+
+    def generate_module_table_cn(self, modules_info, link_prefix=None):
+        """生成中文模块表格，link_prefix 为模块链接的前缀（默认为模块目录）"""
         if not modules_info:
-            return "No modules available."
+            return NO_MODULES_CN
 
-        table = "| Module | Description | Inputs | Outputs | Resources | Status |\n"
-        table += "|--------|-------------|---------|---------|-----------|--------|\n"
+        link_prefix = link_prefix or self.modules_dir
+        return TABLE_HEADER_CN + "".join(module.table_rows(link_prefix)[1] for module in modules_info)
 
-        for module in modules_info:
-            status = "✅ Active"
-            table += f"| [{module['name']}]({self.modules_dir}/{module['name']}/) | {module['description_en']} | {module['inputs_count']} | {module['outputs_count']} | {module['resources_count']} | {status} |\n"
+    def generate_module_table_en(self, modules_info, link_prefix=None):
+        """生成英文模块表格，link_prefix 为模块链接的前缀（默认为模块目录）"""
+        if not modules_info:
+            return NO_MODULES_EN
 
-        return table
+        link_prefix = link_prefix or self.modules_dir
+        return TABLE_HEADER_EN + "".join(module.table_rows(link_prefix)[0] for module in modules_info)
 
     def generate_readme_content(self, modules_info, language='both'):
-        """生成 README 内容"""
-        current_date = datetime.now().strftime("%Y-%m-%d")
+        """生成 README 内容（字符串形式，写文件时使用 write_readme 流式输出）"""
+        buffer = io.StringIO()
+        self.stream_readme(buffer, modules_info, language, datetime.now().strftime("%Y-%m-%d"))
+        return buffer.getvalue()
+
+    def stream_readme(self, out, modules_info, language, current_date):
+        """把 README 逐行写入 out
+
+        双语版本在同一次遍历中生成两种语言的行：英文行直接写出，
+        中文行先写入临时文件，英文表格结束后再整体复制，内存占用与模块数无关
+        """
+        link_prefix = self.modules_dir
 
         if language == 'cn':
-            return self.generate_chinese_readme(modules_info, current_date)
+            out.write("# Terraform 模块文档项目\n\n本项目包含以下 Terraform 模块：\n\n## 可用模块\n\n")
+            self._stream_table(out, None, modules_info, link_prefix, TABLE_HEADER_CN, NO_MODULES_CN, 1)
+            out.write(f"\n\n---\n\n**最后更新**: {current_date}\n")
         elif language == 'en':
-            return self.generate_english_readme(modules_info, current_date)
+            out.write("# Terraform Share Modules\n\nThis project contains the following Terraform modules:\n\n"
+                      "## Available Modules\n\n")
+            self._stream_table(out, None, modules_info, link_prefix, TABLE_HEADER_EN, NO_MODULES_EN, 0)
+            out.write(f"\n\n---\n\n**Last Updated**: {current_date}\n")
         else:
-            return self.generate_bilingual_readme(modules_info, current_date)
+            out.write("# Terraform Modules Documentation Project / Terraform 模块文档项目\n\n"
+                      "## Available Modules / 可用模块\n\n**English**:\n")
+            with tempfile.TemporaryFile('w+', encoding='utf-8') as spill:
+                self._stream_table(out, spill, modules_info, link_prefix, TABLE_HEADER_EN, NO_MODULES_EN, 0)
+                out.write("\n\n**中文**:\n")
+                if modules_info:
+                    out.write(TABLE_HEADER_CN)
+                    spill.seek(0)
+                    shutil.copyfileobj(spill, out)
+                else:
+                    out.write(NO_MODULES_CN)
+            out.write(f"\n\n---\n\n**Last Updated / 最后更新**: {current_date}\n")
+
+    @staticmethod
+    def _stream_table(out, spill, modules_info, link_prefix, header, empty, index):
+        """写出一种语言的表格；spill 不为 None 时另一种语言的行同时写入 spill"""
+        if not modules_info:
+            out.write(empty)
+            return
+
+        out.write(header)
+        for module in modules_info:
+            rows = module.table_rows(link_prefix)
+            out.write(rows[index])
+            if spill is not None:
+                spill.write(rows[1 - index])
+
+    @staticmethod
+    def find_tables(lines):
+        """找出已有 README 中的模块表格
+
+        返回 [(语言下标, 起始行, 结束行)]，语言下标 0 为英文、1 为中文，
+        行号范围只包含数据行（不含表头）
+        """
+        tables = []
+        for index, line in enumerate(lines):
+            match = TABLE_ROW_RE.match(line.rstrip('\n'))
+            if not match:
+                continue
+            language_index = 1 if '可用' in match.group('status') else 0
+            if tables and tables[-1][2] == index and tables[-1][0] == language_index:
+                tables[-1] = (language_index, tables[-1][1], index + 1)
+            else:
+                tables.append((language_index, index, index + 1))
+        return tables
+
+    @staticmethod
+    def patch_rows(rows, new_rows):
+        """按模块名称重建一个表格的数据行
+
+        rows 为已有行，new_rows 为 {模块名称: 新行}（顺序与完整生成一致）。
+        结果总是 new_rows 的各行，不依赖已有行的顺序；已有行乱序或重复时也会被纠正。
+        返回 (新行列表, 更新数, 新增数, 删除数)，重复行计入删除数，仅顺序变化的行计入更新数
+        """
+        existing = {}
+        for row in rows:
+            existing.setdefault(TABLE_ROW_RE.match(row.rstrip('\n')).group('name'), row)
+
+        patched = list(new_rows.values())
+        updated = sum(1 for name, row in new_rows.items() if name in existing and existing[name] != row)
+        inserted = sum(1 for name in new_rows if name not in existing)
+        deleted = len(rows) - (len(new_rows) - inserted)
+        if not (updated or inserted or deleted) and patched != rows:
+            updated = sum(1 for old, new in zip(rows, patched) if old != new)
+        return patched, updated, inserted, deleted
+
+    def patch_readme(self, modules_info, language):
+        """增量修补已有 README 中的模块表格行
+
+        以模块路径为索引，只更新元数据变化的行，并插入新模块、删除已不存在的模块，
+        表格以外的内容原样保留。有变化时才更新日期并原子替换文件。
+        返回 (更新数, 新增数, 删除数)；已有文件不存在、表格结构与语言不匹配，
+        或修补后表格为空（需要完整生成“没有模块”的提示）时返回 None
+        """
+        if not modules_info:
+            return None
 
-    def generate_chinese_readme(self, modules_info, current_date):
-        """生成中文 README"""
-        module_table = self.generate_module_table_cn(modules_info)
+        try:
+            with open(self.output_file, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError:
+            return None
 
-        content = f"""# Terraform 模块文档项目
+        tables = self.find_tables(lines)
+        expected = {'en': [0], 'cn': [1]}.get(language, [0, 1])
+        if [language_index for language_index, _, _ in tables] != expected:
+            return None
 
-本项目包含以下 Terraform 模块：
+        rows_by_language = ({}, {})
+        for module in modules_info:
+            en_row, cn_row = module.table_rows(self.modules_dir)
+            rows_by_language[0][module.name] = en_row
+            rows_by_language[1][module.name] = cn_row
 
-## 可用模块
+        totals = [0, 0, 0]
+        # 从后往前替换，前面表格的行号不受影响
+        for language_index, start, end in reversed(tables):
+            patched, *counts = self.patch_rows(lines[start:end], rows_by_language[language_index])
+            lines[start:end] = patched
+            totals = [total + count for total, count in zip(totals, counts)]
 
-{module_table}
+        if not any(totals):
+            return tuple(totals)
 
----
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        for index, line in enumerate(lines):
+            if line.startswith(('**Last Updated', '**最后更新')):
+                lines[index] = UPDATED_DATE_RE.sub(current_date, line.rstrip('\n')) + '\n'
 
-**最后更新**: {current_date}
-"""
-        return content
+        tmp_path = f"{self.output_file}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+            os.replace(tmp_path, self.output_file)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return tuple(totals)
+
+    def write_readme(self, modules_info, language):
+        """流式写出 README 到临时文件，再原子替换目标文件
+
+        --changed-since 时若除日期外内容没有变化则保留原文件，返回是否写入
+        """
+        tmp_path = f"{self.output_file}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                self.stream_readme(f, modules_info, language, datetime.now().strftime("%Y-%m-%d"))
+
+            if self.changed_since and self.files_unchanged(tmp_path, self.output_file):
+                os.remove(tmp_path)
+                return False
+
+            os.replace(tmp_path, self.output_file)
+            return True
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def group_by_service(modules_info):
+        """按服务（模块名称的第一段，如 ecs/ecs_disk 的 ecs）分组，返回有序的 {服务: [模块]}"""
+        services = {}
+        for module in modules_info:
+            services.setdefault(module.name.split('/')[0], []).append(module)
+        return dict(sorted(services.items()))
 
-    def generate_english_readme(self, modules_info, current_date):
-        """生成英文 README"""
-        module_table = self.generate_module_table_en(modules_info)
+    def generate_service_page(self, service, modules, language):
+        """生成单个服务的目录页（不含日期，模块行不变时内容不变）"""
+        link_prefix = os.path.relpath(self.modules_dir, self.catalog_dir).replace(os.sep, '/')
+        sections = [CATALOG_PAGE_MARKER, ""]
 
-        content = f"""# Terraform Share Modules
+        if language == 'cn':
+            sections += [f"# {service} 模块", "", self.generate_module_table_cn(modules, link_prefix)]
+        elif language == 'en':
+            sections += [f"# {service} modules", "", self.generate_module_table_en(modules, link_prefix)]
+        else:
+            sections += [f"# {service} modules / {service} 模块", "",
+                         "**English**:", self.generate_module_table_en(modules, link_prefix),
+                         "**中文**:", self.generate_module_table_cn(modules, link_prefix)]
+        return "\n".join(sections)
+
+    def generate_catalog_summary(self, services, language, current_date):
+        """生成顶层汇总：每个服务一行，包含模块数和参数、资源合计"""
+        catalog_link = os.path.relpath(self.catalog_dir, os.path.dirname(self.output_file) or ".").replace(os.sep, '/')
+        total = sum(len(modules) for modules in services.values())
+
+        def rows(header, divider):
+            table = header + divider
+            for service, modules in services.items():
+                table += (f"| [{service}]({catalog_link}/{service}.md) | {len(modules)} | "
+                          f"{sum(module.inputs_count for module in modules)} | "
+                          f"{sum(module.outputs_count for module in modules)} | "
+                          f"{sum(module.resources_count for module in modules)} |\n")
+            return table
+
+        table_en = rows("| Service | Modules | Inputs | Outputs | Resources |\n",
+                        "|---------|---------|--------|---------|-----------|\n")
+        table_cn = rows("| 服务 | 模块数量 | 输入参数 | 输出参数 | 资源数量 |\n",
+                        "|------|----------|----------|----------|----------|\n")
 
-This project contains the following Terraform modules:
+        if language == 'cn':
+            return f"""# Terraform 模块文档项目
 
-## Available Modules
+本项目包含 {len(services)} 个服务，共 {total} 个 Terraform 模块，每个服务的模块列表见对应的目录页。
 
-{module_table}
+## 服务列表
 
+{table_cn}
 ---
 
-**Last Updated**: {current_date}
+**最后更新**: {current_date}
 """
-        return content
+        elif language == 'en':
+            return f"""# Terraform Share Modules
 
-    def generate_bilingual_readme(self, modules_info, current_date):
-        """生成双语 README"""
-        module_table_cn = self.generate_module_table_cn(modules_info)
-        module_table_en = self.generate_module_table_en(modules_info)
+This project contains {total} Terraform modules across {len(services)} services. Each service links to its own catalog page.
 
-        content = f"""# Terraform Modules Documentation Project / Terraform 模块文档项目
+## Services
 
-## Available Modules / 可用模块
+{table_en}
+---
 
-**English**:
-{module_table_en}
+**Last Updated**: {current_date}
+"""
+        return f"""# Terraform Modules Documentation Project / Terraform 模块文档项目
 
-**中文**:
-{module_table_cn}
+{total} modules across {len(services)} services / {len(services)} 个服务，共 {total} 个模块
+
+## Services / 服务列表
 
+**English**:
+{table_en}
+**中文**:
+{table_cn}
 ---
 
 **Last Updated / 最后更新**: {current_date}
 """
-        return content
+
+    def write_if_changed(self, path, content, ignore_date=False):
+        """内容变化时才写入文件，返回是否写入"""
+        if ignore_date:
+            unchanged = self.readme_unchanged(content, path)
+        else:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    unchanged = f.read() == content
+            except OSError:
+                unchanged = False
+        if unchanged:
+            return False
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return True
+
+    def write_catalog(self, modules_info, language):
+        """分片布局：每个服务写一页 docs/catalog/<service>.md，再写顶层汇总
+
+        只有行发生变化的服务页才会重写，已不存在的服务页会被删除
+        """
+        services = self.group_by_service(modules_info)
+
+        written = 0
+        for service, modules in services.items():
+            page_path = os.path.join(self.catalog_dir, f"{service}.md")
+            if self.write_if_changed(page_path, self.generate_service_page(service, modules, language)):
+                written += 1
+                self.print_emoji("📝", f"更新服务目录页: {page_path}", Colors.OKBLUE)
+
+        removed = 0
+        for page_path in glob.glob(os.path.join(self.catalog_dir, "*.md")):
+            if os.path.basename(page_path)[:-3] in services:
+                continue
+            with open(page_path, 'r', encoding='utf-8') as f:
+                generated = f.readline().rstrip('\n') == CATALOG_PAGE_MARKER
+            if generated:
+                os.remove(page_path)
+                removed += 1
+                self.print_emoji("🗑️", f"删除服务目录页: {page_path}", Colors.OKBLUE)
+
+        self.print_emoji("📊", f"服务目录页: {len(services)} 个服务，更新 {written} 页，"
+                         f"未变化 {len(services) - written} 页，删除 {removed} 页", Colors.OKCYAN)
+
+        summary = self.generate_catalog_summary(services, language, datetime.now().strftime("%Y-%m-%d"))
+        if self.write_if_changed(self.output_file, summary, ignore_date=True):
+            self.print_emoji("✅", f"汇总 README 生成成功: {self.output_file}", Colors.OKGREEN)
+        else:
+            self.print_emoji("♻️", f"汇总没有变化，保留 {self.output_file}", Colors.OKCYAN)
+        return True
+
+    def catalog_record(self, module):
+        """模块在机器可读目录中的记录"""
+        return {
+            "name": module.name,
+            "path": module.path,
+            "description": module.description,
+            "description_en": module.description_en,
+            "terraform_version": module.version,
+            "inputs_count": module.inputs_count,
+            "outputs_count": module.outputs_count,
+            "resources_count": module.resources_count,
+            "providers": module.providers,
+            "inputs": module.inputs or [],
+            "outputs": module.outputs or [],
+            "resources": module.resources or []
+        }
+
+    def write_machine_catalog(self, modules_info):
+        """写出 catalog.json 和带索引的 catalog.sqlite
+
+        从已有 README 表格复用的模块（--changed-since）没有明细，先补齐再写出
+        """
+        missing = [(module.name, module.path) for module in modules_info if module.inputs is None]
+        if missing:
+            details = {module.name: module for module in self.collect_modules_info(missing)}
+            modules_info = [details.get(module.name, module) for module in modules_info]
+
+        records = [self.catalog_record(module) for module in modules_info]
+        os.makedirs(self.catalog_output, exist_ok=True)
+
+        # JSON：不含日期，模块没有变化时内容不变
+        json_path = os.path.join(self.catalog_output, CATALOG_JSON_FILE)
+        content = json.dumps({"version": CATALOG_VERSION, "modules": records}, ensure_ascii=False, indent=2) + "\n"
+        self.write_if_changed(json_path, content)
+
+        # SQLite：先写到临时文件再替换，读取方不会看到写了一半的数据库
+        sqlite_path = os.path.join(self.catalog_output, CATALOG_SQLITE_FILE)
+        tmp_path = f"{sqlite_path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        connection = sqlite3.connect(tmp_path)
+        try:
+            connection.executescript(CATALOG_SCHEMA)
+            connection.execute(f"PRAGMA user_version = {CATALOG_VERSION}")
+            for record in records:
+                module_id = connection.execute(
+                    "INSERT INTO modules (name, path, description, description_en, terraform_version, "
+                    "inputs_count, outputs_count, resources_count) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (record['name'], record['path'], record['description'], record['description_en'],
+                     record['terraform_version'], record['inputs_count'], record['outputs_count'],
+                     record['resources_count'])).lastrowid
+                connection.executemany(
+                    "INSERT INTO inputs (module_id, name, type, required, description) VALUES (?, ?, ?, ?, ?)",
+                    [(module_id, item['name'], item['type'], int(item['required']), item['description'])
+                     for item in record['inputs']])
+                connection.executemany(
+                    "INSERT INTO outputs (module_id, name, description) VALUES (?, ?, ?)",
+                    [(module_id, item['name'], item['description']) for item in record['outputs']])
+                connection.executemany(
+                    "INSERT INTO providers (module_id, name) VALUES (?, ?)",
+                    [(module_id, name) for name in record['providers']])
+                connection.executemany(
+                    "INSERT INTO resources (module_id, type, name, mode) VALUES (?, ?, ?, ?)",
+                    [(module_id, item['type'], item['name'], item['mode']) for item in record['resources']])
+            connection.commit()
+        finally:
+            connection.close()
+        os.replace(tmp_path, sqlite_path)
+
+        self.print_emoji("🗂️", f"机器可读目录已写入 {json_path} 和 {sqlite_path} ({len(records)} 个模块)", Colors.OKGREEN)
 
     def run(self, language='both'):
         """运行主程序"""
+        self.open_cache()
+        try:
+            return self.generate(language)
+        finally:
+            self.close_cache()
+
+    def generate(self, language='both'):
+        """扫描模块并生成 README"""
         self.print_emoji("🚀", "开始生成主目录 README.md", Colors.HEADER)
 
-        # 检查 terraform-docs
-        if not self.check_terraform_docs_installed():
+        # 只有使用 terraform-docs 提取时才需要检查安装
+        if self.extractor != EXTRACTOR_NATIVE and not self.check_terraform_docs_installed():
             self.print_emoji("❌", "terraform-docs 未安装，请先安装 terraform-docs", Colors.FAIL)
             return False
 
-        # 获取模块信息
-        self.print_emoji("📂", "扫描模块目录...", Colors.OKBLUE)
-        modules_info = self.get_all_modules_info()
+        # 获取模块信息（--changed-since 时只重新提取有变化的模块）
+        modules_info = None
+        if self.changed_since:
+            try:
+                modules_info = self.get_changed_modules_info()
+            except git_changes.GitChangesError as e:
+                self.print_emoji("❌", f"无法获取变更文件: {str(e)}", Colors.FAIL)
+                return False
+
+        if modules_info is None:
+            self.print_emoji("📂", "扫描模块目录...", Colors.OKBLUE)
+            modules_info = self.get_all_modules_info()
 
         if not modules_info:
             self.print_emoji("⚠️", "未找到任何可用模块", Colors.WARNING)
@@ -343,20 +1161,58 @@ This project contains the following Terraform modules:
 
         self.print_emoji("✅", f"找到 {len(modules_info)} 个模块", Colors.OKGREEN)
 
-        # 生成 README 内容
-        self.print_emoji("📝", f"生成 README 内容 (语言: {language})...", Colors.OKBLUE)
-        readme_content = self.generate_readme_content(modules_info, language)
+        # 机器可读目录（catalog.json / catalog.sqlite）
+        if self.catalog_output:
+            try:
+                self.write_machine_catalog(modules_info)
+            except (OSError, sqlite3.Error) as e:
+                self.print_emoji("❌", f"写入机器可读目录失败: {str(e)}", Colors.FAIL)
+                return False
+
+        # 分片布局：每个服务一页加顶层汇总
+        if self.layout == LAYOUT_SHARDED:
+            self.print_emoji("📝", f"生成服务目录页 (语言: {language}, 目录: {self.catalog_dir})...", Colors.OKBLUE)
+            try:
+                return self.write_catalog(modules_info, language)
+            except OSError as e:
+                self.print_emoji("❌", f"写入服务目录页失败: {str(e)}", Colors.FAIL)
+                return False
+
+        # 增量模式：只修补已有表格中变化的行
+        if self.incremental:
+            self.print_emoji("📝", f"增量修补 README 表格 (语言: {language})...", Colors.OKBLUE)
+            try:
+                counts = self.patch_readme(modules_info, language)
+            except OSError as e:
+                self.print_emoji("❌", f"写入文件失败: {str(e)}", Colors.FAIL)
+                return False
+
+            if counts is None:
+                self.print_emoji("⚠️", f"{self.output_file} 不存在或表格与语言不匹配，改为完整生成", Colors.WARNING)
+            elif not any(counts):
+                self.print_emoji("♻️", f"模块表格没有变化，保留 {self.output_file}", Colors.OKCYAN)
+                return True
+            else:
+                self.print_emoji("✅", f"README.md 已增量更新: {self.output_file} "
+                                 f"(更新 {counts[0]} 行, 新增 {counts[1]} 行, 删除 {counts[2]} 行)", Colors.OKGREEN)
+                return True
 
-        # 写入文件
+        # 流式生成 README 内容并原子替换
+        self.print_emoji("📝", f"生成 README 内容 (语言: {language})...", Colors.OKBLUE)
         try:
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                f.write(readme_content)
-            self.print_emoji("✅", f"README.md 生成成功: {self.output_file}", Colors.OKGREEN)
-            return True
+            written = self.write_readme(modules_info, language)
         except Exception as e:
             self.print_emoji("❌", f"写入文件失败: {str(e)}", Colors.FAIL)
             return False
 
+        # 模块表格没有变化时保留已有文件（不更新日期）
+        if not written:
+            self.print_emoji("♻️", f"模块表格没有变化，保留 {self.output_file}", Colors.OKCYAN)
+            return True
+
+        self.print_emoji("✅", f"README.md 生成成功: {self.output_file}", Colors.OKGREEN)
+        return True
+
 
 def main():
     """主函数"""
@@ -369,10 +1225,49 @@ def main():
                        help='模块目录路径 (默认: example_alibabacloudstack)')
     parser.add_argument('--output', default='README.md',
                        help='输出文件名 (默认: README.md)')
+    parser.add_argument('--extractor',
+                       choices=[EXTRACTOR_NATIVE, EXTRACTOR_TERRAFORM_DOCS, EXTRACTOR_CROSS_CHECK],
+                       default=EXTRACTOR_NATIVE,
+                       help='模块信息提取方式 (native: 内置扫描器, terraform-docs: 调用 terraform-docs json, '
+                            'cross-check: 使用内置扫描器并与 terraform-docs 对比, 默认: native)')
+    parser.add_argument('--changed-since', metavar='REF',
+                       help='只重新提取自 git 引用 REF 以来有变化的模块，其余模块复用已有 README 表格；'
+                            '表格没有变化时不重写文件')
+
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                       help='同时运行的 terraform-docs 进程数 (默认: CPU 核数)')
+    parser.add_argument('--timeout', type=float, default=TERRAFORM_DOCS_TIMEOUT,
+                       help=f'单个模块 terraform-docs 调用的超时时间，秒 (默认: {TERRAFORM_DOCS_TIMEOUT})')
+
+    parser.add_argument('--cache-dir', default='.cache',
+                       help=f'模块元数据缓存目录，缓存文件为其中的 {METADATA_CACHE_FILE} (默认: .cache)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='不读取也不写入模块元数据缓存')
+
+    parser.add_argument('--layout', choices=[LAYOUT_SINGLE, LAYOUT_SHARDED], default=LAYOUT_SINGLE,
+                       help='输出布局 (single: 一个 README 表格, sharded: 每个服务一页加顶层汇总, 默认: single)')
+    parser.add_argument('--catalog-dir', default='docs/catalog',
+                       help='分片布局下服务目录页的输出目录 (默认: docs/catalog)')
+
+    parser.add_argument('--catalog-output', metavar='DIR',
+                       help=f'同时在 DIR 下写出机器可读目录 {CATALOG_JSON_FILE} 和 {CATALOG_SQLITE_FILE}'
+                            '（包含模块、输入、输出、provider 和资源，带查询索引）')
+
+    parser.add_argument('--incremental', action='store_true',
+                       help='就地修补已有 README 表格中变化的行（更新、新增和删除），其余内容保持不变；'
+                            '没有变化时不重写文件（仅用于 single 布局）')
 
     args = parser.parse_args()
 
-    generator = MainReadmeGenerator(args.modules_dir, args.output)
+    if args.incremental and args.layout != LAYOUT_SINGLE:
+        parser.error('--incremental 只能用于 single 布局')
+
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs 必须大于等于 1')
+
+    generator = MainReadmeGenerator(args.modules_dir, args.output, args.extractor, args.changed_since,
+                                    args.jobs, args.timeout, args.cache_dir, not args.no_cache,
+                                    args.layout, args.catalog_dir, args.catalog_output, args.incremental)
     success = generator.run(args.lang)
 
     sys.exit(0 if success else 1)
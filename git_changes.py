@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+基于本地 git 的变更文件查询
+供 --changed-since 使用：只运行本地 git 命令（不访问远程），
+返回相对当前目录的变更文件路径（包括已删除和未跟踪的文件）
+"""
+
+import os
+import subprocess
+
+
+class GitChangesError(Exception):
+    """git 不可用、不在仓库中或引用无效"""
+
+
+def _run_git(args, cwd=None):
+    """运行 git 命令并返回标准输出，失败时抛出 GitChangesError"""
+    try:
+        result = subprocess.run(['git'] + args, cwd=cwd, capture_output=True, text=True)
+    except FileNotFoundError:
+        raise GitChangesError("未找到 git 命令")
+
+    if result.returncode != 0:
+        raise GitChangesError(result.stderr.strip() or f"git {' '.join(args)} 执行失败")
+    return result.stdout
+
+
+def changed_files(ref, cwd=None):
+    """返回自 ref 以来变化的文件（相对 cwd 的路径，已排序）
+
+    包括 ref 与工作区之间的差异（已提交、已暂存和未暂存的修改，以及删除），
+    和尚未被 git 跟踪的新文件（遵循 .gitignore）
+    """
+    try:
+        _run_git(['rev-parse', '--verify', f'{ref}^{{commit}}'], cwd)
+    except GitChangesError as e:
+        raise GitChangesError(f"无效的 git 引用 {ref}: {str(e)}")
+
+    diff = _run_git(['diff', '--name-only', '--relative', '-z', ref, '--'], cwd)
+    untracked = _run_git(['ls-files', '--others', '--exclude-standard', '-z'], cwd)
+
+    paths = {os.path.normpath(path) for path in (diff + untracked).split('\0') if path}
+    return sorted(paths)
+
+
+def owning_directory(path, directories):
+    """返回 directories 中包含 path 的最深目录，没有时返回 None
+
+    directories 为规范化后的相对路径集合，path 为相对同一目录的文件路径
+    """
+    directory = os.path.dirname(os.path.normpath(path))
+    while directory:
+        if directory in directories:
+            return directory
+        directory = os.path.dirname(directory)
+    return None
@@ -0,0 +1,585 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+轻量级 Terraform (HCL) 扫描器
+在当前进程内解析模块目录下的 *.tf 文件，提取 variable / output / resource / data /
+module / provider / terraform 块，输出与 `terraform-docs json` 结构一致的数据，
+从而避免为每个模块启动一次 terraform-docs 子进程
+只使用 Python 标准库，不做完整的 HCL 求值，只识别文档生成需要的字面量
+"""
+
+import os
+import re
+import glob
+import json
+
+
+SCANNER_VERSION = "2"
+
+_IDENT_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_\-]*')
+_HEREDOC_RE = re.compile(r'<<(-?)([A-Za-z_][A-Za-z0-9_]*)[ \t]*\r?\n')
+_NUMBER_RE = re.compile(r'-?\d+(\.\d+)?([eE][+-]?\d+)?$')
+
+
+class HclBlock:
+    """HCL 块：类型、标签、属性（原始表达式文本）和子块"""
+
+    __slots__ = ('type', 'labels', 'attributes', 'blocks', 'comment')
+
+    def __init__(self, block_type, labels=None, comment=""):
+        self.type = block_type
+        self.labels = labels or []
+        self.attributes = {}
+        self.blocks = []
+        self.comment = comment
+
+    def get_blocks(self, block_type):
+        """返回指定类型的直接子块"""
+        return [block for block in self.blocks if block.type == block_type]
+
+    def literal(self, name, default=None):
+        """返回属性的字面量值，属性不存在或不是字面量时返回 default"""
+        if name not in self.attributes:
+            return default
+        value = literal_value(self.attributes[name])
+        return default if value is _NOT_LITERAL else value
+
+
+class _NotLiteral:
+    """literal_value 无法求值时的哨兵"""
+
+    def __repr__(self):
+        return "<not literal>"
+
+
+_NOT_LITERAL = _NotLiteral()
+
+
+class HclParser:
+    """只识别结构的 HCL 解析器
+
+    块体中的每一项要么是 `name = expression`（保留原始文本），要么是
+    `type "label" ... { ... }` 块。表达式内部的字符串、插值、heredoc、注释和括号
+    都会被正确跳过，因此不会把表达式中的 `{`、`}` 误认为块边界。
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.length = len(text)
+
+    def parse(self):
+        """解析整个文件，返回根块"""
+        root = HclBlock("")
+        self._parse_body(0, root, top_level=True)
+        return root
+
+    def _parse_body(self, pos, block, top_level=False):
+        """解析块体，直到遇到匹配的 `}`（顶层直到文件结束），返回结束位置"""
+        text = self.text
+        comment_lines = []
+
+        while pos < self.length:
+            char = text[pos]
+
+            if char in ' \t\r':
+                pos += 1
+                continue
+
+            if char == '\n':
+                # 空行打断紧邻块的注释
+                if pos + 1 < self.length and text[pos + 1] == '\n':
+                    comment_lines = []
+                pos += 1
+                continue
+
+            if char == '#' or text.startswith('//', pos):
+                end = text.find('\n', pos)
+                end = self.length if end == -1 else end
+                comment_lines.append(_strip_comment_marker(text[pos:end]))
+                pos = end
+                continue
+
+            if text.startswith('/*', pos):
+                end = text.find('*/', pos + 2)
+                end = self.length if end == -1 else end + 2
+                comment_lines.extend(_strip_block_comment(text[pos:end]))
+                pos = end
+                continue
+
+            if char == '}':
+                if top_level:
+                    # 多余的右括号，跳过以保证容错
+                    pos += 1
+                    continue
+                return pos + 1
+
+            match = _IDENT_RE.match(text, pos)
+            if not match:
+                # 无法识别的内容，跳到下一行
+                end = text.find('\n', pos)
+                pos = self.length if end == -1 else end
+                comment_lines = []
+                continue
+
+            name = match.group(0)
+            pos = self._skip_inline_space(match.end())
+
+            if pos < self.length and text[pos] == '=' and not text.startswith('==', pos):
+                start = self._skip_inline_space(pos + 1)
+                end = self._skip_expression(start)
+                block.attributes[name] = text[start:end].strip()
+                pos = self._skip_trailing_comment(end)
+                comment_lines = []
+                continue
+
+            labels = []
+            while pos < self.length and text[pos] != '{':
+                if text[pos] == '"':
+                    end = self._skip_string(pos)
+                    labels.append(literal_value(text[pos:end]))
+                    pos = self._skip_inline_space(end)
+                    continue
+                label = _IDENT_RE.match(text, pos)
+                if not label:
+                    break
+                labels.append(label.group(0))
+                pos = self._skip_inline_space(label.end())
+
+            if pos < self.length and text[pos] == '{':
+                child = HclBlock(name, labels, "\n".join(comment_lines).strip())
+                block.blocks.append(child)
+                pos = self._parse_body(pos + 1, child)
+            else:
+                end = text.find('\n', pos)
+                pos = self.length if end == -1 else end
+            comment_lines = []
+
+        return pos
+
+    def _skip_inline_space(self, pos):
+        while pos < self.length and self.text[pos] in ' \t':
+            pos += 1
+        return pos
+
+    def _skip_trailing_comment(self, pos):
+        """跳过属性行尾的注释（属于该属性，不作为下一个块的描述）"""
+        pos = self._skip_inline_space(pos)
+        if self.text.startswith(('#', '//'), pos):
+            end = self.text.find('\n', pos)
+            return self.length if end == -1 else end
+        if self.text.startswith('/*', pos):
+            end = self.text.find('*/', pos + 2)
+            return self.length if end == -1 else end + 2
+        return pos
+
+    def _skip_expression(self, pos, closer=None):
+        """跳过一个表达式
+
+        closer 为 None 时表达式在括号深度为 0 的换行、行尾注释或未匹配的 `}` 处结束；
+        否则一直跳到与之匹配的 closer（返回 closer 之后的位置）。
+        """
+        text = self.text
+        depth = 0
+
+        while pos < self.length:
+            char = text[pos]
+
+            if char == '"':
+                pos = self._skip_string(pos)
+                continue
+
+            if char == '<' and text.startswith('<<', pos):
+                heredoc = _HEREDOC_RE.match(text, pos)
+                if heredoc:
+                    pos = self._skip_heredoc(heredoc)
+                    continue
+
+            if char == '#' or text.startswith(('//', '/*'), pos):
+                if depth == 0 and closer is None:
+                    # 行尾注释不属于表达式
+                    return pos
+                if text.startswith('/*', pos):
+                    end = text.find('*/', pos + 2)
+                    pos = self.length if end == -1 else end + 2
+                else:
+                    end = text.find('\n', pos)
+                    pos = self.length if end == -1 else end
+                continue
+
+            if char in '([{':
+                depth += 1
+            elif char in ')]}':
+                if depth == 0:
+                    if closer is not None and char == closer:
+                        return pos + 1
+                    # 单行块 `{ a = 1 }` 的结束括号，不属于表达式
+                    return pos
+                depth -= 1
+            elif char == '\n' and depth == 0 and closer is None:
+                return pos
+
+            pos += 1
+
+        return pos
+
+    def _skip_string(self, pos):
+        """跳过以 pos 处双引号开始的字符串（含 ${ } 插值），返回结束引号之后的位置"""
+        text = self.text
+        pos += 1
+        while pos < self.length:
+            char = text[pos]
+            if char == '\\':
+                pos += 2
+                continue
+            if char == '"':
+                return pos + 1
+            if char in '$%' and text.startswith(char + '{', pos + 1):
+                # $${ 和 %%{ 是转义后的字面量
+                pos += 3
+                continue
+            if char in '$%' and text.startswith('{', pos + 1):
+                pos = self._skip_expression(pos + 2, closer='}')
+                continue
+            if char == '\n':
+                # 未闭合的字符串，在行尾结束以保证容错
+                return pos
+            pos += 1
+        return pos
+
+    def _skip_heredoc(self, match):
+        """跳过 heredoc，返回结束标记之后的位置"""
+        marker = match.group(2)
+        pos = match.end()
+        while pos < self.length:
+            end = self.text.find('\n', pos)
+            end = self.length if end == -1 else end
+            if self.text[pos:end].strip() == marker:
+                return end
+            pos = end + 1
+        return self.length
+
+
+def _strip_comment_marker(line):
+    """去掉行注释的 # 或 // 前缀"""
+    line = line.strip()
+    if line.startswith('//'):
+        line = line[2:]
+    elif line.startswith('#'):
+        line = line[1:]
+    return line[1:] if line.startswith(' ') else line
+
+
+def _strip_block_comment(comment):
+    """把 /* ... */ 注释拆成去掉修饰符的行"""
+    body = comment[2:]
+    if body.endswith('*/'):
+        body = body[:-2]
+    lines = []
+    for line in body.split('\n'):
+        line = line.strip()
+        if line.startswith('*'):
+            line = line[1:].lstrip(' ') if not line.startswith('**') else line.lstrip('*').strip()
+        lines.append(line)
+    while lines and not lines[0]:
+        lines.pop(0)
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def literal_value(expression):
+    """把简单字面量表达式转换为 Python 值
+
+    支持字符串、heredoc、数字、true/false/null，以及由这些值组成的列表和对象；
+    其他表达式（引用、函数调用、插值等）返回 _NOT_LITERAL。
+    """
+    if expression is None:
+        return _NOT_LITERAL
+    expression = expression.strip()
+    if not expression:
+        return _NOT_LITERAL
+
+    if expression in ('true', 'false'):
+        return expression == 'true'
+    if expression == 'null':
+        return None
+    if _NUMBER_RE.match(expression):
+        return float(expression) if any(c in expression for c in '.eE') else int(expression)
+
+    heredoc = _HEREDOC_RE.match(expression + '\n')
+    if heredoc:
+        lines = (expression + '\n')[heredoc.end():].split('\n')
+        while lines and lines[-1].strip() != heredoc.group(2):
+            lines.pop()
+        lines = lines[:-1]
+        if heredoc.group(1):
+            indents = [len(line) - len(line.lstrip()) for line in lines if line.strip()]
+            indent = min(indents) if indents else 0
+            lines = [line[indent:] for line in lines]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    if expression.startswith('"') and expression.endswith('"') and len(expression) >= 2:
+        if '${' in expression.replace('$${', '') or '%{' in expression.replace('%%{', ''):
+            return _NOT_LITERAL
+        try:
+            value = json.loads(expression)
+        except ValueError:
+            value = expression[1:-1]
+        return value.replace('$${', '${').replace('%%{', '%{')
+
+    if expression[0] in '[{':
+        # 列表/对象字面量：转换为 JSON 后再解析
+        converted = _hcl_collection_to_json(expression)
+        if converted is not None:
+            try:
+                return json.loads(converted)
+            except ValueError:
+                pass
+
+    return _NOT_LITERAL
+
+
+def _hcl_collection_to_json(expression):
+    """把只包含字面量的 HCL 列表/对象改写为 JSON 文本，失败时返回 None"""
+    tokens = re.findall(r'"(?:\\.|[^"\\])*"|[\[\]{}(),:=]|[^\s\[\]{}(),:="]+', expression)
+    output = []
+    depth = 0
+    for index, token in enumerate(tokens):
+        next_token = tokens[index + 1] if index + 1 < len(tokens) else ""
+
+        if token in ('=', ':'):
+            output.append(':')
+            continue
+        if token == ',':
+            if output and output[-1] != ',':
+                output.append(',')
+            continue
+        if token in ']}':
+            depth -= 1
+            if depth < 0:
+                return None
+            while output and output[-1] == ',':
+                output.pop()
+            output.append(token)
+            continue
+
+        if token in '[{':
+            value = token
+            depth += 1
+        elif token.startswith('"') or token in ('true', 'false', 'null') or _NUMBER_RE.match(token):
+            value = token
+        elif _IDENT_RE.fullmatch(token) and next_token in ('=', ':'):
+            # 对象的裸键名
+            value = json.dumps(token)
+        else:
+            return None
+
+        # HCL 对象成员可以用换行分隔，JSON 需要补上逗号
+        if output and output[-1] not in ('[', '{', ',', ':'):
+            output.append(',')
+        output.append(value)
+
+    return "".join(output) if depth == 0 else None
+
+
+def parse_file(path):
+    """解析单个 .tf 文件，返回根块"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return HclParser(f.read()).parse()
+
+
+def read_header(path):
+    """读取文件开头的注释块作为模块标题（与 terraform-docs header-from 行为一致）
+
+    .md / .txt 等非 Terraform 文件直接返回全部内容
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except OSError:
+        return ""
+
+    if not path.endswith('.tf'):
+        return text.strip()
+    return header_from_text(text)
+
+
+def header_from_text(text):
+    """从 .tf 文件内容开头的注释块提取标题"""
+    stripped = text.lstrip()
+    if stripped.startswith('/*'):
+        end = stripped.find('*/')
+        end = len(stripped) if end == -1 else end + 2
+        return "\n".join(_strip_block_comment(stripped[:end]))
+
+    lines = []
+    for line in stripped.split('\n'):
+        if line.strip().startswith(('#', '//')):
+            lines.append(_strip_comment_marker(line))
+        else:
+            break
+    return "\n".join(lines).strip()
+
+
+def _provider_of(resource_block):
+    """返回资源使用的 provider 名称和别名"""
+    explicit = resource_block.attributes.get('provider', '').strip()
+    if explicit:
+        name, _, alias = explicit.partition('.')
+        return name, alias
+    return resource_block.labels[0].split('_', 1)[0], ""
+
+
+def _requirement_version(expression):
+    """从 required_providers 中的表达式提取版本约束和 source"""
+    value = literal_value(expression)
+    if isinstance(value, str):
+        return value, ""
+    if isinstance(value, dict):
+        return value.get('version', '') or '', value.get('source', '') or ''
+    # 带 configuration_aliases 等引用的对象无法整体求值，退回正则提取
+    version = re.search(r'version\s*=\s*"([^"]*)"', expression)
+    source = re.search(r'source\s*=\s*"([^"]*)"', expression)
+    return (version.group(1) if version else ""), (source.group(1) if source else "")
+
+
+def scan_module(module_path, header_from="main.tf", footer_from="", read_comments=True, sources=None):
+    """扫描模块目录，返回与 `terraform-docs json` 同构的字典
+
+    包含 header / footer / inputs / outputs / providers / requirements / resources / modules，
+    各列表保持源文件中的声明顺序（文件按名称排序）。
+    read_comments 为 True 时，没有 description 的变量和输出使用紧邻的注释作为描述。
+    sources 为调用方已读取的 {文件名: 内容}，传入时不再读取 *.tf 文件。
+    """
+    data = {
+        "header": "",
+        "footer": "",
+        "inputs": [],
+        "modules": [],
+        "outputs": [],
+        "providers": [],
+        "requirements": [],
+        "resources": []
+    }
+
+    required_versions = []
+    required_providers = {}
+    provider_blocks = []
+    resources = []
+
+    if sources is None:
+        sources = {}
+        for tf_file in sorted(glob.glob(os.path.join(module_path, "*.tf"))):
+            with open(tf_file, 'r', encoding='utf-8') as f:
+                sources[os.path.basename(tf_file)] = f.read()
+
+    for name in sorted(sources):
+        root = HclParser(sources[name]).parse()
+
+        for block in root.blocks:
+            if block.type == 'variable' and block.labels:
+                raw_default = block.attributes.get('default')
+                default = literal_value(raw_default) if raw_default is not None else None
+                if default is _NOT_LITERAL:
+                    default = raw_default
+                data["inputs"].append({
+                    "name": block.labels[0],
+                    "type": block.attributes.get('type', 'any'),
+                    "description": _description(block, read_comments),
+                    "default": default,
+                    "required": raw_default is None,
+                    "sensitive": block.literal('sensitive', False) is True
+                })
+            elif block.type == 'output' and block.labels:
+                data["outputs"].append({
+                    "name": block.labels[0],
+                    "description": _description(block, read_comments),
+                    "sensitive": block.literal('sensitive', False) is True
+                })
+            elif block.type in ('resource', 'data') and len(block.labels) >= 2:
+                resources.append((block.type, block))
+            elif block.type == 'module' and block.labels:
+                data["modules"].append({
+                    "name": block.labels[0],
+                    "source": block.literal('source', ''),
+                    "version": block.literal('version', '') or ''
+                })
+            elif block.type == 'provider' and block.labels:
+                provider_blocks.append(block)
+            elif block.type == 'terraform':
+                version = block.literal('required_version')
+                if isinstance(version, str):
+                    required_versions.append(version)
+                for providers_block in block.get_blocks('required_providers'):
+                    for provider_name, expression in providers_block.attributes.items():
+                        version, source = _requirement_version(expression)
+                        requirement = required_providers.setdefault(provider_name, {"version": "", "source": ""})
+                        if version:
+                            requirement["version"] = version
+                        if source:
+                            requirement["source"] = source
+
+    if header_from in sources:
+        data["header"] = header_from_text(sources[header_from])
+    elif header_from:
+        data["header"] = read_header(os.path.join(module_path, header_from))
+    if footer_from:
+        data["footer"] = read_header(os.path.join(module_path, footer_from))
+
+    if required_versions:
+        data["requirements"].append({"name": "terraform", "version": ", ".join(required_versions)})
+    for name, requirement in required_providers.items():
+        data["requirements"].append({"name": name, "version": requirement["version"]})
+
+    seen_providers = set()
+    for mode, block in resources:
+        provider, alias = _provider_of(block)
+        source = required_providers.get(provider, {}).get("source") or f"hashicorp/{provider}"
+        resource_type = block.labels[0]
+        if resource_type.startswith(provider + '_'):
+            resource_type = resource_type[len(provider) + 1:]
+        data["resources"].append({
+            "type": resource_type,
+            "name": block.labels[1],
+            "provider": provider,
+            "source": source,
+            "mode": "managed" if mode == 'resource' else "data",
+            "version": "latest",
+            "description": block.comment or None
+        })
+        if (provider, alias) not in seen_providers:
+            seen_providers.add((provider, alias))
+            data["providers"].append({"name": provider, "alias": alias or None, "version": None})
+
+    for block in provider_blocks:
+        alias = block.literal('alias', '') or ''
+        if (block.labels[0], alias) not in seen_providers:
+            seen_providers.add((block.labels[0], alias))
+            data["providers"].append({"name": block.labels[0], "alias": alias or None, "version": None})
+
+    return data
+
+
+def _description(block, read_comments=True):
+    """返回块的 description，缺失时使用紧邻块的注释（read-comments）"""
+    description = block.literal('description')
+    if isinstance(description, str):
+        return description.strip()
+    return block.comment if read_comments else ""
+
+
+def read_lock_file(module_path):
+    """读取 .terraform.lock.hcl，返回 {provider 名称: 锁定版本}"""
+    lock_path = os.path.join(module_path, '.terraform.lock.hcl')
+    if not os.path.isfile(lock_path):
+        return {}
+
+    versions = {}
+    for block in parse_file(lock_path).get_blocks('provider'):
+        if block.labels:
+            name = block.labels[0].rstrip('/').rsplit('/', 1)[-1]
+            version = block.literal('version')
+            if isinstance(version, str):
+                versions[name] = version
+    return versions
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# 文档生成脚本 (generate-docs.py) 的测试，terraform-docs 使用基准测试中的桩程序
+
+import errno
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_FILE = os.path.join(ROOT_DIR, "config", "english-docs.yml")
+
+
+def load_script(file_name, module_name):
+    """按路径加载文件名带连字符的脚本"""
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(ROOT_DIR, file_name))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+bench = load_script("benchmark-pipeline.py", "benchmark_pipeline")
+generate_docs = load_script("generate-docs.py", "generate_docs")
+
+
+def install_stub(bin_dir, version="v0.16.0", batch_fails=False):
+    """写入 terraform-docs 桩程序，返回包含它的 PATH 环境
+
+    batch_fails 为 True 时 recursive（批量）调用以非零退出码失败
+    """
+    os.makedirs(bin_dir, exist_ok=True)
+    stub = bench.STUB_TERRAFORM_DOCS.format(python=sys.executable).replace("v0.16.0", version)
+    if batch_fails:
+        stub = stub.replace("if recursive:\n", "if recursive:\n    sys.exit('batch boom')\n", 1)
+    stub_path = os.path.join(bin_dir, "terraform-docs")
+    with open(stub_path, "w", encoding="utf-8") as f:
+        f.write(stub)
+    os.chmod(stub_path, 0o755)
+
+    env = dict(os.environ)
+    env["PATH"] = str(bin_dir) + os.pathsep + env.get("PATH", "")
+    env.pop("BENCH_STUB_DELAY", None)
+    return env
+
+
+def write_modules(modules_dir, modules):
+    """按 {"svc/svc_a": ["x", "y"]} 创建模块，每个模块带若干变量和一个输出"""
+    for module, variables in modules.items():
+        module_path = os.path.join(modules_dir, module)
+        os.makedirs(module_path, exist_ok=True)
+        with open(os.path.join(module_path, "main.tf"), "w", encoding="utf-8") as f:
+            for name in variables:
+                f.write(f'variable "{name}" {{}}\n')
+            f.write('output "id" {\n  value = "x"\n}\n')
+
+
+def run_docs(cwd, env, *args):
+    """在 cwd 中运行 generate-docs.py"""
+    command = [sys.executable, os.path.join(ROOT_DIR, "generate-docs.py"), "--config", CONFIG_FILE,
+               "--modules-dir", "modules", *args]
+    return subprocess.run(command, cwd=cwd, env=env, capture_output=True, text=True)
+
+
+def test_cache_invalidated_by_terraform_docs_upgrade(tmp_path):
+    env = install_stub(tmp_path / "bin")
+    write_modules(tmp_path / "modules", {"svc/svc_a": ["name"], "svc/svc_b": ["size"]})
+
+    first = run_docs(tmp_path, env, "--jobs", "1")
+    assert first.returncode == 0, first.stdout
+    second = run_docs(tmp_path, env, "--jobs", "1")
+    assert second.stdout.count("未发生变化，使用缓存") == 2
+
+    env = install_stub(tmp_path / "bin", version="v0.17.0")
+    upgraded = run_docs(tmp_path, env, "--jobs", "1")
+    assert upgraded.returncode == 0, upgraded.stdout
+    assert "使用缓存" not in upgraded.stdout
+    assert upgraded.stdout.count("文档生成成功") == 2
+
+
+def read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_batch_attributes_only_stale_modules(tmp_path):
+    env = install_stub(tmp_path / "bin")
+    modules = {"svc/svc_a": ["name"], "svc/svc_b": ["size"], "svc/svc_c": ["port"]}
+    write_modules(tmp_path / "modules", modules)
+
+    first = run_docs(tmp_path, env, "--jobs", "1", "--batch")
+    assert first.returncode == 0, first.stdout
+    assert "批量生成 3 个模块" in first.stdout
+
+    fresh_readme = tmp_path / "modules" / "svc" / "svc_c" / "README.md"
+    fresh_bytes = read_bytes(fresh_readme)
+    fresh_mtime = os.stat(fresh_readme).st_mtime_ns
+
+    write_modules(tmp_path / "modules", {"svc/svc_a": ["name", "zone"], "svc/svc_b": ["size", "type"]})
+    second = run_docs(tmp_path, env, "--jobs", "1", "--batch")
+    assert second.returncode == 0, second.stdout
+    assert "批量生成 2 个模块" in second.stdout
+    assert "svc_c 未发生变化，使用缓存" in second.stdout
+
+    # recursive 调用改写的缓存命中模块恢复原样
+    assert read_bytes(fresh_readme) == fresh_bytes
+    assert os.stat(fresh_readme).st_mtime_ns == fresh_mtime
+    assert b"| zone |" in read_bytes(tmp_path / "modules" / "svc" / "svc_a" / "README.md")
+    assert b"| type |" in read_bytes(tmp_path / "modules" / "svc" / "svc_b" / "README.md")
+
+
+def test_batch_failure_falls_back_to_per_module(tmp_path):
+    env = install_stub(tmp_path / "bin", batch_fails=True)
+    write_modules(tmp_path / "modules", {"svc/svc_a": ["name"], "svc/svc_b": ["size"]})
+
+    result = run_docs(tmp_path, env, "--jobs", "1", "--batch")
+    assert result.returncode == 0, result.stdout
+    assert "批量生成失败，回退为逐个模块生成" in result.stdout
+    assert "batch boom" in result.stdout
+    assert result.stdout.count("文档生成成功") == 2
+    for module in ("svc_a", "svc_b"):
+        assert b"<!-- BEGIN_TF_DOCS -->" in read_bytes(tmp_path / "modules" / "svc" / module / "README.md")
+
+
+@pytest.fixture
+def readmes(tmp_path):
+    """modules/svc/README.md 和尚不存在的 examples/svc/README.md"""
+    source = tmp_path / "modules" / "svc" / "README.md"
+    target = tmp_path / "examples" / "svc" / "README.md"
+    os.makedirs(source.parent)
+    os.makedirs(target.parent)
+    source.write_text("# svc\n", encoding="utf-8")
+    return source, target
+
+
+def syncer(mode):
+    return generate_docs.TerraformDocsGenerator(sync_mode=mode, use_cache=False)
+
+
+def test_sync_copy_skips_identical_and_replaces_links(readmes):
+    source, target = readmes
+    generator = syncer(generate_docs.SYNC_COPY)
+    assert generator.sync_file(str(source), str(target)) == "copied"
+    assert not os.path.samefile(source, target)
+
+    os.utime(target, ns=(1, 1))
+    assert generator.sync_file(str(source), str(target)) == "skipped"
+    assert os.stat(target).st_mtime_ns == 1
+
+    source.write_text("# svc v2\n", encoding="utf-8")
+    assert generator.sync_file(str(source), str(target)) == "copied"
+    assert target.read_text(encoding="utf-8") == "# svc v2\n"
+
+    # 之前同步为链接的文件替换为普通文件，不通过链接写回源文件
+    os.remove(target)
+    os.symlink(source, target)
+    assert generator.sync_file(str(source), str(target)) == "copied"
+    assert not os.path.islink(target)
+    assert source.read_text(encoding="utf-8") == "# svc v2\n"
+
+
+def test_sync_hardlink(readmes):
+    source, target = readmes
+    generator = syncer(generate_docs.SYNC_HARDLINK)
+    # 已有的相同内容副本也换成硬链接
+    target.write_text("# svc\n", encoding="utf-8")
+    assert generator.sync_file(str(source), str(target)) == "linked"
+    assert os.path.samefile(source, target)
+    assert generator.sync_file(str(source), str(target)) == "skipped"
+    assert os.path.samefile(source, target)
+    assert not os.path.exists(f"{target}.sync-tmp")
+
+
+def test_sync_symlink(readmes):
+    source, target = readmes
+    generator = syncer(generate_docs.SYNC_SYMLINK)
+    assert generator.sync_file(str(source), str(target)) == "linked"
+    assert os.readlink(target) == os.path.join("..", "..", "modules", "svc", "README.md")
+    assert generator.sync_file(str(source), str(target)) == "skipped"
+
+    # 指向其他位置的链接和普通文件都会被替换
+    os.remove(target)
+    os.symlink("elsewhere.md", target)
+    assert generator.sync_file(str(source), str(target)) == "linked"
+    assert target.read_text(encoding="utf-8") == "# svc\n"
+    os.remove(target)
+    target.write_text("# svc\n", encoding="utf-8")
+    assert generator.sync_file(str(source), str(target)) == "linked"
+    assert os.path.islink(target)
+
+
+@pytest.mark.parametrize("mode, function", [(generate_docs.SYNC_HARDLINK, "link"),
+                                            (generate_docs.SYNC_SYMLINK, "symlink")])
+def test_sync_falls_back_to_copy_when_links_fail(readmes, monkeypatch, mode, function):
+    def cross_device(*args):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(generate_docs.os, function, cross_device)
+    source, target = readmes
+    generator = syncer(mode)
+    assert generator.sync_file(str(source), str(target)) == "copied"
+    assert not os.path.islink(target)
+    assert not os.path.samefile(source, target)
+    assert target.read_text(encoding="utf-8") == "# svc\n"
+
+    os.utime(target, ns=(1, 1))
+    assert generator.sync_file(str(source), str(target)) == "skipped"
+    assert os.stat(target).st_mtime_ns == 1
+    assert not os.path.exists(f"{target}.sync-tmp")
+
+
+def test_parallel_runs_keep_log_order(tmp_path):
+    """先排序的模块在桩程序中耗时最长，并行时完成顺序与排序相反，输出仍按模块路径排序"""
+    outputs = {}
+    for jobs in ("1", "4"):
+        work_dir = tmp_path / f"jobs{jobs}"
+        env = install_stub(work_dir / "bin")
+        stub_path = work_dir / "bin" / "terraform-docs"
+        stub = stub_path.read_text(encoding="utf-8").replace(
+            "delay = float(os.environ.get('BENCH_STUB_DELAY', '0'))",
+            "delay = {'svc_a': 0.4, 'svc_b': 0.3, 'svc_c': 0.2}.get(os.path.basename(args[-1]), 0)\n"
+            "if os.path.basename(args[-1]) == 'svc_c':\n"
+            "    sys.exit('stub failure')")
+        stub_path.write_text(stub, encoding="utf-8")
+        write_modules(work_dir / "modules", {"svc/svc_a": ["name"], "svc/svc_b": ["size"], "svc/svc_c": ["port"],
+                                             "svc/svc_d": ["zone"], "vpc/vpc_a": ["cidr"]})
+        result = run_docs(work_dir, env, "--jobs", jobs, "--no-cache", "--report", "json", "report.json")
+        with open(work_dir / "report.json", encoding="utf-8") as f:
+            report = json.load(f)
+        # 去掉耗时和只在并行时输出的行
+        log = [line for line in result.stdout.splitlines() if "单模块耗时" not in line and "并行处理" not in line]
+        statuses = [(module["module"], module["status"]) for module in report["modules"]]
+        readmes = {module: read_bytes(work_dir / "modules" / module / "README.md")
+                   for module in ("svc/svc_a", "svc/svc_b", "svc/svc_d", "vpc/vpc_a")}
+        outputs[jobs] = (result.returncode, log, report["totals"], statuses, readmes)
+
+    assert outputs["4"] == outputs["1"]
+    _, log, totals, statuses, _ = outputs["4"]
+    assert [line.split("处理模块: ")[1].split("\x1b")[0] for line in log if "处理模块: " in line] == [
+        "svc_a", "svc_b", "svc_c", "svc_d", "vpc_a"]
+    assert "   总模块数: 5" in log and "   成功: 4" in log and "   失败: 1" in log
+    assert (totals["modules"], totals["successful"], totals["failed"]) == (5, 4, 1)
+    assert statuses == [("modules/svc/svc_a", "success"), ("modules/svc/svc_b", "success"),
+                        ("modules/svc/svc_c", "failed"), ("modules/svc/svc_d", "success"),
+                        ("modules/vpc/vpc_a", "success")]
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+# 模块生成脚本 (generate-alibabacloudstack-modules.py) 的测试
+
+import importlib.util
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+TESTDATA_DIR = os.path.join(ROOT_DIR, "testdata")
+DOCS_DIR = os.path.join(TESTDATA_DIR, "docs")
+
+
+def load_script(file_name, module_name):
+    """按路径加载文件名带连字符的脚本"""
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(ROOT_DIR, file_name))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+gm = load_script("generate-alibabacloudstack-modules.py", "generate_modules")
+bench = load_script("benchmark-pipeline.py", "benchmark_pipeline")
+
+
+class LegacyDocumentParser(gm.DocumentParser):
+    """改为单遍分词器之前基于正则的解析（参数类型和默认值的推断与现版本共用）"""
+
+    def _parse_content(self, content):
+        return {
+            'resource_info': self._legacy_resource_info(content),
+            'arguments': self._legacy_arguments(content),
+            'attributes': self._legacy_attributes(content),
+            'examples': self._legacy_examples(content)
+        }
+
+    @staticmethod
+    def _legacy_resource_info(content):
+        info = {}
+        title_match = re.search(r'page_title:\s*"[^:]*:\s*([^"]+)"', content)
+        if title_match:
+            info['resource_name'] = title_match.group(1).strip()
+        subcategory_match = re.search(r'subcategory:\s*"([^"]+)"', content)
+        if subcategory_match:
+            info['subcategory'] = subcategory_match.group(1).strip()
+        desc_match = re.search(r'description:\s*\|-?\s*\n\s*(.+)', content)
+        if desc_match:
+            info['description'] = desc_match.group(1).strip()
+        return info
+
+    def _legacy_arguments(self, content):
+        section = re.search(r'## Argument Reference\s*\n(.*?)(?=\n## |$)', content, re.DOTALL)
+        if not section:
+            return []
+        matches = re.findall(r'\* `([^`]+)` - \(([^)]+)\) (.+?)(?=\n\s*\* `|$)', section.group(1), re.DOTALL)
+        return [self._parse_parameter(name, flags, desc) for name, flags, desc in matches]
+
+    @staticmethod
+    def _legacy_attributes(content):
+        section = re.search(r'## Attributes Reference\s*\n(.*?)(?=\n## |$)', content, re.DOTALL)
+        if not section:
+            return []
+        matches = re.findall(r'\* `([^`]+)` - (.+?)(?=\n\s*\* `|$)', section.group(1), re.DOTALL)
+        return [{'name': name, 'description': desc.strip().replace('\n', ' ')} for name, desc in matches]
+
+    @staticmethod
+    def _legacy_examples(content):
+        return [example.strip() for example in
+                re.findall(r'## Example Usage.*?\n```hcl\n(.*?)\n```', content, re.DOTALL)]
+
+
+FENCED_DOC = '''---
+subcategory: "ECS"
+page_title: "Alibabacloudstack: alibabacloudstack_ecs_fenced"
+description: |-
+  Provides a fenced resource.
+---
+
+# alibabacloudstack_ecs_fenced
+
+## Example Usage
+
+```bash
+# ## not a heading
+* `not_an_item` - (Optional) inside a bash fence.
+```
+
+```hcl
+# comment
+resource "alibabacloudstack_ecs_fenced" "default" {
+  name = "```"
+}
+```
+
+## Example Usage with nested
+
+````hcl
+resource "alibabacloudstack_ecs_fenced" "nested" {}
+````
+
+```hcl
+resource "alibabacloudstack_ecs_fenced" "second" {}
+```
+
+## Argument Reference
+
+* `name` - (Required) The name. Default is `abc`.
+* `size` - (Optional) The size of the disk.
+
+## Attributes Reference
+
+* `id` - The ID.
+'''
+
+
+def legacy_cases():
+    """(名称, 文档内容)：块描述、行内带引号的描述、BOM、病态文档和代码块"""
+    with open(os.path.join(DOCS_DIR, "adb_account.html.markdown"), encoding="utf-8") as f:
+        block = f.read()
+    with open(os.path.join(DOCS_DIR, "ecs_thing.html.markdown"), encoding="utf-8") as f:
+        tricky = f.read()
+    with open(os.path.join(DOCS_DIR, "vpc_vpc.html.markdown"), encoding="utf-8") as f:
+        inline = f.read()
+    return [
+        ("block-description", block),
+        ("tricky", tricky),
+        ("inline-description", inline),
+        ("bom", "\ufeff" + block),
+        ("bom-blank-lines", "\ufeff\n\n" + tricky),
+        ("pathological", bench.pathological_doc(50)),
+        ("code-fences", FENCED_DOC)
+    ]
+
+
+@pytest.mark.parametrize("name, content", legacy_cases(), ids=[case[0] for case in legacy_cases()])
+def test_tokenizer_matches_legacy_regex_parser(name, content):
+    new = gm.DocumentParser()._parse_content(content)
+    old = LegacyDocumentParser()._parse_content(content)
+
+    if name == "inline-description":
+        # 旧正则只识别 | / |- 块写法，行内描述被忽略；新解析器去掉引号后读取
+        assert 'description' not in old['resource_info']
+        assert new['resource_info'].pop('description') == "Provides a VPC resource."
+    assert new == old
+
+
+def test_headings_inside_code_fences_are_ignored():
+    """旧正则会把代码块中的 `## Argument Reference` 当作小节标题，分词器不会"""
+    content = FENCED_DOC.replace("# comment", "# ## Argument Reference")
+    arguments = gm.DocumentParser()._parse_content(content)['arguments']
+    assert [argument['name'] for argument in arguments] == ['name', 'size']
+    assert LegacyDocumentParser()._parse_content(content)['arguments'] == []
+
+
+def test_missing_page_title_raises_clear_error():
+    with pytest.raises(ValueError, match="page_title"):
+        gm.DocumentParser()._parse_content("---\nsubcategory: \"X\"\n---\n\n## Argument Reference\n")
+
+
+def run_modules(cwd, *args):
+    """在 cwd 中以批量模式运行模块生成脚本，输入为 docs，输出为 modules 和 examples"""
+    command = [sys.executable, os.path.join(ROOT_DIR, "generate-alibabacloudstack-modules.py"),
+               "--mode", "batch", "--input-dir", "docs", "--output-dir", "modules",
+               "--example-dir", "examples", "--no-cache", *args]
+    result = subprocess.run(command, cwd=cwd, capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout + result.stderr
+    return result.stdout + result.stderr
+
+
+def copy_docs(tmp_path):
+    shutil.copytree(DOCS_DIR, tmp_path / "docs")
+
+
+def snapshot(root):
+    """目录树中每个文件的 (内容, mtime_ns)"""
+    files = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            with open(path, "rb") as f:
+                files[os.path.relpath(path, root)] = (f.read(), os.stat(path).st_mtime_ns)
+    return files
+
+
+def test_write_files_only_rewrites_changed_bytes(tmp_path):
+    generator = gm.ModuleGenerator(str(tmp_path / "modules"), str(tmp_path / "examples"))
+    same = tmp_path / "modules" / "same.tf"
+    changed = tmp_path / "modules" / "changed.tf"
+    assert generator.write_files({same: "a = 1\n", changed: "b = 1\n"}) == [(same, "new"), (changed, "new")]
+
+    os.utime(same, ns=(1, 1))
+    os.utime(changed, ns=(1, 1))
+    assert generator.write_files({same: "a = 1\n", changed: "b = 2\n"}) == [(changed, "modified")]
+    assert os.stat(same).st_mtime_ns == 1
+    assert os.stat(changed).st_mtime_ns != 1
+    assert changed.read_text() == "b = 2\n"
+
+
+def test_identical_rerun_keeps_mtimes(tmp_path):
+    copy_docs(tmp_path)
+    run_modules(tmp_path)
+    before = snapshot(tmp_path / "modules")
+
+    output = run_modules(tmp_path, "--force")
+    assert "未变化" in output
+    after = snapshot(tmp_path / "modules")
+    # 清单每次都会保存，生成的模块文件不变
+    before.pop(gm.MANIFEST_FILE)
+    after.pop(gm.MANIFEST_FILE)
+    assert after == before
+
+
+def test_dry_run_and_diff_write_nothing(tmp_path):
+    copy_docs(tmp_path)
+    run_modules(tmp_path)
+    doc = tmp_path / "docs" / "vpc_vpc.html.markdown"
+    doc.write_text(doc.read_text().replace("The name of the VPC.", "The VPC name."))
+
+    before = snapshot(tmp_path)
+    output = run_modules(tmp_path, "--dry-run")
+    assert "modules/vpc/vpc_vpc/variables.tf" in output
+    output = run_modules(tmp_path, "--diff")
+    assert "-  description = \"The name of the VPC." in output
+    assert "+  description = \"The VPC name." in output
+    assert snapshot(tmp_path) == before
+
+    run_modules(tmp_path)
+    variables = (tmp_path / "modules" / "vpc" / "vpc_vpc" / "variables.tf").read_text()
+    assert "The VPC name." in variables
+
+
+def read_doc(name):
+    with open(os.path.join(DOCS_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+# 超过 mmap 阈值的正文，front matter 之后的内容不应被读取
+LARGE_BODY = "\n" + "* `x` - (Optional) padding.\n" * (gm.PRESCAN_MMAP_BYTES // 20)
+
+
+@pytest.mark.parametrize("prefix", ["", "\ufeff", "\n\n", "\ufeff\r\n \n"],
+                         ids=["plain", "bom", "blank-lines", "bom-blank-lines"])
+@pytest.mark.parametrize("body", ["", LARGE_BODY], ids=["small", "mmap"])
+def test_read_front_matter(tmp_path, prefix, body):
+    content = prefix + read_doc("ecs_thing.html.markdown") + body
+    doc = tmp_path / "doc.html.markdown"
+    doc.write_bytes(content.encode("utf-8"))
+    assert (os.path.getsize(doc) >= gm.PRESCAN_MMAP_BYTES) == bool(body)
+
+    front_matter = gm.read_front_matter(str(doc))
+    assert front_matter == gm.DocTokenizer.parse_front_matter(content.split("\n"))[0]
+    assert front_matter["subcategory"] == '"ECS"'
+    assert front_matter["description"] == "Provides a thing.\nSecond line."
+
+
+@pytest.mark.parametrize("body", ["", LARGE_BODY], ids=["small", "mmap"])
+def test_read_front_matter_without_front_matter(tmp_path, body):
+    doc = tmp_path / "doc.html.markdown"
+    doc.write_text("# alibabacloudstack_ecs_thing\n\n---\nsubcategory: \"ECS\"\n---\n" + body, encoding="utf-8")
+    assert gm.read_front_matter(str(doc)) == {}
+
+
+def test_doc_index_filters():
+    doc_files = sorted(os.path.join(DOCS_DIR, name) for name in os.listdir(DOCS_DIR))
+    index = gm.DocIndex()
+    index.scan(doc_files)
+
+    def select(**kwargs):
+        return [os.path.basename(doc_file).split(".", 1)[0] for doc_file in index.select(**kwargs)]
+
+    assert select() == ["adb_account", "adb_cluster", "ecs_thing", "vpc_vpc"]
+    assert select(services=["adb"]) == ["adb_account", "adb_cluster"]
+    assert select(services=["adb", "vpc"]) == ["adb_account", "adb_cluster", "vpc_vpc"]
+    assert select(subcategories=["ecs"]) == ["ecs_thing"]
+    assert select(subcategories=["ADB Service", "VPC"]) == ["adb_account", "adb_cluster", "vpc_vpc"]
+    assert select(resource_pattern="*_cluster") == ["adb_cluster"]
+    assert select(services=["adb"], resource_pattern="adb_a*") == ["adb_account"]
+    assert select(services=["adb"], subcategories=["ECS"]) == []
+
+
+def test_cli_filters_select_docs(tmp_path):
+    copy_docs(tmp_path)
+    run_modules(tmp_path, "--service", "adb", "--resource", "adb_c*")
+    run_modules(tmp_path, "--subcategory", "vpc")
+    assert sorted(os.listdir(tmp_path / "modules")) == [gm.MANIFEST_FILE, "adb", "vpc"]
+    assert os.listdir(tmp_path / "modules" / "adb") == ["adb_cluster"]
+    assert os.listdir(tmp_path / "modules" / "vpc") == ["vpc_vpc"]
+
+
+def tree_bytes(root):
+    return {path: content for path, (content, _) in snapshot(root).items()}
+
+
+def test_jobs_produce_identical_output(tmp_path):
+    outputs = {}
+    for jobs in ("1", "2"):
+        work_dir = tmp_path / f"jobs{jobs}"
+        copy_docs(work_dir)
+        # 加入一个无法解析的文档，失败结果同样按文件顺序汇总
+        (work_dir / "docs" / "broken.html.markdown").write_text("---\nsubcategory: \"X\"\n---\n", encoding="utf-8")
+        command = [sys.executable, os.path.join(ROOT_DIR, "generate-alibabacloudstack-modules.py"),
+                   "--mode", "batch", "--input-dir", "docs", "--output-dir", "modules",
+                   "--example-dir", "examples", "--no-cache", "--jobs", jobs]
+        result = subprocess.run(command, cwd=work_dir, capture_output=True, text=True)
+        # 去掉日志行开头的时间戳和只在并行时输出的 "并行处理" 行
+        log = re.sub(r"(?m)^[\d-]+ [\d:,]+ - ", "", result.stdout + result.stderr)
+        outputs[jobs] = (result.returncode, re.sub(r"(?m)^INFO - 并行处理 .*\n", "", log))
+
+    assert tree_bytes(tmp_path / "jobs1" / "modules") == tree_bytes(tmp_path / "jobs2" / "modules")
+    assert tree_bytes(tmp_path / "jobs1" / "examples") == tree_bytes(tmp_path / "jobs2" / "examples")
+    assert len(tree_bytes(tmp_path / "jobs1" / "modules")) > 1
+    assert outputs["1"] == outputs["2"]
+    assert "4/5" in outputs["1"][1]
+
+
+def test_generated_module_matches_golden(tmp_path):
+    """testdata/golden 由改为模板渲染之前的字符串拼接版本生成"""
+    data = gm.DocumentParser().parse_resource_doc(os.path.join(DOCS_DIR, "ecs_thing.html.markdown"))
+    generator = gm.ModuleGenerator(str(tmp_path / "modules"), str(tmp_path / "examples"))
+    assert generator.generate_module(data, force=True)
+
+    golden = os.path.join(TESTDATA_DIR, "golden")
+    for tree in ("modules", "examples"):
+        assert tree_bytes(tmp_path / tree) == tree_bytes(os.path.join(golden, tree)), tree
+
+
+class CountingParser(gm.DocumentParser):
+    """记录实际解析次数"""
+
+    def __init__(self, cache=None):
+        super().__init__(cache)
+        self.parsed = 0
+
+    def _parse_content(self, content):
+        self.parsed += 1
+        return super()._parse_content(content)
+
+
+def test_parse_cache_hits_and_invalidation(tmp_path, monkeypatch):
+    doc = tmp_path / "ecs_thing.html.markdown"
+    shutil.copy(os.path.join(DOCS_DIR, "ecs_thing.html.markdown"), doc)
+    cache = gm.ParseCache(str(tmp_path / "cache"))
+    parser = CountingParser(cache)
+
+    expected = gm.DocumentParser().parse_resource_doc(str(doc))
+    assert parser.parse_resource_doc(str(doc)) == expected
+    assert parser.parse_resource_doc(str(doc)) == expected
+    assert parser.parsed == 1
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+    # 解析器版本变化后不再使用旧结果
+    monkeypatch.setattr(gm, "PARSER_VERSION", gm.PARSER_VERSION + 1)
+    assert parser.parse_resource_doc(str(doc)) == expected
+    assert parser.parsed == 2
+
+    # 文档内容变化
+    doc.write_text(doc.read_text(encoding="utf-8").replace("Provides a thing.", "Provides a widget."),
+                   encoding="utf-8")
+    assert parser.parse_resource_doc(str(doc))['resource_info']['description'] == "Provides a widget."
+    assert parser.parsed == 3
+
+    # 损坏的条目视为未命中
+    for name in os.listdir(tmp_path / "cache"):
+        (tmp_path / "cache" / name).write_text("{", encoding="utf-8")
+    assert parser.parse_resource_doc(str(doc))['resource_info']['description'] == "Provides a widget."
+    assert parser.parsed == 4
+    assert len(os.listdir(tmp_path / "cache")) == 3
+
+
+def test_parse_cache_eviction(tmp_path):
+    cache = gm.ParseCache(str(tmp_path), max_bytes=0)
+    data = {"resource_info": {"resource_name": "x" * 100}}
+    for mtime, key in enumerate(("old", "used", "new"), start=1):
+        cache.put(key, data)
+        os.utime(tmp_path / f"{key}.json", (mtime, mtime))
+    size = os.path.getsize(tmp_path / "old.json")
+
+    # 命中会刷新修改时间，最久未使用的条目先被淘汰
+    assert cache.get("used") == data
+    cache.max_bytes = 2 * size
+    assert cache.evict() == 1
+    assert sorted(os.listdir(tmp_path)) == ["new.json", "used.json"]
+    cache.max_bytes = size
+    assert cache.evict() == 1
+    assert os.listdir(tmp_path) == ["used.json"]
+    assert cache.evict() == 0
+
+    read_only = gm.ParseCache(str(tmp_path), max_bytes=0, read_only=True)
+    read_only.put("other", data)
+    assert read_only.evict() == 0
+    assert os.listdir(tmp_path) == ["used.json"]
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# 本地 git 变更文件查询 (git_changes) 的测试
+
+import os
+import subprocess
+
+import pytest
+
+import git_changes
+
+
+def git(cwd, *args):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                   cwd=cwd, check=True, capture_output=True)
+
+
+def write_file(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """提交了四个模块的仓库，其中两个模块目录名带空格或非 ASCII 字符（不用 -z 时 git 会转义）"""
+    git(tmp_path, "init", "-q")
+    modules = ("modules/adb/adb_account", "modules/ecs/ecs_disk", "modules/vpc/my vpc", "modules/vpc/专有网络")
+    for module in modules:
+        write_file(os.path.join(tmp_path, module, "main.tf"), 'variable "name" {}\n')
+    write_file(os.path.join(tmp_path, ".gitignore"), "*.log\n")
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def test_changed_files(repo):
+    assert git_changes.changed_files("HEAD", cwd=repo) == []
+
+    write_file(os.path.join(repo, "modules/adb/adb_account/main.tf"), 'variable "zone" {}\n')
+    write_file(os.path.join(repo, "modules/adb/adb_account/outputs.tf"), 'output "id" {}\n')
+    write_file(os.path.join(repo, "modules/adb/adb_account/debug.log"), "ignored\n")
+    git(repo, "rm", "-q", "-r", "modules/ecs/ecs_disk")
+    write_file(os.path.join(repo, "modules/vpc/my vpc/main.tf"), 'variable "cidr" {}\n')
+    write_file(os.path.join(repo, "modules/vpc/专有网络/new file.tf"), 'output "id" {}\n')
+
+    assert git_changes.changed_files("HEAD", cwd=repo) == [
+        os.path.normpath("modules/adb/adb_account/main.tf"),
+        os.path.normpath("modules/adb/adb_account/outputs.tf"),
+        os.path.normpath("modules/ecs/ecs_disk/main.tf"),
+        os.path.normpath("modules/vpc/my vpc/main.tf"),
+        os.path.normpath("modules/vpc/专有网络/new file.tf")
+    ]
+    # 路径相对 cwd
+    assert git_changes.changed_files("HEAD", cwd=repo / "modules" / "vpc") == [
+        os.path.normpath("my vpc/main.tf"), os.path.normpath("专有网络/new file.tf")]
+
+
+def test_changed_files_includes_committed_changes(repo):
+    git(repo, "tag", "base")
+    write_file(os.path.join(repo, "modules/vpc/my vpc/versions.tf"), "terraform {}\n")
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", "add versions")
+    assert git_changes.changed_files("base", cwd=repo) == [os.path.normpath("modules/vpc/my vpc/versions.tf")]
+    assert git_changes.changed_files("HEAD", cwd=repo) == []
+
+
+def test_changed_files_invalid_ref(repo, tmp_path_factory):
+    with pytest.raises(git_changes.GitChangesError, match="无效的 git 引用 no-such-ref"):
+        git_changes.changed_files("no-such-ref", cwd=repo)
+    with pytest.raises(git_changes.GitChangesError):
+        git_changes.changed_files("HEAD", cwd=tmp_path_factory.mktemp("not_a_repo"))
+
+
+def test_owning_directory():
+    modules = {os.path.normpath(path) for path in ("modules/adb/adb_account", "modules/vpc/my vpc", "modules/vpc")}
+    assert git_changes.owning_directory("modules/adb/adb_account/main.tf", modules) == \
+        os.path.normpath("modules/adb/adb_account")
+    # 取最深的目录
+    assert git_changes.owning_directory("modules/vpc/my vpc/sub/main.tf", modules) == \
+        os.path.normpath("modules/vpc/my vpc")
+    assert git_changes.owning_directory("modules/vpc/README.md", modules) == "modules/vpc"
+    # 已删除模块的文件仍能找到所属目录，目录本身不需要存在
+    assert git_changes.owning_directory("modules/ecs/ecs_disk/main.tf", modules) is None
+    assert git_changes.owning_directory("modules/ecs/ecs_disk/main.tf", {"modules/ecs/ecs_disk"}) == \
+        "modules/ecs/ecs_disk"
+    assert git_changes.owning_directory("README.md", modules) is None
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# 主目录 README 生成脚本 (generate-main-readme.py) 的测试
+
+import importlib.util
+import json
+import os
+import re
+import shutil
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_script(file_name, module_name):
+    """按路径加载文件名带连字符的脚本"""
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(ROOT_DIR, file_name))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+main_readme = load_script("generate-main-readme.py", "generate_main_readme")
+
+
+def write_module(modules_dir, name, variables=1):
+    """创建一个有 variables 个变量、一个输出和一个资源的模块"""
+    module_path = os.path.join(modules_dir, name)
+    os.makedirs(module_path, exist_ok=True)
+    with open(os.path.join(module_path, "main.tf"), "w", encoding="utf-8") as f:
+        for index in range(variables):
+            f.write(f'variable "var_{index}" {{}}\n')
+        f.write('output "id" {\n  value = "x"\n}\n')
+        f.write('resource "alibabacloudstack_vpc" "this" {}\n')
+
+
+def run_main_readme(cwd, *args):
+    command = [sys.executable, os.path.join(ROOT_DIR, "generate-main-readme.py"),
+               "--modules-dir", "modules", "--no-cache", *args]
+    result = subprocess.run(command, cwd=cwd, capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout + result.stderr
+    return result.stdout
+
+
+def read_text(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def write_text(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+@pytest.fixture
+def readme(tmp_path):
+    """三个模块的项目和完整生成的双语 README"""
+    for name in ("adb/adb_account", "adb/adb_cluster", "ecs/ecs_disk"):
+        write_module(tmp_path / "modules", name)
+    run_main_readme(tmp_path, "--lang", "both", "--output", "README.md")
+    return tmp_path
+
+
+def assert_matches_full_render(tmp_path, *args):
+    """增量修补后的 README 与完整生成的结果一致"""
+    run_main_readme(tmp_path, "--lang", "both", "--output", "FULL.md", *args)
+    assert read_text(tmp_path / "README.md") == read_text(tmp_path / "FULL.md")
+
+
+def test_incremental_add_update_remove(readme):
+    write_module(readme / "modules", "adb/adb_backup")
+    output = run_main_readme(readme, "--lang", "both", "--incremental")
+    assert "更新 0 行, 新增 2 行, 删除 0 行" in output
+    assert_matches_full_render(readme)
+
+    write_module(readme / "modules", "ecs/ecs_disk", variables=3)
+    output = run_main_readme(readme, "--lang", "both", "--incremental")
+    assert "更新 2 行, 新增 0 行, 删除 0 行" in output
+    assert_matches_full_render(readme)
+
+    os.remove(readme / "modules" / "adb" / "adb_cluster" / "main.tf")
+    output = run_main_readme(readme, "--lang", "both", "--incremental")
+    assert "更新 0 行, 新增 0 行, 删除 2 行" in output
+    assert_matches_full_render(readme)
+
+    before = read_text(readme / "README.md")
+    output = run_main_readme(readme, "--lang", "both", "--incremental")
+    assert "模块表格没有变化" in output
+    assert read_text(readme / "README.md") == before
+
+
+def test_incremental_rebuilds_out_of_order_and_duplicate_rows(readme):
+    """手工编辑过的 README：行顺序被打乱、某一行重复"""
+    lines = read_text(readme / "README.md").split("\n")
+    rows = [index for index, line in enumerate(lines) if line.startswith("| [adb/")]
+    # 英文表格中两行互换，中文表格中第一行重复
+    lines[rows[0]], lines[rows[1]] = lines[rows[1]], lines[rows[0]]
+    lines.insert(rows[2], lines[rows[2]])
+    write_text(readme / "README.md", "\n".join(lines))
+
+    output = run_main_readme(readme, "--lang", "both", "--incremental")
+    assert "删除 1 行" in output
+    assert_matches_full_render(readme)
+
+
+def test_incremental_removing_every_module_falls_back_to_full_render(readme):
+    """所有模块都被删除时不修补出只有表头的表格，交给完整生成"""
+    before = read_text(readme / "README.md")
+    generator = main_readme.MainReadmeGenerator(modules_dir="modules", output_file=str(readme / "README.md"),
+                                                use_cache=False, incremental=True)
+    assert generator.patch_readme([], "both") is None
+    assert read_text(readme / "README.md") == before
+
+    for name in ("adb/adb_account", "adb/adb_cluster", "ecs/ecs_disk"):
+        os.remove(readme / "modules" / name / "main.tf")
+    result = subprocess.run([sys.executable, os.path.join(ROOT_DIR, "generate-main-readme.py"),
+                             "--modules-dir", "modules", "--no-cache", "--lang", "both", "--incremental"],
+                            cwd=readme, capture_output=True, text=True)
+    assert "未找到任何可用模块" in result.stdout
+    assert read_text(readme / "README.md") == before
+
+
+def test_machine_catalog_from_fixture_module(tmp_path):
+    shutil.copytree(os.path.join(ROOT_DIR, "testdata", "sample_module"), tmp_path / "modules" / "adb" / "adb_account")
+    write_module(tmp_path / "modules", "ecs/ecs_disk", variables=3)
+    run_main_readme(tmp_path, "--catalog-output", "catalog")
+
+    with open(tmp_path / "catalog" / main_readme.CATALOG_JSON_FILE, encoding="utf-8") as f:
+        catalog = json.load(f)
+    assert catalog["version"] == main_readme.CATALOG_VERSION
+    counts = {module["name"]: (len(module["inputs"]), len(module["outputs"]), len(module["resources"]))
+              for module in catalog["modules"]}
+    # testdata/sample_module 的数量与 sample_module.terraform-docs.json 一致
+    assert counts == {"adb/adb_account": (6, 2, 2), "ecs/ecs_disk": (3, 1, 1)}
+
+    connection = sqlite3.connect(tmp_path / "catalog" / main_readme.CATALOG_SQLITE_FILE)
+    try:
+        assert connection.execute("PRAGMA user_version").fetchone()[0] == main_readme.CATALOG_VERSION
+
+        def count(table):
+            return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+        assert (count("modules"), count("inputs"), count("outputs"), count("resources")) == (2, 9, 3, 3)
+        assert connection.execute(
+            "SELECT inputs_count, outputs_count, resources_count FROM modules WHERE name = ?",
+            ("adb/adb_account",)).fetchone() == (6, 2, 2)
+        required = connection.execute(
+            "SELECT i.name FROM inputs i JOIN modules m ON m.id = i.module_id "
+            "WHERE m.name = 'adb/adb_account' AND i.required = 1 ORDER BY i.name").fetchall()
+        with open(os.path.join(ROOT_DIR, "testdata", "sample_module.terraform-docs.json"), encoding="utf-8") as f:
+            expected = json.load(f)
+        assert [row[0] for row in required] == sorted(item["name"] for item in expected["inputs"] if item["required"])
+    finally:
+        connection.close()
+
+
+def test_sharded_layout_writes_one_page_per_service(readme):
+    run_main_readme(readme, "--lang", "en", "--layout", "sharded")
+    catalog_dir = readme / "docs" / "catalog"
+    assert sorted(os.listdir(catalog_dir)) == ["adb.md", "ecs.md"]
+
+    def links(path):
+        """页面中的链接，解析为相对 readme 的路径"""
+        targets = re.findall(r"\]\(([^)]+)\)", read_text(path))
+        return [os.path.relpath(os.path.normpath(os.path.join(os.path.dirname(path), target)), readme)
+                for target in targets]
+
+    adb = read_text(catalog_dir / "adb.md")
+    assert adb.startswith(main_readme.CATALOG_PAGE_MARKER + "\n")
+    assert links(catalog_dir / "adb.md") == [os.path.join("modules", "adb", "adb_account"),
+                                             os.path.join("modules", "adb", "adb_cluster")]
+    assert links(catalog_dir / "ecs.md") == [os.path.join("modules", "ecs", "ecs_disk")]
+
+    # 汇总 README 链接到每个服务页
+    assert links(readme / "README.md") == [os.path.join("docs", "catalog", "adb.md"),
+                                           os.path.join("docs", "catalog", "ecs.md")]
+    assert re.findall(r"\| \[(\w+)\]\([^)]+\) \| (\d+) \|", read_text(readme / "README.md")) == [
+        ("adb", "2"), ("ecs", "1")]
+
+    # 服务消失时删除生成的页面，手写的页面保留；未变化的页面不重写
+    write_text(catalog_dir / "notes.md", "# notes\n")
+    os.utime(catalog_dir / "adb.md", ns=(1, 1))
+    os.remove(readme / "modules" / "ecs" / "ecs_disk" / "main.tf")
+    output = run_main_readme(readme, "--lang", "en", "--layout", "sharded")
+    assert "更新 0 页，未变化 1 页，删除 1 页" in output
+    assert sorted(os.listdir(catalog_dir)) == ["adb.md", "notes.md"]
+    assert os.stat(catalog_dir / "adb.md").st_mtime_ns == 1
+    assert links(readme / "README.md") == [os.path.join("docs", "catalog", "adb.md")]
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# native 引擎（load_simple_yaml / NativeDocsRenderer）的测试
+
+import importlib.util
+import os
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+TESTDATA_DIR = os.path.join(ROOT_DIR, "testdata")
+SAMPLE_MODULE = os.path.join(TESTDATA_DIR, "sample_module")
+
+# generate-docs.py 的文件名带连字符，不能直接 import
+_spec = importlib.util.spec_from_file_location("generate_docs", os.path.join(ROOT_DIR, "generate-docs.py"))
+generate_docs = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(generate_docs)
+
+
+def read_text(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("config, golden", [
+    ("english-docs.yml", "sample_module.README.md"),
+    ("chinese-docs.yml", "sample_module.README.zh-CN.md")
+])
+def test_render_sample_module_matches_golden(config, golden):
+    renderer = generate_docs.NativeDocsRenderer(os.path.join(ROOT_DIR, "config", config))
+    rendered = renderer.render_output(renderer.render_content(SAMPLE_MODULE))
+    assert rendered == read_text(os.path.join(TESTDATA_DIR, golden))
+
+
+def test_load_simple_yaml_reads_configs():
+    config = generate_docs.load_simple_yaml(read_text(os.path.join(ROOT_DIR, "config", "english-docs.yml")))
+    assert config["formatter"] == "markdown table"
+    assert config["header-from"] == "main.tf"
+    assert config["footer-from"] == ""
+    assert config["sections"] == {"hide": [], "show": []}
+    assert config["sort"] == {"enabled": True, "by": "name"}
+    assert config["settings"]["indent"] == 2
+    assert config["settings"]["lockfile"] is True
+    assert config["output"]["template"] == "<!-- BEGIN_TF_DOCS -->\n{{ .Content }}\n<!-- END_TF_DOCS -->"
+    assert config["content"].startswith("{{ .Header }}\n\n## 📋 Module Overview\n")
+    assert not config["content"].endswith("\n")
+
+
+def test_load_simple_yaml_block_scalars_and_inline_lists():
+    config = generate_docs.load_simple_yaml('''
+# comment
+keep: |+
+  line
+
+strip: |-
+  line
+items: [a, "b c"]
+nested:
+  - one
+  - two
+quoted: 'x: y'
+''')
+    assert config["keep"] == "line\n\n"
+    assert config["strip"] == "line"
+    assert config["items"] == ["a", "b c"]
+    assert config["nested"] == ["one", "two"]
+    assert config["quoted"] == "x: y"
+
+
+def test_providers_show_lock_version_or_na():
+    renderer = generate_docs.NativeDocsRenderer(os.path.join(ROOT_DIR, "config", "english-docs.yml"))
+    data = renderer.scan_module(SAMPLE_MODULE)
+
+    locked = renderer.render_providers(data, {"alibabacloudstack": "3.18.3"})
+    assert locked.endswith("| 3.18.3 |")
+
+    # 没有锁文件时与 terraform-docs 一样显示 n/a，而不是 required_providers 中的版本约束
+    unlocked = renderer.render_providers(data, {})
+    assert unlocked.endswith("| n/a |")
+    assert ">= 1.0.0" not in unlocked
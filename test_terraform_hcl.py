@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# 内置 HCL 扫描器 (terraform_hcl) 的测试
+
+import json
+import os
+
+import terraform_hcl
+
+TESTDATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "testdata")
+SAMPLE_MODULE = os.path.join(TESTDATA_DIR, "sample_module")
+
+
+def scan(text, **kwargs):
+    """扫描单个 main.tf 内容"""
+    return terraform_hcl.scan_module("unused", sources={"main.tf": text}, **kwargs)
+
+
+def names(items):
+    return [item["name"] for item in items]
+
+
+def test_heredoc_default_and_following_blocks():
+    data = scan('''
+variable "policy" {
+  description = "Policy document."
+  default     = <<-EOT
+    {
+      "Statement": [{ "Effect": "Allow" }]  # not a comment
+    }
+    EOT
+}
+
+variable "after" {
+  default = <<EOF
+}
+EOF
+}
+
+output "id" {
+  value = "x"
+}
+''')
+    assert names(data["inputs"]) == ["policy", "after"]
+    assert data["inputs"][0]["default"] == '{\n  "Statement": [{ "Effect": "Allow" }]  # not a comment\n}\n'
+    assert data["inputs"][1]["default"] == "}\n"
+    assert names(data["outputs"]) == ["id"]
+
+
+def test_nested_blocks():
+    root = terraform_hcl.HclParser('''
+resource "alibabacloudstack_instance" "this" {
+  name = "web"
+
+  dynamic "disk" {
+    for_each = var.disks
+    content {
+      size = disk.value.size
+      tags = { role = "data" }
+    }
+  }
+
+  lifecycle { ignore_changes = [tags] }
+}
+''').parse()
+    resource = root.blocks[0]
+    assert (resource.type, resource.labels) == ("resource", ["alibabacloudstack_instance", "this"])
+    assert resource.literal("name") == "web"
+    assert [block.type for block in resource.blocks] == ["dynamic", "lifecycle"]
+    dynamic = resource.blocks[0]
+    assert dynamic.labels == ["disk"]
+    assert dynamic.attributes["for_each"] == "var.disks"
+    content = dynamic.get_blocks("content")[0]
+    assert content.attributes["size"] == "disk.value.size"
+    assert content.literal("tags") == {"role": "data"}
+    assert resource.blocks[1].attributes["ignore_changes"] == "[tags]"
+
+
+def test_comments_are_skipped_and_used_as_descriptions():
+    data = scan('''
+# variable "hash_commented" {}
+// variable "slash_commented" {}
+/*
+variable "block_commented" {}
+*/
+
+# Hash comment description.
+variable "a" {}
+
+// Slash comment description.
+variable "b" {}
+
+/**
+ * Block comment description.
+ */
+variable "c" {}
+
+# Separated by a blank line.
+
+variable "d" {}
+
+variable "e" {
+  description = "Explicit." # trailing comment
+  default     = "x" // trailing comment
+}
+''', header_from="")
+    assert names(data["inputs"]) == ["a", "b", "c", "d", "e"]
+    descriptions = {item["name"]: item["description"] for item in data["inputs"]}
+    assert descriptions == {
+        "a": "Hash comment description.",
+        "b": "Slash comment description.",
+        "c": "Block comment description.",
+        "d": "",
+        "e": "Explicit."
+    }
+    assert data["inputs"][4]["default"] == "x"
+
+    without_comments = scan('# Hash comment description.\nvariable "a" {}\n', read_comments=False)
+    assert without_comments["inputs"][0]["description"] == ""
+
+
+def test_strings_containing_braces():
+    data = scan('''
+variable "pattern" {
+  description = "Matches } and { and \\"quoted }\\" text."
+  default     = "${var.prefix}-{suffix}"
+}
+
+locals {
+  name = "${format("%s}", "{")}"
+}
+
+variable "escaped" {
+  default = "$${not_interpolated} }"
+}
+
+output "brace" {
+  value = "}"
+}
+''')
+    assert names(data["inputs"]) == ["pattern", "escaped"]
+    assert data["inputs"][0]["description"] == 'Matches } and { and "quoted }" text.'
+    # 带插值的字符串不是字面量，保留原始表达式
+    assert data["inputs"][0]["default"] == '"${var.prefix}-{suffix}"'
+    assert data["inputs"][1]["default"] == "${not_interpolated} }"
+    assert names(data["outputs"]) == ["brace"]
+
+
+def test_required_providers_and_required_version():
+    data = terraform_hcl.scan_module("unused", sources={
+        "main.tf": '''
+resource "alibabacloudstack_vpc" "this" {}
+
+resource "random_id" "suffix" {
+  provider = random.alt
+}
+''',
+        "versions.tf": '''
+terraform {
+  required_version = ">= 0.13"
+
+  required_providers {
+    alibabacloudstack = {
+      source  = "aliyun/alibabacloudstack"
+      version = ">= 1.0.0"
+    }
+    random = {
+      source                = "hashicorp/random"
+      version               = "~> 3.0"
+      configuration_aliases = [random.alt]
+    }
+    null = "~> 2.1"
+  }
+}
+''',
+        "z_versions.tf": '''
+terraform {
+  required_version = "< 2.0"
+}
+'''
+    })
+    assert data["requirements"] == [
+        {"name": "terraform", "version": ">= 0.13, < 2.0"},
+        {"name": "alibabacloudstack", "version": ">= 1.0.0"},
+        {"name": "random", "version": "~> 3.0"},
+        {"name": "null", "version": "~> 2.1"}
+    ]
+    resources = {resource["name"]: resource for resource in data["resources"]}
+    assert resources["this"]["source"] == "aliyun/alibabacloudstack"
+    assert resources["suffix"]["source"] == "hashicorp/random"
+    assert [(provider["name"], provider["alias"]) for provider in data["providers"]] == [
+        ("alibabacloudstack", None), ("random", "alt")]
+
+
+def test_scan_matches_terraform_docs_json():
+    """与 `terraform-docs json testdata/sample_module` 的输出比较（按名称对齐，只比较 terraform-docs 输出的字段）"""
+    with open(os.path.join(TESTDATA_DIR, "sample_module.terraform-docs.json"), encoding="utf-8") as f:
+        expected = json.load(f)
+
+    data = terraform_hcl.scan_module(SAMPLE_MODULE)
+    # terraform-docs 默认读取 .terraform.lock.hcl 中的 provider 版本
+    lock = terraform_hcl.read_lock_file(SAMPLE_MODULE)
+    assert lock == {"alibabacloudstack": "3.18.3"}
+    for provider in data["providers"]:
+        provider["version"] = lock.get(provider["name"])
+    for resource in data["resources"]:
+        resource["version"] = lock.get(resource["provider"]) or resource["version"]
+
+    assert data["header"] == expected["header"]
+    assert data["footer"] == expected["footer"]
+    assert data["requirements"] == expected["requirements"]
+
+    keys = {
+        "inputs": lambda item: item["name"],
+        "outputs": lambda item: item["name"],
+        "modules": lambda item: item["name"],
+        "providers": lambda item: (item["name"], item["alias"]),
+        "resources": lambda item: (item["mode"], item["type"], item["name"])
+    }
+    for section, key in keys.items():
+        actual = {key(item): item for item in data[section]}
+        assert sorted(actual) == sorted(key(item) for item in expected[section]), section
+        for item in expected[section]:
+            assert {field: actual[key(item)][field] for field in item} == item, section
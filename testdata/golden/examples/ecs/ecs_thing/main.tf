@@ -0,0 +1,13 @@
+# Example usage of ecs_thing module
+
+module "ecs_thing" {
+  source = "../../../modules/alibabacloudstack/ecs/ecs_thing"
+  
+  name = var.name
+  count = var.count
+  enabled = var.enabled
+  block = var.block
+  nested = var.nested
+  inner = var.inner
+  tags = var.tags
+}
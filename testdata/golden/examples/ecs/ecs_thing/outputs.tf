@@ -0,0 +1,12 @@
+# Outputs from the ecs_thing module
+
+output "id" {
+  description = "The ID of the ecs_thing"
+  value       = module.ecs_thing.id
+}
+
+output "status" {
+  description = "The status   of the thing.    Continued after blank."
+  value       = module.ecs_thing.status
+}
+
@@ -0,0 +1,10 @@
+provider "alibabacloudstack" {
+  access_key = var.access_key
+  secret_key = var.secret_key
+  region =  "cn-hk-env00-d01"
+  proxy = "http://100.1.1.1:5001"
+  insecure = true
+  resource_group_set_name= var.resource_group_name
+  domain = "server.asapi.cn-xxxxx-envXX-d01.intra.envXX.shuguang.com/asapi/v3"
+  protocol = "HTTP"
+}
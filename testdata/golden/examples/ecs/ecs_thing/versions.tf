@@ -0,0 +1,10 @@
+terraform {
+  required_version = ">= 0.13"
+  
+  required_providers {
+    alibabacloudstack = {
+      source  = "aliyun/alibabacloudstack"
+      version = ">= 3.16.0"
+    }
+  }
+}
@@ -0,0 +1,33 @@
+resource "alibabacloudstack_ecs_thing" "ecs_thing" {
+  # The name. It must be 2 to 128 characters   in length and spanning lines.
+  name = var.name
+
+  # The number of things. Default is `3`.
+  count = var.count
+
+  # Whether to enable. Default to false.
+  enabled = var.enabled
+
+  # A block. See [`block`](#block) below.
+  dynamic "block" {
+    for_each = var.block
+    content {
+      # 根据实际需要配置嵌套属性
+    }
+  }
+
+  # nested bullet. Default: "abc".  ### Block block  The block supports the following:
+  dynamic "nested" {
+    for_each = var.nested
+    content {
+      # 根据实际需要配置嵌套属性
+    }
+  }
+
+  # Inner value list of strings.
+  inner = var.inner
+
+  # A mapping of tags.
+  tags = var.tags
+
+}
@@ -0,0 +1,12 @@
+# Outputs for the module
+
+output "id" {
+  description = "The ID of the ecs_thing"
+  value       = alibabacloudstack_ecs_thing.ecs_thing.id
+}
+
+output "status" {
+  description = "The status   of the thing.    Continued after blank."
+  value       = alibabacloudstack_ecs_thing.ecs_thing.status
+}
+
@@ -0,0 +1,42 @@
+# Variables for the module
+
+variable "name" {
+  type        = string
+  description = "The name. It must be 2 to 128 characters   in length and spanning lines."
+}
+
+variable "count" {
+  type        = number
+  description = "The number of things. Default is `3`."
+  default     = 3
+}
+
+variable "enabled" {
+  type        = bool
+  description = "Whether to enable. Default to false."
+  default     = null
+}
+
+variable "block" {
+  type        = any
+  description = "A block. See [`block`](#block) below."
+  default     = null
+}
+
+variable "nested" {
+  type        = any
+  description = "nested bullet. Default: "abc".  ### Block block  The block supports the following:"
+  default     = null
+}
+
+variable "inner" {
+  type        = list(string)
+  description = "Inner value list of strings."
+}
+
+variable "tags" {
+  type        = map(string)
+  description = "A mapping of tags."
+  default     = null
+}
+
@@ -0,0 +1,10 @@
+# This file is maintained automatically by "terraform init".
+# Manual edits may be lost in future updates.
+
+provider "registry.terraform.io/aliyun/alibabacloudstack" {
+  version     = "3.18.3"
+  constraints = ">= 1.0.0"
+  hashes = [
+    "h1:0000000000000000000000000000000000000000000=",
+  ]
+}
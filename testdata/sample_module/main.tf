@@ -0,0 +1,16 @@
+/**
+ * # ADB Account
+ *
+ * Creates an account on an existing ADB cluster.
+ */
+
+resource "alibabacloudstack_adb_account" "this" {
+  db_cluster_id       = var.db_cluster_id
+  account_name        = var.account_name
+  account_password    = var.account_password
+  account_description = var.account_description
+}
+
+data "alibabacloudstack_adb_clusters" "current" {
+  ids = [var.db_cluster_id]
+}
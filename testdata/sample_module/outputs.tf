@@ -0,0 +1,9 @@
+output "account_id" {
+  description = "The ID of the account."
+  value       = alibabacloudstack_adb_account.this.id
+}
+
+output "account_name" {
+  description = "The name of the account."
+  value       = alibabacloudstack_adb_account.this.account_name
+}
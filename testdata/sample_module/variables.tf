@@ -0,0 +1,34 @@
+variable "db_cluster_id" {
+  type        = string
+  description = "The ID of the ADB cluster."
+}
+
+variable "account_name" {
+  type        = string
+  description = "The name of the account."
+  default     = "admin"
+}
+
+variable "account_password" {
+  type        = string
+  description = "The password of the account."
+  sensitive   = true
+}
+
+variable "account_description" {
+  type        = string
+  description = "The description of the account."
+  default     = ""
+}
+
+variable "tags" {
+  type        = map(string)
+  description = "A mapping of tags to assign to the account."
+  default     = {}
+}
+
+variable "create_timeout" {
+  type        = number
+  description = "Timeout in minutes for creating the account."
+  default     = 10
+}